@@ -1,27 +1,60 @@
 import base64
 import hashlib
+import json
 import logging
 import os
-from typing import Tuple, Optional
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse, parse_qs
 
 import requests
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="tasks.log",
-    filemode="a",
-    encoding="utf-8",
+
+from cookies import read_chrome_cookies
+from navigation import get_navigation_watcher
+from routememo import (
+    ROUTE_KAKAO_LOGIN,
+    ROUTE_PASS,
+    ROUTE_SECURITY_CENTER,
+    clear_route_memo,
+    get_cookie_expiry,
+    get_valid_route,
+    load_route_memo,
+    save_route_result,
+)
+from timing import span
+from tokenapi import (
+    TOKEN_API_BASE,
+    get_token_session,
+    post_json,
+    prewarm_token_api,
 )
+
+if TYPE_CHECKING:
+    # 브라우저 없는 인증 경로에서는 selenium을 로드하지 않음
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
 logger = logging.getLogger(__name__)
 
 GAME_START_URL = "https://pubsvc.game.daum.net/gamestart/poe2.html"
 SECURITY_URL = "https://security-center.game.daum.net/auth"
-TOKEN_URL = "https://poe2-gamestart-web-api.game.daum.net/token/poe2"
+TOKEN_URL = f"{TOKEN_API_BASE}/token/poe2"
+# selenium-wire 캡처 범위 (token API 요청만 저장)
+TOKEN_URL_SCOPE = r".*poe2-gamestart-web-api\.game\.daum\.net/token/poe2.*"
+HOME_URL = "https://poe2.game.daum.net/kr/home"
+# 로그인이 만료되어 사용자 입력이 필요한 페이지
+KAKAO_LOGIN_URL = "https://accounts.kakao.com/login"
 AUTH_URL_TEMPLATE = (
     "https://poe.game.daum.net/oauth/authorize"
     "?client_id=internal"
@@ -31,8 +64,27 @@ AUTH_URL_TEMPLATE = (
     "&state=random_state_string"
     "&code_challenge_method=S256&code_challenge={code_challenge}"
 )
+TOKEN_API_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "user-agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/128.0.0.0 Whale/3.28.266.14 Safari/537.36"
+    ),
+    "referer": "https://pubsvc.game.daum.net/",
+    "origin": "https://pubsvc.game.daum.net",
+}
 MAX_WAIT_TIME = 30
+# 인증 전체에 주어지는 시간(초)과 상태 전이 횟수 제한
+AUTH_DEADLINE = int(os.environ.get("POE2DECK_AUTH_DEADLINE", 180))
+AUTH_MAX_TRANSITIONS = 8
+# 경로 메모로 authorize 단계를 생략했을 때 gamestart 페이지 도착을 기다리는 시간
+ROUTE_CHECK_TIMEOUT = 15
 POLL_FREQUENCY = 0.5
+INTERCEPT_POLL_INTERVAL = 0.1
+# 가로채기 모드에서 NEED_SECURITYCENTER_AUTH 응답을 허용하는 횟수
+INTERCEPT_MAX_SECURITY_AUTHS = 3
+# POE2DECK_NAVIGATION: cdp(DevTools 이벤트, 기본값) 또는 poll(URL 폴링)
+NAVIGATION_MODE = os.environ.get("POE2DECK_NAVIGATION", "cdp")
 
 
 def generate_code_verifier() -> str:
@@ -69,173 +121,626 @@ def set_cookies(session: requests.Session, cookies) -> None:
         session.cookies.set(cookie["name"], cookie["value"])
 
 
-def create_session(driver: WebDriver) -> requests.Session:
+def create_session(driver: "WebDriver") -> requests.Session:
     """
-    세션 생성 및 쿠키 설정
+    세션 생성 및 쿠키 설정 (token API 연결 풀 공유)
     """
-    session = requests.Session()
+    session = get_token_session()
+    session.cookies.clear()
     selenium_cookies = driver.get_cookies()
     set_cookies(session, selenium_cookies)
     return session
 
 
-def get_access_token_and_user_id_from_api(
-    driver: WebDriver, session: requests.Session, txid: Optional[str] = None
-) -> Tuple[Optional[str], Optional[int]]:
+def create_session_from_profile(
+    profile_base: str,
+) -> Optional[requests.Session]:
     """
-    API를 통해 access_token, user_id 파싱
+    브라우저 없이 Chrome 프로필의 daum.net 쿠키로 세션 생성
     """
-    try:
-        url = f"{TOKEN_URL}?actionType=user"
-        headers = {
-            "accept": "application/json, text/plain, */*",
-            "user-agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/128.0.0.0 Whale/3.28.266.14 Safari/537.36"
-            ),
-            "referer": "https://pubsvc.game.daum.net/",
-            "origin": "https://pubsvc.game.daum.net",
-        }
-
-        body = {
-            "txId": txid,
-            "code": None,
-            "webdriver": bool(txid),
-        }
-
-        (f"Request body: {body}")
-        (f"Session cookies: {session.cookies.get_dict()}")
-
-        response = session.post(url, headers=headers, json=body)
+    cookies = read_chrome_cookies(profile_base)
+    if not cookies:
+        return None
+
+    session = get_token_session()
+    session.cookies.clear()
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie["domain"],
+            path=cookie["path"],
+        )
+    return session
+
+
+def request_token(
+    session: requests.Session,
+    txid: Optional[str] = None,
+    deadline: Optional[float] = None,
+) -> dict:
+    """
+    token API 호출 후 응답 JSON 반환
+    deadline: time.monotonic() 기준 제한 시각 (재시도를 포함한 전체 요청에 적용)
+    """
+    url = f"{TOKEN_URL}?actionType=user"
+    body = {
+        "txId": txid,
+        "code": None,
+        "webdriver": bool(txid),
+    }
+
+    (f"Request body: {body}")
+    (f"Session cookies: {session.cookies.get_dict()}")
+
+    with span("auth.token_post", txid=bool(txid)) as timer:
+        response = post_json(
+            session,
+            url,
+            body,
+            headers=TOKEN_API_HEADERS,
+            deadline=deadline,
+        )
+        timer.set(status_code=response.status_code)
         response.raise_for_status()
         data = response.json()
-        (f"Response data: {data}")
+        timer.set(status=data.get("status"))
+    (f"Response data: {data}")
+    return data
+
 
+def get_access_token_browserless(
+    profile_base: str,
+    on_cookies_read: Optional[Callable[[], None]] = None,
+) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """
+    브라우저 없이 프로필 쿠키로 token, mid 요청
+    (보안 센터 인증이 필요하면 token, mid 대신 인증 URL 반환)
+    on_cookies_read: Cookies DB를 다 읽은 뒤 token 요청 전에 호출 (브라우저 예열 등)
+    """
+    try:
+        try:
+            session = create_session_from_profile(profile_base)
+        finally:
+            if on_cookies_read is not None:
+                on_cookies_read()
+        if session is None:
+            logger.info("프로필 쿠키가 없어 브라우저 인증이 필요합니다.")
+            return None, None, None
+
+        data = request_token(session)
         status = data.get("status")
-        if status == "NEED_SECURITYCENTER_AUTH":
-            url = data.get("url")
-            return process_user_security_auth(driver, session, url)
-        elif status == "PASS":
+        if status == "PASS":
             token = data.get("token")
             mid = data.get("mid")
-            logger.info(f"API를 통해 token 파싱: {token}")
-            logger.info(f"API를 통해 mid 파싱: {mid}")
-            return token, mid
+            logger.info(f"브라우저 없이 token 파싱: {token}")
+            logger.info(f"브라우저 없이 mid 파싱: {mid}")
+            return token, mid, None
+        elif status == "NEED_SECURITYCENTER_AUTH":
+            logger.info("보안 센터 인증 필요, 브라우저 인증으로 전환합니다.")
+            return None, None, data.get("url")
         else:
-            logger.error(f"예상치 못한 status: {status}")
-            return None, None
-    except requests.HTTPError as http_err:
-        logger.error(f"API 요청 실패: {http_err}")
+            logger.warning(f"브라우저 없는 인증 실패, status: {status}")
+    except requests.RequestException as e:
+        logger.warning(f"브라우저 없는 token 요청 실패: {e}")
     except Exception as e:
-        logger.error(f"access_token, user_id 파싱 실패: {e}")
-    return None, None
+        logger.error(f"브라우저 없는 인증 중 오류 발생: {e}")
+    return None, None, None
 
 
-def wait_for_url_change(
-    driver: WebDriver, target_url: str, timeout: int = MAX_WAIT_TIME
+def _poll_for_url_change(
+    driver: "WebDriver", target_urls: Tuple[str, ...], timeout: float
 ) -> bool:
     """
-    특정 URL로의 변경을 기다림
+    driver.current_url 폴링으로 URL 변경 대기
     """
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     try:
         WebDriverWait(driver, timeout, POLL_FREQUENCY).until(
-            EC.url_contains(target_url)
+            EC.any_of(*(EC.url_contains(url) for url in target_urls))
         )
         return True
     except:
         return False
 
 
-def process_user_security_auth(
-    driver: WebDriver, session: requests.Session, url: str
-) -> Tuple[Optional[str], Optional[int]]:
+def wait_for_url_change(
+    driver: "WebDriver",
+    target_url: Union[str, Tuple[str, ...]],
+    timeout: int = MAX_WAIT_TIME,
+) -> bool:
     """
-    사용자 보안 센터 인증 처리
+    특정 URL로의 변경을 기다림 (튜플이면 그중 하나로 바뀔 때까지)
     """
-    try:
-        driver.get(url)
-        ("유저 인증 진행 중...")
+    target_urls = (
+        (target_url,) if isinstance(target_url, str) else tuple(target_url)
+    )
+    target_url = target_urls[0]
+    start = time.monotonic()
+    watcher = get_navigation_watcher(driver)
+
+    with span("auth.wait_for_url_change", target=target_url) as timer:
+        if watcher is not None and NAVIGATION_MODE == "cdp":
+            mode = "cdp"
+            result = watcher.wait_for(target_urls, timeout)
+            if not result and not watcher.alive:
+                # DevTools 연결이 끊긴 경우 남은 시간 동안 폴링
+                mode = "cdp+poll"
+                remaining = max(0.0, timeout - (time.monotonic() - start))
+                result = _poll_for_url_change(driver, target_urls, remaining)
+        else:
+            mode = "poll"
+            result = _poll_for_url_change(driver, target_urls, timeout)
+        timer.set("ok" if result else "timeout", mode=mode)
+
+    detected_at = time.monotonic()
+    message = (
+        f"URL 대기 [{mode}] {target_url}: 결과={result}, "
+        f"대기 {(detected_at - start) * 1000:.0f}ms"
+    )
+    if result and len(target_urls) > 1:
+        target_url = next(
+            (url for url in target_urls if url in driver.current_url),
+            target_url,
+        )
+        message += f", 도착 {target_url}"
+    if result and watcher is not None:
+        requested, committed = watcher.get_event_times(target_url)
+        if committed is not None:
+            message += (
+                f", 감지 지연 {max(0.0, detected_at - committed) * 1000:.1f}ms"
+            )
+        if requested is not None:
+            message += (
+                f", 요청 후 {max(0.0, detected_at - requested) * 1000:.1f}ms"
+            )
+    logger.info(message)
+    return result
+
+
+# 인증 상태
+AUTH_AUTHORIZE = "AUTHORIZE"
+AUTH_GAME_START = "GAME_START"
+AUTH_SECURITY_CENTER = "SECURITY_CENTER"
+AUTH_TOKEN = "TOKEN"
+AUTH_DONE = "DONE"
+AUTH_FAILED = "FAILED"
+
+
+def navigate(driver: "WebDriver", flow: Dict[str, Any], url: str) -> None:
+    """
+    페이지 이동 후 flow["navigations"]에 횟수 기록
+    """
+    flow["navigations"] = flow.get("navigations", 0) + 1
+    driver.get(url)
+
+
+def show_browser_for_input(
+    driver: "WebDriver", flow: Dict[str, Any], url: Optional[str] = None
+) -> "WebDriver":
+    """
+    headless로 진행 중이면 사용자 입력을 위해 브라우저 창으로 전환
+    (전환된 드라이버는 flow["driver"]에 저장하여 이후 상태에서 사용)
+    """
+    from chrome import is_headless, show_browser
+
+    if not is_headless(driver):
+        return driver
+    driver = show_browser(driver, url)
+    flow["driver"] = driver
+    if url:
+        flow["navigations"] = flow.get("navigations", 0) + 1
+    return driver
 
-        if wait_for_url_change(driver, SECURITY_URL):
-            selenium_cookies = driver.get_cookies()
-            set_cookies(session, selenium_cookies)
 
-            if wait_for_url_change(driver, GAME_START_URL):
-                current_url = driver.current_url
-                (f"유저 인증 완료: {current_url}")
+def open_authorize_page(
+    driver: "WebDriver",
+    timeout: float = MAX_WAIT_TIME,
+    flow: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    OAuth authorize 페이지를 열고 홈으로 리다이렉트 될 때까지 대기
+    (카카오 로그인이 필요하면 브라우저 창을 띄우고 로그인 완료까지 대기)
+    """
+    flow = flow if flow is not None else {}
+    logger.info("code_verifier와 code_challenge 생성")
+    code_verifier = generate_code_verifier()
+    code_challenge = generate_code_challenge(code_verifier)
+
+    auth_url = AUTH_URL_TEMPLATE.format(code_challenge=code_challenge)
+    logger.info("Authorization Code 획득을 위한 페이지 로딩 중...")
+    deadline = time.monotonic() + timeout
+    navigate(driver, flow, auth_url)
+    if not wait_for_url_change(driver, (HOME_URL, KAKAO_LOGIN_URL), timeout):
+        return False
+    if HOME_URL in driver.current_url:
+        return True
 
-                parsed_url = urlparse(current_url)
-                query_params = parse_qs(parsed_url.query)
-                txid = query_params.get("txId", [None])[0]
+    logger.info("카카오 로그인이 필요합니다. 브라우저 창에서 로그인해주세요.")
+    flow["route"] = ROUTE_KAKAO_LOGIN
+    driver = show_browser_for_input(driver, flow, driver.current_url)
+    return wait_for_url_change(
+        driver, HOME_URL, max(0.0, deadline - time.monotonic())
+    )
 
-                selenium_cookies = driver.get_cookies()
-                set_cookies(session, selenium_cookies)
 
-                (f"리다이렉트 감지: {current_url}")
-                return get_access_token_and_user_id_from_api(
-                    driver, session, txid
+def _auth_authorize(
+    driver: "WebDriver", flow: Dict[str, Any], timeout: float
+) -> str:
+    """
+    AUTHORIZE: 홈 리다이렉트 후 브라우저 쿠키로 세션 생성
+    """
+    if not open_authorize_page(driver, timeout, flow):
+        logger.error("Authorization Code 획득 실패")
+        return AUTH_FAILED
+    driver = flow.get("driver", driver)
+    logger.debug(f"리다이렉트 감지: {driver.current_url}")
+    flow["session"] = create_session(driver)
+    return AUTH_GAME_START
+
+
+def _auth_game_start(
+    driver: "WebDriver", flow: Dict[str, Any], timeout: float
+) -> str:
+    """
+    GAME_START: gamestart 페이지 로드 후 token 요청 또는 보안 센터로 이동
+    (경로 메모로 AUTHORIZE를 생략한 경우 여기서 세션 생성)
+    """
+    navigate(driver, flow, GAME_START_URL)
+    ("유저 인증 페이지 로드 중...")
+    if "session" not in flow:
+        if (
+            not wait_for_url_change(
+                driver,
+                (GAME_START_URL, KAKAO_LOGIN_URL),
+                min(timeout, ROUTE_CHECK_TIMEOUT),
+            )
+            or KAKAO_LOGIN_URL in driver.current_url
+        ):
+            return _fall_back_to_authorize(flow, "gamestart 페이지 미도착")
+        flow["session"] = create_session(driver)
+    elif not wait_for_url_change(driver, GAME_START_URL, timeout):
+        logger.error("유저 인증 실패")
+        return AUTH_FAILED
+
+    current_url = driver.current_url
+    (f"current_url-1: {current_url}")
+    if SECURITY_URL in current_url:
+        # 인증 필요 상태
+        flow["url"] = current_url
+        return AUTH_SECURITY_CENTER
+    # 이미 인증 마친 상태, 혹은 카카오 인증으로 인증 필요로 하는 상태
+    flow["txid"] = None
+    return AUTH_TOKEN
+
+
+def _auth_security_center(
+    driver: "WebDriver", flow: Dict[str, Any], timeout: float
+) -> str:
+    """
+    SECURITY_CENTER: 사용자가 보안 센터 인증을 마치고 txId와 함께 돌아올 때까지 대기
+    """
+    deadline = time.monotonic() + timeout
+    # 보안 센터 인증은 사용자 입력이 필요하므로 창을 띄움
+    driver = show_browser_for_input(driver, flow)
+    flow["route"] = ROUTE_SECURITY_CENTER
+    navigate(driver, flow, flow["url"])
+    ("유저 인증 진행 중...")
+    # 사용자가 인증하는 동안 token API 연결을 미리 열어둠
+    prewarm_token_api()
+
+    if not wait_for_url_change(driver, SECURITY_URL, timeout):
+        logger.error("유저 인증 실패")
+        return AUTH_FAILED
+    set_cookies(flow["session"], driver.get_cookies())
+
+    if not wait_for_url_change(
+        driver, GAME_START_URL, max(0.0, deadline - time.monotonic())
+    ):
+        logger.error("보안 센터 인증 후 리다이렉트 대기 실패")
+        return AUTH_FAILED
+
+    current_url = driver.current_url
+    (f"유저 인증 완료: {current_url}")
+    flow["txid"] = parse_qs(urlparse(current_url).query).get("txId", [None])[0]
+    set_cookies(flow["session"], driver.get_cookies())
+    return AUTH_TOKEN
+
+
+def _auth_token(
+    driver: "WebDriver", flow: Dict[str, Any], timeout: float
+) -> str:
+    """
+    TOKEN: token API 호출 (보안 센터 인증이 필요하면 SECURITY_CENTER로)
+    """
+    try:
+        data = request_token(
+            flow["session"], flow.get("txid"), time.monotonic() + timeout
+        )
+    except requests.HTTPError as e:
+        if flow.get("memo_route") and not flow.get("memo_fallback"):
+            return _fall_back_to_authorize(flow, f"token API 오류 ({e})")
+        raise
+    status = data.get("status")
+    if status == "PASS":
+        flow["token"] = data.get("token")
+        flow["mid"] = data.get("mid")
+        logger.info(f"API를 통해 token 파싱: {flow['token']}")
+        logger.info(f"API를 통해 mid 파싱: {flow['mid']}")
+        return AUTH_DONE
+    if status == "NEED_SECURITYCENTER_AUTH":
+        flow["url"] = data.get("url")
+        return AUTH_SECURITY_CENTER
+    if flow.get("memo_route") and not flow.get("memo_fallback"):
+        return _fall_back_to_authorize(flow, f"예상치 못한 status: {status}")
+    logger.error(f"예상치 못한 status: {status}")
+    return AUTH_FAILED
+
+
+def _fall_back_to_authorize(flow: Dict[str, Any], reason: str) -> str:
+    """
+    경로 메모로 생략한 authorize 단계부터 다시 진행 (한 번만)
+    """
+    if flow.get("memo_fallback"):
+        logger.error(f"유저 인증 실패: {reason}")
+        return AUTH_FAILED
+    logger.info(f"경로 메모 불일치 ({reason}), 전체 경로로 다시 진행")
+    # 인증이 중간에 중단되어도 다음 실행에서 같은 경로를 다시 믿지 않도록 바로 삭제
+    # (인증이 끝나면 save_auth_route()가 이번 결과와 통계로 다시 저장)
+    clear_route_memo()
+    flow["memo_fallback"] = True
+    flow.pop("session", None)
+    flow.pop("txid", None)
+    return AUTH_AUTHORIZE
+
+
+# 상태 -> 처리 함수 (다음 상태 반환)
+AUTH_STATE_HANDLERS: Dict[
+    str, Callable[["WebDriver", Dict[str, Any], float], str]
+] = {
+    AUTH_AUTHORIZE: _auth_authorize,
+    AUTH_GAME_START: _auth_game_start,
+    AUTH_SECURITY_CENTER: _auth_security_center,
+    AUTH_TOKEN: _auth_token,
+}
+
+
+def run_auth_flow(
+    driver: "WebDriver",
+    state: str = AUTH_AUTHORIZE,
+    flow: Optional[Dict[str, Any]] = None,
+    deadline: float = AUTH_DEADLINE,
+    max_transitions: int = AUTH_MAX_TRANSITIONS,
+) -> Tuple[Optional[str], Optional[int], List[Dict[str, Any]]]:
+    """
+    인증 상태 머신 실행
+    모든 대기는 하나의 전체 제한 시간(deadline초)에서 남은 시간만 사용
+    (상태 처리 중 창이 있는 드라이버로 전환되면 flow["driver"]를 이어서 사용)
+    반환값: (token, mid, 상태별 기록)
+    """
+    flow = flow if flow is not None else {}
+    records: List[Dict[str, Any]] = []
+    end = time.monotonic() + deadline
+
+    while state not in (AUTH_DONE, AUTH_FAILED):
+        if len(records) >= max_transitions:
+            logger.error(f"인증 상태 전이 횟수 초과 ({max_transitions}회)")
+            records.append({"state": state, "outcome": "loop_limit"})
+            break
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            logger.error(f"인증 제한 시간 초과 ({deadline}초), 상태: {state}")
+            records.append({"state": state, "outcome": "deadline"})
+            break
+
+        start = time.monotonic()
+        with span(f"auth.state.{state.lower()}") as timer:
+            try:
+                next_state = AUTH_STATE_HANDLERS[state](
+                    flow.get("driver", driver), flow, remaining
                 )
-        else:
-            logger.error("유저 인증 실패")
-            return None, None
-    except Exception as e:
-        logger.error(f"token, mid 파싱 실패: {e}")
-    return None, None
+            except Exception as e:
+                logger.error(f"{state} 처리 중 오류 발생: {e}")
+                next_state = AUTH_FAILED
+            timer.set("ok" if next_state != AUTH_FAILED else "failed")
+        records.append(
+            {
+                "state": state,
+                "duration": round(time.monotonic() - start, 3),
+                "outcome": "ok" if next_state != AUTH_FAILED else "failed",
+                "next": next_state,
+            }
+        )
+        state = next_state
+
+    logger.info(
+        "인증 상태 기록: "
+        + " -> ".join(
+            f"{record['state']}({record.get('duration', 0) * 1000:.0f}ms, "
+            f"{record['outcome']})"
+            for record in records
+        )
+    )
+    if state != AUTH_DONE:
+        return None, None, records
+    return flow.get("token"), flow.get("mid"), records
 
 
-def process_user_auth(
-    driver: WebDriver, session: requests.Session
+def process_user_security_auth(
+    driver: "WebDriver", session: requests.Session, url: str
+) -> Tuple[Optional[str], Optional[int], "WebDriver"]:
+    """
+    사용자 보안 센터 인증 처리
+    반환값: (token, mid, 마지막에 사용한 드라이버 - 창으로 전환했으면 새 드라이버)
+    """
+    memo = load_route_memo()
+    # 프로필에서 읽은 쿠키(도메인 지정)가 남아 있으면 브라우저 쿠키(도메인 없음)와
+    # 같은 이름의 쿠키가 두 번 전송되므로 브라우저 쿠키만 사용
+    session.cookies.clear()
+    flow = {"session": session, "url": url}
+    token, mid, _ = run_auth_flow(driver, AUTH_SECURITY_CENTER, flow)
+    save_auth_route(memo, flow, driver, token)
+    return token, mid, flow.get("driver", driver)
+
+
+def save_auth_route(
+    memo: Dict[str, Any],
+    flow: Dict[str, Any],
+    driver: "WebDriver",
+    token: Optional[str],
+    lookup: bool = False,
+) -> None:
+    """
+    이번 인증의 경로, 쿠키 만료 시각, 페이지 이동 횟수를 경로 메모에 저장
+    """
+    cookie_expires = None
+    if token is not None:
+        try:
+            cookie_expires = get_cookie_expiry(
+                flow.get("driver", driver).get_cookies()
+            )
+        except Exception as e:
+            logger.warning(f"쿠키 만료 시각 확인 실패: {e}")
+    save_route_result(
+        memo,
+        flow.get("route", ROUTE_PASS) if token is not None else None,
+        flow.get("navigations", 0),
+        cookie_expires,
+        lookup=lookup,
+        hit=(
+            lookup
+            and token is not None
+            and "memo_route" in flow
+            and not flow.get("memo_fallback")
+        ),
+    )
+
+
+def get_authorization_code(
+    driver: "WebDriver",
+) -> Tuple[Optional[str], Optional[int], "WebDriver"]:
+    """
+    access_token, user_id 파싱
+    (경로 메모상 세션이 유효하면 authorize 단계를 생략하고 gamestart부터 진행)
+    반환값: (token, mid, 마지막에 사용한 드라이버 - 창으로 전환했으면 새 드라이버)
+    """
+    memo = load_route_memo()
+    flow: Dict[str, Any] = {}
+    state = AUTH_AUTHORIZE
+    memo_route = get_valid_route(memo)
+    if memo_route is not None:
+        flow["memo_route"] = memo_route
+        state = AUTH_GAME_START
+
+    token, mid, _ = run_auth_flow(driver, state, flow)
+    save_auth_route(memo, flow, driver, token, lookup=True)
+    return token, mid, flow.get("driver", driver)
+
+
+def iter_token_responses(
+    captured_requests: Iterable, seen: Set[str], token_url: str = TOKEN_URL
+) -> Iterator[dict]:
+    """
+    캡처된 브라우저 트래픽 중 아직 확인하지 않은 token API 응답 JSON 반환
+    """
+    from seleniumwire.utils import decode
+
+    for request in captured_requests:
+        if (
+            request.id in seen
+            or request.method != "POST"
+            or not request.url.startswith(token_url)
+            or request.response is None
+        ):
+            continue
+        seen.add(request.id)
+        body = decode(
+            request.response.body,
+            request.response.headers.get("Content-Encoding", "identity"),
+        )
+        try:
+            yield json.loads(body)
+        except ValueError:
+            logger.warning(f"token API 응답 파싱 실패: {body[:200]!r}")
+
+
+def wait_for_token_response(
+    driver: "WebDriver",
+    timeout: float = MAX_WAIT_TIME,
+    token_url: str = TOKEN_URL,
+    security_url: str = SECURITY_URL,
+    max_security_auths: int = INTERCEPT_MAX_SECURITY_AUTHS,
 ) -> Tuple[Optional[str], Optional[int]]:
     """
-    사용자 인증 처리
+    브라우저가 직접 보낸 token API 요청의 응답에서 token, mid 파싱
+    (보안 센터 인증을 포함한 전체 대기는 timeout초 안에서만 진행)
     """
-    try:
-        driver.get(GAME_START_URL)
-        ("유저 인증 페이지 로드 중...")
-
-        if wait_for_url_change(driver, GAME_START_URL):
-            current_url = driver.current_url
-            (f"current_url-1: {current_url}")
-
-            if GAME_START_URL in current_url:
-                # 이미 인증 마친 상태, 혹은 카카오 인증으로 인증 필요로 하는 상태
-                ("유저 인증 완료 혹은 카카오 인증 필요")
-                return get_access_token_and_user_id_from_api(driver, session)
-            elif SECURITY_URL in current_url:
-                # 인증 필요 상태
-                ("유저 인증 필요")
-                return process_user_security_auth(driver, session, current_url)
-        else:
-            logger.error("유저 인증 실패")
-            return None, None
-    except Exception as e:
-        logger.error(f"사용자 인증 처리 중 오류 발생: {e}")
+    seen: Set[str] = set()
+    deadline = time.monotonic() + timeout
+    security_auths = 0
+    with span("auth.intercept.wait_token") as timer:
+        while time.monotonic() < deadline:
+            for data in iter_token_responses(driver.requests, seen, token_url):
+                status = data.get("status")
+                logger.debug(f"캡처된 token API 응답: {data}")
+                if status == "PASS":
+                    token = data.get("token")
+                    mid = data.get("mid")
+                    logger.info(f"브라우저 트래픽에서 token 파싱: {token}")
+                    logger.info(f"브라우저 트래픽에서 mid 파싱: {mid}")
+                    timer.set(security_auths=security_auths)
+                    return token, mid
+                elif status == "NEED_SECURITYCENTER_AUTH":
+                    security_auths += 1
+                    if security_auths > max_security_auths:
+                        logger.error(
+                            f"보안 센터 인증 요청 횟수 초과 ({max_security_auths}회)"
+                        )
+                        timer.set("loop_limit")
+                        return None, None
+                    logger.info(
+                        f"보안 센터 인증 대기 중... ({security_auths}회, "
+                        f"남은 시간 {deadline - time.monotonic():.0f}초)"
+                    )
+                    if security_url not in driver.current_url:
+                        driver.get(data.get("url"))
+                else:
+                    logger.error(f"예상치 못한 status: {status}")
+                    timer.set("failed")
+                    return None, None
+            time.sleep(INTERCEPT_POLL_INTERVAL)
+        timer.set("deadline")
+
+    logger.error(
+        f"제한 시간({timeout:.0f}초) 안에 token API 응답을 캡처하지 못했습니다."
+    )
     return None, None
 
 
-def get_authorization_code(
-    driver: WebDriver,
+def get_authorization_code_intercepted(
+    driver: "WebDriver",
+    start_url: Optional[str] = None,
+    deadline: float = AUTH_DEADLINE,
 ) -> Tuple[Optional[str], Optional[int]]:
     """
-    access_token, user_id 파싱
+    selenium-wire로 브라우저의 token API 응답을 가로채 access_token, user_id 파싱
+    모든 대기는 하나의 전체 제한 시간(deadline초)에서 남은 시간만 사용
     """
+    end = time.monotonic() + deadline
     try:
-        logger.info("code_verifier와 code_challenge 생성")
-        code_verifier = generate_code_verifier()
-        code_challenge = generate_code_challenge(code_verifier)
-
-        auth_url = AUTH_URL_TEMPLATE.format(code_challenge=code_challenge)
-        logger.info("Authorization Code 획득을 위한 페이지 로딩 중...")
-        driver.get(auth_url)
-
-        if wait_for_url_change(driver, "https://poe2.game.daum.net/kr/home"):
-            current_url = driver.current_url
-            (f"리다이렉트 감지: {current_url}")
-            session = create_session(driver)
-            return process_user_auth(driver, session)
-        else:
-            logger.error("Authorization Code 획득 실패")
-            return None, None
+        if start_url is None:
+            with span("auth.intercept.authorize") as timer:
+                if not open_authorize_page(driver, deadline, flow={}):
+                    logger.error("Authorization Code 획득 실패")
+                    timer.set("failed")
+                    return None, None
+            start_url = GAME_START_URL
+        driver.get(start_url)
+        return wait_for_token_response(
+            driver, max(0.0, end - time.monotonic())
+        )
     except Exception as e:
-        logger.error(f"Authorization Code 획득 중 오류 발생: {e}")
+        logger.error(f"token API 응답 캡처 중 오류 발생: {e}")
     return None, None
@@ -0,0 +1,1323 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple, Type
+
+
+def measure(func: Callable, *args, **kwargs):
+    """
+    함수 실행 시간(ms)과 결과 반환
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def start_stub_server(handler: Type[BaseHTTPRequestHandler]):
+    """
+    로컬 스텁 HTTP 서버를 백그라운드에서 실행하고 (서버, base_url) 반환
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_bench_driver(headless: bool = True):
+    """
+    임시 프로필을 사용하는 벤치마크용 Chrome 드라이버 생성
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    options = Options()
+    options.add_argument(f"--user-data-dir={tempfile.mkdtemp()}")
+    if headless:
+        options.add_argument("--headless=new")
+    return webdriver.Chrome(
+        service=Service("/usr/bin/chromedriver"), options=options
+    )
+
+
+def make_synthetic_home(
+    root: str, prefixes: int = 40, dirs_per_prefix: int = 250
+) -> str:
+    """
+    Proton prefix, 셰이더 캐시 등을 흉내낸 가짜 홈 디렉토리 생성 후 exe 경로 반환
+    """
+    steamapps = os.path.join(root, ".local", "share", "Steam", "steamapps")
+    for i in range(prefixes):
+        drive_c = os.path.join(
+            steamapps, "compatdata", str(1000 + i), "pfx", "drive_c"
+        )
+        for j in range(dirs_per_prefix):
+            os.makedirs(os.path.join(drive_c, f"dir{j // 25}", f"sub{j}"))
+        os.makedirs(os.path.join(steamapps, "shadercache", str(1000 + i)))
+
+    game_dir = os.path.join(
+        steamapps,
+        "compatdata",
+        str(1000 + prefixes - 1),
+        "pfx",
+        "drive_c",
+        "Daum Games",
+        "Path of Exile2",
+    )
+    os.makedirs(game_dir)
+    exe_path = os.path.join(game_dir, "PathOfExile_x64_KG.exe")
+    with open(exe_path, "wb") as file:
+        file.write(b"MZ")
+    return exe_path
+
+
+def bench_location_cache() -> None:
+    """
+    PathOfExile_x64_KG.exe 위치 캐시 cold/warm 조회 시간 비교
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CACHE_HOME"] = os.path.join(tmp, "cache")
+        home = os.path.join(tmp, "home")
+        exe_path = make_synthetic_home(home)
+
+        from steam import find_file_path_cached
+
+        cold, found = measure(
+            find_file_path_cached, "PathOfExile_x64_KG.exe", home
+        )
+        assert found == exe_path, found
+        warm, found = measure(
+            find_file_path_cached, "PathOfExile_x64_KG.exe", home
+        )
+        assert found == exe_path, found
+
+        # 게임 패치로 exe가 갱신된 경우 (같은 디렉토리 재확인)
+        os.utime(exe_path, ns=(0, 0))
+        stale, found = measure(
+            find_file_path_cached, "PathOfExile_x64_KG.exe", home
+        )
+        assert found == exe_path, found
+
+        # 캐시에 없는 파일은 항상 전체 검색 (최악의 경우)
+        miss, _ = measure(find_file_path_cached, "missing.exe", home)
+
+        print(f"miss  (전체 검색, 미발견): {miss:9.2f} ms")
+        print(f"cold  (전체 검색): {cold:9.2f} ms")
+        print(f"warm  (캐시 적중): {warm:9.2f} ms")
+        print(f"stale (디렉토리 재확인): {stale:9.2f} ms")
+
+
+def legacy_find_file_path(file_name: str, search_path: str):
+    """
+    기존 find_file_path 구현 (단일 스레드 os.walk)
+    """
+    trash = os.path.expanduser("~/.local/share/Trash")
+    for root, dirs, files in os.walk(search_path):
+        dirs[:] = [
+            d for d in dirs if not os.path.join(root, d).startswith(trash)
+        ]
+        if file_name in files:
+            return os.path.join(root, file_name)
+    return None
+
+
+def bench_file_search() -> None:
+    """
+    10만 개 이상의 디렉토리에서 기존 os.walk 검색과 병렬 검색 엔진 비교
+    """
+    from search import search_file, get_search_roots
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = os.path.join(tmp, "home")
+        # 400 prefix x 250 디렉토리 + 셰이더 캐시 = 100k+ 디렉토리
+        exe_path = make_synthetic_home(home, prefixes=400, dirs_per_prefix=250)
+        for i in range(400):
+            cache = os.path.join(home, ".cache", "mesa", str(i))
+            for j in range(10):
+                os.makedirs(os.path.join(cache, str(j)))
+        dir_count = sum(len(dirs) for _, dirs, _ in os.walk(home))
+        print(f"디렉토리 수: {dir_count}")
+
+        legacy, found = measure(
+            legacy_find_file_path, "PathOfExile_x64_KG.exe", home
+        )
+        assert found == exe_path, found
+        print(f"os.walk (기존):          {legacy:9.2f} ms")
+
+        for workers in (1, 4, 8):
+            elapsed, found = measure(
+                search_file, "PathOfExile_x64_KG.exe", [home], workers=workers
+            )
+            assert found == exe_path, found
+            print(f"scandir workers={workers}:      {elapsed:9.2f} ms")
+
+        # 기본값(workers=None)은 루트가 있는 저장 장치마다 한 스레드
+        # (임시 디렉토리는 장치가 하나이므로 SD 카드가 있는 기기에서 비교 필요)
+        roots = get_search_roots(home)
+        devices = len({os.stat(root).st_dev for root in roots})
+        for workers in (1, None, 4):
+            elapsed, found = measure(
+                search_file, "PathOfExile_x64_KG.exe", roots, workers=workers
+            )
+            assert found == exe_path, found
+            print(
+                f"scandir 다중 루트({len(roots)}개, 장치 {devices}개) "
+                f"workers={workers or '장치별'}: {elapsed:9.2f} ms"
+            )
+
+        legacy, _ = measure(legacy_find_file_path, "missing.exe", home)
+        print(f"os.walk 미발견 (기존):   {legacy:9.2f} ms")
+        elapsed, _ = measure(search_file, "missing.exe", [home])
+        print(f"scandir 미발견:          {elapsed:9.2f} ms")
+
+
+class RedirectChainHandler(BaseHTTPRequestHandler):
+    """
+    /page/<n> 에서 일정 시간 후 /page/<n+1> 로 스크립트 리다이렉트
+    """
+
+    def do_GET(self):
+        n = int(self.path.rsplit("/", 1)[-1])
+        body = (
+            "<html><body><script>"
+            f"setTimeout(() => location.href = '/page/{n + 1}', 300);"
+            "</script></body></html>"
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_navigation(redirects: int = 5) -> None:
+    """
+    리다이렉트별 URL 변경 감지 지연: URL 폴링(기존) vs DevTools 이벤트
+    """
+    import auth
+    from navigation import attach_navigation_watcher, detach_navigation_watcher
+
+    server, base_url = start_stub_server(RedirectChainHandler)
+    try:
+        for mode in ("poll", "cdp"):
+            auth.NAVIGATION_MODE = mode
+            driver = make_bench_driver()
+            watcher = attach_navigation_watcher(driver)
+            try:
+                driver.get(f"{base_url}/page/0")
+                lags = []
+                for n in range(1, redirects + 1):
+                    target = f"/page/{n}"
+                    assert auth.wait_for_url_change(driver, target, timeout=10)
+                    detected_at = time.monotonic()
+                    _, committed = watcher.get_event_times(target)
+                    lags.append((detected_at - committed) * 1000)
+                print(
+                    f"{mode:4}: 리다이렉트당 감지 지연 평균 "
+                    f"{sum(lags) / len(lags):7.1f} ms, 최대 {max(lags):7.1f} ms"
+                )
+            finally:
+                detach_navigation_watcher(driver)
+                driver.quit()
+    finally:
+        server.shutdown()
+
+
+class TokenApiStubHandler(BaseHTTPRequestHandler):
+    """
+    gamestart 페이지, 보안 센터, token API를 흉내내는 스텁
+    - POST /token/poe2: txId가 없으면 NEED_SECURITYCENTER_AUTH, 있으면 PASS
+    - GET /gamestart: 페이지 스크립트가 token API를 직접 호출
+    - GET /security: 잠시 후 /gamestart?txId=... 로 리다이렉트
+    """
+
+    token_calls = 0
+    always_pass = False
+    never_pass = False
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        import json
+
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        type(self).token_calls += 1
+        if (request.get("txId") or self.always_pass) and not self.never_pass:
+            data = {"status": "PASS", "token": "stub-token", "mid": 1234}
+        else:
+            data = {
+                "status": "NEED_SECURITYCENTER_AUTH",
+                "url": f"http://{self.headers['Host']}/security",
+            }
+        self._send(200, json.dumps(data).encode(), "application/json")
+
+    def do_GET(self):
+        if self.path.startswith("/gamestart"):
+            script = (
+                "const txId = new URLSearchParams(location.search).get('txId');"
+                "fetch('/token/poe2?actionType=user', {method: 'POST',"
+                " headers: {'Content-Type': 'application/json'},"
+                " body: JSON.stringify({txId: txId, code: null})});"
+            )
+        elif self.path.startswith("/security"):
+            script = "setTimeout(() => location.href = '/gamestart?txId=stub', 200);"
+        else:
+            self._send(404, b"", "text/plain")
+            return
+        body = f"<html><body><script>{script}</script></body></html>"
+        self._send(200, body.encode("utf-8"), "text/html")
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_intercept() -> None:
+    """
+    브라우저 트래픽 캡처로 token 획득 (보안 센터 경유 포함), token API 호출 수 확인
+    """
+    from seleniumwire import webdriver as wire_webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    from auth import wait_for_token_response
+
+    server, base_url = start_stub_server(TokenApiStubHandler)
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument(f"--user-data-dir={tempfile.mkdtemp()}")
+    driver = wire_webdriver.Chrome(
+        service=Service("/usr/bin/chromedriver"),
+        options=options,
+        seleniumwire_options={"disable_encoding": True},
+    )
+    driver.scopes = [".*/token/poe2.*"]
+    try:
+        for always_pass in (True, False):
+            TokenApiStubHandler.always_pass = always_pass
+            TokenApiStubHandler.token_calls = 0
+            del driver.requests
+            start = time.perf_counter()
+            driver.get(f"{base_url}/gamestart")
+            token, mid = wait_for_token_response(
+                driver,
+                timeout=10,
+                token_url=f"{base_url}/token/poe2",
+                security_url=f"{base_url}/security",
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            assert (token, mid) == ("stub-token", 1234), (token, mid)
+            route = "PASS" if always_pass else "보안 센터 경유"
+            print(
+                f"{route:10}: {elapsed:8.1f} ms, "
+                f"token API 호출 {TokenApiStubHandler.token_calls}회 (재요청 없음)"
+            )
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """
+    -X importtime 출력에서 최상위 모듈별 누적 import 시간(ms) 반환
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # 들여쓰기가 없는 모듈이 최상위 import
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return modules
+
+
+def bench_startup() -> None:
+    """
+    태스크별 cold start import 시간과 wall clock 측정
+    (STARTUP_BUDGET_MS를 넘는 태스크가 있으면 실패)
+    """
+    from tasks import TASKS
+
+    budget = float(os.environ.get("STARTUP_BUDGET_MS", "inf"))
+    cases = {
+        "(eager) auth+chrome+steam": "import selenium.webdriver, auth, "
+        "chrome, steam",
+    }
+    for name in TASKS:
+        cases[name] = f"import tasks; tasks.import_task_modules({name!r})"
+
+    over_budget = []
+    for name, code in cases.items():
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        wall = (time.perf_counter() - start) * 1000
+        modules = parse_importtime(result.stderr)
+        total = sum(modules.values())
+        slowest = sorted(modules.items(), key=lambda m: -m[1])[:3]
+        print(
+            f"{name:28} wall {wall:7.1f} ms, import {total:7.1f} ms  "
+            + ", ".join(f"{m} {t:.0f}ms" for m, t in slowest)
+        )
+        if wall > budget and not name.startswith("("):
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"STARTUP_BUDGET_MS({budget:.0f}) 초과: {over_budget}")
+        sys.exit(1)
+
+
+DUMMY_STEAM_SCRIPT = """#!{python}
+import os, sys, time
+time.sleep({startup_delay})
+with open({pid_file!r}, "w") as file:
+    file.write(str(os.getpid()))
+time.sleep(3600)
+"""
+
+
+def legacy_restart(process_name: str, command) -> bool:
+    """
+    기존 Steam 재시작 방식 (1초 간격 전체 프로세스 테이블 조회)
+    """
+    from steam import is_process_running
+
+    subprocess.run(["pkill", "-x", process_name], check=False)
+    for _ in range(30):
+        if not is_process_running(process_name):
+            break
+        time.sleep(1)
+    else:
+        return False
+    subprocess.run(f"{command[0]} &", shell=True, check=False)
+    for _ in range(30):
+        if is_process_running(process_name):
+            return True
+        time.sleep(1)
+    return False
+
+
+def bench_steam_restart() -> None:
+    """
+    가짜 steam 프로세스로 종료/재시작 감지 시간 비교
+    """
+    from process import find_processes, terminate_processes
+    from steam import kill_steam_and_restart_background
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pid_file = os.path.join(tmp, "steam.pid")
+        steam_path = os.path.join(tmp, "steam")
+        with open(steam_path, "w") as file:
+            file.write(
+                DUMMY_STEAM_SCRIPT.format(
+                    python=sys.executable, pid_file=pid_file, startup_delay=0
+                )
+            )
+        os.chmod(steam_path, 0o755)
+
+        try:
+            # 실제 Steam처럼 현재 프로세스의 자식이 아닌 상태로 실행
+            subprocess.run(f"{steam_path} &", shell=True, check=False)
+            time.sleep(0.5)
+            elapsed, ok = measure(legacy_restart, "steam", [steam_path])
+            print(f"기존 (1초 폴링):   {elapsed:8.1f} ms, 성공={ok}")
+
+            time.sleep(0.5)
+            elapsed, ok = measure(
+                kill_steam_and_restart_background,
+                command=[steam_path],
+                pid_file=pid_file,
+            )
+            print(f"pidfd + PID 파일: {elapsed:8.1f} ms, 성공={ok}")
+        finally:
+            terminate_processes(find_processes("steam"), timeout=5)
+
+
+def bench_browser_session() -> None:
+    """
+    Chrome cold launch vs remote debugging 포트 attach 시간 비교
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    import chrome
+
+    profile = tempfile.mkdtemp()
+    port = 9333
+
+    elapsed, driver = measure(make_bench_driver, headless=False)
+    driver.quit()
+    print(f"cold launch (chromedriver가 실행): {elapsed:8.1f} ms")
+
+    elapsed, address = measure(chrome.launch_debug_chrome, profile, port)
+    print(f"백그라운드 launch (포트 대기까지): {elapsed:8.1f} ms")
+    try:
+        for i in range(3):
+            options = Options()
+            start = time.perf_counter()
+            address = chrome.get_debugger_address(port)
+            options.debugger_address = address
+            driver = webdriver.Chrome(
+                service=Service("/usr/bin/chromedriver"), options=options
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            driver.quit()
+            print(f"attach #{i + 1}:                   {elapsed:8.1f} ms")
+    finally:
+        chrome.terminate_profile_chrome(profile)
+
+
+class ImagePageHandler(BaseHTTPRequestHandler):
+    """
+    큰 이미지가 여러 개 포함된 페이지 (headless 설정의 리소스 절감 측정용)
+    """
+
+    images = 20
+    image_size = 512 * 1024
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/image/"):
+            self._send(b"\x00" * self.image_size, "image/png")
+            return
+        body = "".join(
+            f'<img src="/image/{i}.png">' for i in range(self.images)
+        )
+        self._send(f"<html><body>{body}</body></html>".encode(), "text/html")
+
+    def log_message(self, *args):
+        pass
+
+
+def get_tree_rss(pid: int) -> int:
+    """
+    프로세스와 모든 하위 프로세스의 RSS 합계 (바이트)
+    """
+    import psutil
+
+    try:
+        process = psutil.Process(pid)
+        processes = [process] + process.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0
+    total = 0
+    for child in processes:
+        try:
+            total += child.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return total
+
+
+def bench_headless(loads: int = 3) -> None:
+    """
+    headless 우선 모드 vs 창 모드: 드라이버 시작 시간, 페이지 로드 시간, 최대 RSS
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    import chrome
+
+    server, base_url = start_stub_server(ImagePageHandler)
+    try:
+        for name, headless in (("window", False), ("headless", True)):
+            options = Options()
+            options.add_argument(f"--user-data-dir={tempfile.mkdtemp()}")
+            if headless:
+                options.page_load_strategy = "eager"
+                for argument in chrome.HEADLESS_ARGS:
+                    options.add_argument(argument)
+            elapsed, driver = measure(
+                webdriver.Chrome,
+                service=Service("/usr/bin/chromedriver"),
+                options=options,
+            )
+            try:
+                pid = driver.service.process.pid
+                peak = get_tree_rss(pid)
+                load_times = []
+                for i in range(loads):
+                    load_time, _ = measure(driver.get, f"{base_url}/page/{i}")
+                    load_times.append(load_time)
+                    peak = max(peak, get_tree_rss(pid))
+                print(
+                    f"{name:8}: 시작 {elapsed:8.1f} ms, 페이지 로드 평균 "
+                    f"{sum(load_times) / len(load_times):7.1f} ms, "
+                    f"최대 RSS {peak / 1024 / 1024:7.1f} MB"
+                )
+            finally:
+                driver.quit()
+    finally:
+        server.shutdown()
+
+
+def bench_browser_prewarm(browserless_delay: float = 1.0) -> None:
+    """
+    인증용 브라우저 시작: 쿠키 인증 실패 후 시작(기존) vs 예열 후 take()
+    """
+    import chrome
+
+    profile = tempfile.mkdtemp()
+    chrome.get_recent_chrome_profile = lambda: profile
+    chrome.BROWSER_REUSE = False
+
+    start = time.perf_counter()
+    time.sleep(browserless_delay)
+    driver = chrome.set_driver_with_recent_profile(headless=True)
+    sequential = (time.perf_counter() - start) * 1000
+    driver.quit()
+
+    start = time.perf_counter()
+    prewarm = chrome.DriverPrewarm(headless=True)
+    prewarm.start()
+    time.sleep(browserless_delay)
+    driver = prewarm.take()
+    overlapped = (time.perf_counter() - start) * 1000
+    driver.quit()
+    print(
+        f"쿠키 인증 {browserless_delay * 1000:.0f} ms 가정\n"
+        f"순차 시작: {sequential:8.1f} ms\n"
+        f"예열 사용: {overlapped:8.1f} ms "
+        f"(take 대기 {prewarm.waited * 1000:.1f} ms, "
+        f"단축 {prewarm.saved * 1000:.1f} ms)"
+    )
+
+    # 쿠키 인증이 성공하여 브라우저가 필요 없는 경우의 정리 비용
+    # (discard()는 기다리지 않고 반환, 시작 중인 브라우저는 예열 스레드가 종료)
+    prewarm = chrome.DriverPrewarm(headless=True)
+    prewarm.start()
+    time.sleep(browserless_delay)
+    elapsed, _ = measure(prewarm.discard)
+    print(f"미사용 정리: {elapsed:8.1f} ms")
+
+
+def make_localconfig(path: str, apps: int, friends_first: bool) -> None:
+    """
+    앱/친구 데이터가 많은 수 MB 크기의 localconfig.vdf 생성
+    """
+    apps_block = "".join(
+        f'\t\t\t\t\t"{appid}"\n\t\t\t\t\t{{\n'
+        f'\t\t\t\t\t\t"LastPlayed"\t\t"1700000000"\n'
+        f'\t\t\t\t\t\t"Playtime"\t\t"{appid % 977}"\n'
+        f'\t\t\t\t\t\t"cloud"\n\t\t\t\t\t\t{{\n'
+        f'\t\t\t\t\t\t\t"last_sync_state"\t\t"synchronized"\n'
+        f"\t\t\t\t\t\t}}\n\t\t\t\t\t}}\n"
+        for appid in range(10000, 10000 + apps)
+    )
+    software = (
+        '\t"Software"\n\t{\n\t\t"Valve"\n\t\t{\n\t\t\t"Steam"\n'
+        f'\t\t\t{{\n\t\t\t\t"apps"\n\t\t\t\t{{\n{apps_block}'
+        "\t\t\t\t}\n\t\t\t}\n\t\t}\n\t}\n"
+    )
+    friends = (
+        '\t"friends"\n\t{\n'
+        + "".join(
+            f'\t\t"{7656119 + i}"\n\t\t{{\n\t\t\t"name"\t\t"friend{i}"\n'
+            "\t\t}\n"
+            for i in range(2000)
+        )
+        + '\t\t"PersonaName"\t\t"덱유저"\n\t}\n'
+    )
+    body = friends + software if friends_first else software + friends
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f'"UserLocalConfigStore"\n{{\n{body}}}\n')
+
+
+def bench_persona() -> None:
+    """
+    PersonaName 추출: vdf.load 전체 파싱 vs 스트리밍 스캐너 (시간, 최대 메모리)
+    """
+    import tracemalloc
+
+    import vdf
+
+    from vdfscan import find_text_vdf_value
+
+    def load_full(path):
+        with open(path, "r", encoding="utf-8") as file:
+            data = vdf.load(file)
+        return data["UserLocalConfigStore"]["friends"]["PersonaName"]
+
+    def scan(path):
+        return find_text_vdf_value(
+            path, ("UserLocalConfigStore", "friends", "PersonaName")
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for friends_first in (False, True):
+            path = os.path.join(tmp, "localconfig.vdf")
+            make_localconfig(path, apps=20000, friends_first=friends_first)
+            size = os.path.getsize(path) / 1024 / 1024
+            position = "앞" if friends_first else "뒤"
+            print(f"-- {size:.1f} MB, friends 블록 위치: {position}")
+            for name, func in (("vdf.load", load_full), ("스캐너", scan)):
+                tracemalloc.start()
+                elapsed, persona = measure(func, path)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                assert persona == "덱유저", persona
+                print(
+                    f"{name:8}: {elapsed:8.1f} ms, "
+                    f"최대 메모리 {peak / 1024 / 1024:7.2f} MB"
+                )
+
+
+def make_shortcuts(count: int) -> dict:
+    """
+    비-스팀 게임 count개가 등록된 shortcuts 데이터 생성 (마지막이 POE2)
+    """
+    shortcuts = {}
+    for i in range(count):
+        name = "Path of Exile 2" if i == count - 1 else f"Game {i}"
+        shortcuts[str(i)] = {
+            "appid": -1000000 - i,
+            "AppName": name,
+            "Exe": f'"/home/deck/Games/game{i}/game.exe"',
+            "StartDir": f'"/home/deck/Games/game{i}"',
+            "icon": "",
+            "ShortcutPath": "",
+            "LaunchOptions": "",
+            "IsHidden": 0,
+            "AllowDesktopConfig": 1,
+            "AllowOverlay": 1,
+            "OpenVR": 0,
+            "Devkit": 0,
+            "DevkitGameID": "",
+            "DevkitOverrideAppID": 0,
+            "LastPlayTime": 1700000000,
+            "FlatpakAppID": "",
+            "tags": {"0": "favorite", "1": f"tag{i % 10}"},
+        }
+    return {"shortcuts": shortcuts}
+
+
+def bench_shortcuts_write(count: int = 5000) -> None:
+    """
+    shortcuts.vdf 업데이트: vdf 전체 load/dump vs 부분 교체 + 원자적 쓰기
+    """
+    import vdf
+
+    from steam import update_shortcuts
+
+    def load_dump(path):
+        with open(path, "rb") as file:
+            shortcuts = vdf.binary_load(file)
+        for game in shortcuts["shortcuts"].values():
+            if game.get("AppName") == "Path of Exile 2":
+                game["LaunchOptions"] = "--kakao token 1234"
+                game["compat_tool"] = "proton_experimental"
+                break
+        with open(path, "wb") as file:
+            vdf.binary_dump(shortcuts, file)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "shortcuts.vdf")
+        original = vdf.binary_dumps(make_shortcuts(count))
+        print(f"항목 {count}개, {len(original) / 1024:.0f} KB")
+
+        with open(path, "wb") as file:
+            file.write(original)
+        elapsed, _ = measure(load_dump, path)
+        print(f"vdf load/dump:           {elapsed:8.1f} ms")
+
+        with open(path, "wb") as file:
+            file.write(original)
+        elapsed, ok = measure(
+            update_shortcuts,
+            file_path=path,
+            launch_options="--kakao token 1234",
+        )
+        assert ok
+        with open(path, "rb") as file:
+            patched = file.read()
+        changed = len(patched) - len(original)
+        assert (
+            patched[: len(original) - 400] == original[: len(original) - 400]
+        )
+        print(
+            f"부분 교체 + fsync/rename: {elapsed:8.1f} ms "
+            f"(앞부분 바이트 동일, 크기 변화 {changed:+d} bytes)"
+        )
+
+
+def bench_shortcuts_index(counts: Tuple[int, ...] = (5000, 20000)) -> None:
+    """
+    shortcuts 조회/추가: dict 선형 탐색 vs ShortcutIndex
+    """
+    import vdf
+
+    from shortcuts import ShortcutIndex
+
+    def legacy_find(shortcuts, game_name, exe_name):
+        for key, game in shortcuts["shortcuts"].items():
+            if game.get("AppName") == game_name or exe_name in (
+                game.get("Exe", "") + game.get("StartDir", "")
+            ):
+                return key
+        return None
+
+    for count in counts:
+        source = make_shortcuts(count)
+        # 중간 항목이 삭제된 상태 (len() 기반 키가 기존 키와 겹치는 경우)
+        del source["shortcuts"][str(count // 2)]
+        data = vdf.binary_dumps(source)
+        print(f"항목 {count - 1}개, {len(data) / 1024:.0f} KB")
+
+        elapsed, shortcuts = measure(vdf.binary_loads, data)
+        print(f"  vdf 로딩:               {elapsed:8.1f} ms")
+        elapsed, index = measure(ShortcutIndex, data)
+        print(f"  인덱스 생성:            {elapsed:8.1f} ms")
+
+        names = [f"Game {i}" for i in range(0, count, count // 100)]
+        start = time.perf_counter()
+        for name in names:
+            legacy_find(shortcuts, name, "PathOfExile_x64_KG.exe")
+        legacy = (time.perf_counter() - start) * 1000 / len(names)
+        start = time.perf_counter()
+        for name in names:
+            index.find(name, "PathOfExile_x64_KG.exe")
+        indexed = (time.perf_counter() - start) * 1000 / len(names)
+        print(f"  조회 1회 (선형/인덱스): {legacy:8.3f} / {indexed:.4f} ms")
+
+        legacy_key = str(len(shortcuts["shortcuts"]))
+        elapsed, record = measure(
+            index.add, {"appname": "Path of Exile 2 (new)", "exe": "new.exe"}
+        )
+        clash = "겹침" if legacy_key in shortcuts["shortcuts"] else "없음"
+        print(
+            f"  추가 1회:               {elapsed:8.3f} ms "
+            f"(키 {record.key}, len() 기반 키 {legacy_key}는 {clash})"
+        )
+        assert index.find(exe_name="new.exe") is record
+        assert record.key not in shortcuts["shortcuts"]
+
+
+def bench_launch_refresh(startup_delay: float = 5.0) -> None:
+    """
+    token 갱신 시간: 시작 옵션 기록 + Steam 재시작 vs 래퍼 (저장소만 갱신)
+    startup_delay: 가짜 Steam이 PID 파일을 쓰기까지의 시간 (실제 Steam 시작 시간)
+    """
+    import vdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = os.path.join(tmp, "home")
+        config_dir = os.path.join(home, ".steam/steam/userdata/1234/config")
+        os.makedirs(config_dir)
+        with open(os.path.join(config_dir, "shortcuts.vdf"), "wb") as file:
+            file.write(vdf.binary_dumps(make_shortcuts(1000)))
+
+        pid_file = os.path.join(home, ".steam/steam.pid")
+        steam_path = os.path.join(tmp, "steam")
+        with open(steam_path, "w") as file:
+            file.write(
+                DUMMY_STEAM_SCRIPT.format(
+                    python=sys.executable,
+                    pid_file=pid_file,
+                    startup_delay=startup_delay,
+                )
+            )
+        os.chmod(steam_path, 0o755)
+
+        os.environ["HOME"] = home
+        os.environ["XDG_CACHE_HOME"] = os.path.join(tmp, "cache")
+        import steam
+        import tasks
+        from credential import save_credentials
+        from launch import build_game_command
+        from process import find_processes, terminate_processes
+
+        steam.STEAM_COMMAND = [steam_path]
+        context = {"access_token": "token", "user_id": "mid"}
+        context["steam_user_ids"] = ["1234"]
+
+        def refresh(mode, token):
+            tasks.LAUNCH_MODE = mode
+            save_credentials(token, "mid")
+            context["access_token"] = token
+            context.pop("restart_required", None)
+            return tasks.stage_update_shortcuts(
+                context
+            ) and tasks.stage_restart_steam(context)
+
+        try:
+            subprocess.run(f"{steam_path} &", shell=True, check=False)
+            time.sleep(startup_delay + 0.5)
+            print(f"가짜 Steam 시작 시간 {startup_delay:.1f}s")
+
+            elapsed, ok = measure(refresh, "options", "token-1")
+            print(f"시작 옵션 기록 + 재시작: {elapsed:8.1f} ms, 성공={ok}")
+
+            elapsed, ok = measure(refresh, "wrapper", "token-2")
+            print(f"래퍼 최초 등록 + 재시작: {elapsed:8.1f} ms, 성공={ok}")
+
+            elapsed, ok = measure(refresh, "wrapper", "token-3")
+            print(f"래퍼 token 갱신:         {elapsed:8.1f} ms, 성공={ok}")
+            command = build_game_command(["proton", "run", "game.exe"])
+            assert command[-2:] == ["token-3", "mid"], command
+        finally:
+            terminate_processes(find_processes("steam"), timeout=5)
+
+
+def bench_pipeline_overlap(auth_delay: float = 3.0) -> None:
+    """
+    파이프라인 순차 실행 vs 인증 중 Steam 탐색 동시 실행 (단계별 타임라인)
+    auth_delay: 사용자가 카카오 인증을 진행하는 시간
+    """
+    import asyncio
+
+    import vdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = os.path.join(tmp, "home")
+        make_synthetic_home(home, prefixes=60)
+        config_dir = os.path.join(home, ".steam/steam/userdata/1234/config")
+        os.makedirs(config_dir)
+        make_localconfig(
+            os.path.join(config_dir, "localconfig.vdf"),
+            apps=20000,
+            friends_first=False,
+        )
+        # 게임이 아직 등록되지 않은 shortcuts.vdf (실행 파일 검색 필요)
+        shortcuts = make_shortcuts(500)
+        del shortcuts["shortcuts"]["499"]
+        original = vdf.binary_dumps(shortcuts)
+
+        os.environ["HOME"] = home
+        import steam
+        import tasks
+        import timing
+
+        steam.GAME_SEARCH_PATH = home
+        tasks.kill_chrome = lambda: True
+        tasks.restart_steam = lambda: True
+
+        def authorize(force_refresh=False, context=None):
+            time.sleep(auth_delay)
+            return "token", "mid"
+
+        tasks.authorize = authorize
+
+        for concurrent in (False, True):
+            os.environ["XDG_CACHE_HOME"] = os.path.join(
+                tmp, f"cache-{concurrent}"
+            )
+            with open(os.path.join(config_dir, "shortcuts.vdf"), "wb") as f:
+                f.write(original)
+            context = {
+                "force_refresh": False,
+                "steam_user_id": None,
+            }
+            # 단계 구간은 timing에 누적되므로 실행마다 비움
+            timing._spans.clear()
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, failed = measure(
+                    asyncio.run, tasks.run_pipeline_async(context, concurrent)
+                )
+            assert failed is None, failed
+            print(
+                f"{'동시 실행' if concurrent else '순차 실행'}: {elapsed:8.1f} ms"
+            )
+            for entry in timing.get_spans("stage."):
+                marker = (
+                    " (백그라운드)"
+                    if entry.get("attrs", {}).get("background")
+                    else ""
+                )
+                print(
+                    f"  {entry['stage'][len('stage.'):]:<18} "
+                    f"{entry['start']:7.3f}s ~ "
+                    f"{entry['start'] + entry['duration']:7.3f}s{marker}"
+                )
+
+
+def bench_logging(count: int = 5000, write_delay: float = 0.0002) -> None:
+    """
+    로그 호출 지연: 파일에 직접 기록(basicConfig) vs QueueHandler + 리스너 스레드
+    write_delay: 느린 저장소(SD 카드 등)를 흉내낸 기록 1회당 지연
+    """
+    import logging
+    import logging.handlers
+
+    import log
+
+    class SlowFileHandler(logging.FileHandler):
+        def emit(self, record):
+            time.sleep(write_delay)
+            super().emit(record)
+
+    def emit(logger):
+        for i in range(count):
+            logger.info(f"로그 메시지 {i}: /home/deck/.steam/steam/userdata")
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    with tempfile.TemporaryDirectory() as tmp:
+        for delay in (0, write_delay):
+            path = os.path.join(tmp, f"direct-{delay}.log")
+            handler = (SlowFileHandler if delay else logging.FileHandler)(
+                path, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter(log.TEXT_FORMAT))
+            handler.addFilter(log.RunIdFilter())
+
+            root.addHandler(handler)
+            direct, _ = measure(emit, logging.getLogger("direct"))
+            root.removeHandler(handler)
+
+            queue_handler = logging.handlers.QueueHandler(log.queue.Queue())
+            queue_handler.addFilter(log.RunIdFilter())
+            listener = logging.handlers.QueueListener(
+                queue_handler.queue, handler
+            )
+            listener.start()
+            root.addHandler(queue_handler)
+            queued, _ = measure(emit, logging.getLogger("queued"))
+            root.removeHandler(queue_handler)
+            drain, _ = measure(listener.stop)
+            handler.close()
+
+            print(
+                f"기록 지연 {delay * 1e6:4.0f}us: 직접 {direct * 1000 / count:7.2f}"
+                f" us/호출, QueueHandler {queued * 1000 / count:6.2f} us/호출"
+                f" (종료 시 남은 로그 기록 {drain:.0f}ms)"
+            )
+
+
+def bench_timing(count: int = 200000) -> None:
+    """
+    span() 오버헤드: 꺼짐(no-op) vs 켜짐, 켜진 상태의 타임라인 저장
+    """
+    import timing
+
+    def plain():
+        for _ in range(count):
+            pass
+
+    def spans():
+        for _ in range(count):
+            with timing.span("bench.span") as timer:
+                timer.set("ok")
+
+    base, _ = measure(plain)
+    timing.ENABLED = False
+    disabled, _ = measure(spans)
+    timing.ENABLED = True
+    enabled, _ = measure(spans)
+    print(f"꺼짐: {(disabled - base) * 1e6 / count:7.1f} ns/span")
+    print(f"켜짐: {(enabled - base) * 1e6 / count:7.1f} ns/span")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CACHE_HOME"] = tmp
+        timing._spans[:] = timing._spans[:200]
+        elapsed, path = measure(timing.write_timeline, "bench")
+        print(f"타임라인 저장 (구간 200개): {elapsed:.1f} ms -> {path}")
+        for line in timing.format_summary(timing.get_spans())[:3]:
+            print(f"  {line}")
+
+
+class FlakyTokenApiHandler(BaseHTTPRequestHandler):
+    """
+    지연과 오류를 주입하는 token API 스텁 (HTTP/1.1 keep-alive)
+    - handshake_delay: 새 연결마다 지연 (DNS + TLS 핸드셰이크 흉내)
+    - failures: 앞으로의 요청에 차례대로 적용할 오류 ("503", "reset", "stall")
+    """
+
+    protocol_version = "HTTP/1.1"
+    # 헤더/본문을 나눠 쓰므로 Nagle + delayed ACK로 인한 40ms 지연 방지
+    disable_nagle_algorithm = True
+    handshake_delay = 0.0
+    failures: list = []
+    requests = 0
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+        time.sleep(self.handshake_delay)
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        type(self).requests += 1
+        failure = self.failures.pop(0) if self.failures else None
+        if failure == "503":
+            self._send(503, b"{}")
+        elif failure == "reset":
+            self.close_connection = True
+            self.connection.shutdown(2)
+        elif failure == "stall":
+            time.sleep(2)
+            self._send(200, b"{}")
+        else:
+            self._send(
+                200, b'{"status": "PASS", "token": "stub-token", "mid": 1}'
+            )
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_token_api(handshake_delay: float = 0.08) -> None:
+    """
+    token API 호출: 매번 새 세션 + 타임아웃 없음 vs 연결 풀 + 타임아웃 + 재시도 + 예열
+    """
+    import requests
+
+    import tokenapi
+
+    handler = FlakyTokenApiHandler
+    handler.handshake_delay = handshake_delay
+    server, base_url = start_stub_server(handler)
+    url = f"{base_url}/token/poe2?actionType=user"
+
+    def legacy(failures):
+        handler.failures = list(failures)
+        try:
+            requests.Session().post(url, json={}).raise_for_status()
+            return "성공"
+        except requests.RequestException as e:
+            return f"실패 ({type(e).__name__})"
+
+    def pooled(failures, timeout=tokenapi.TOKEN_API_TIMEOUT):
+        handler.failures = list(failures)
+        try:
+            tokenapi.post_json(
+                tokenapi.get_token_session(), url, {}, timeout=timeout
+            ).raise_for_status()
+            return "성공"
+        except requests.RequestException as e:
+            return f"실패 ({type(e).__name__})"
+
+    try:
+        print(f"새 연결 지연 {handshake_delay * 1000:.0f}ms")
+        elapsed, _ = measure(legacy, [])
+        print(f"기존 (새 세션):              {elapsed:7.1f} ms")
+        thread = tokenapi.prewarm_token_api(base_url)
+        time.sleep(handshake_delay * 2)
+        thread.join()
+        elapsed, _ = measure(pooled, [])
+        print(f"연결 풀 (예열 후 첫 요청):   {elapsed:7.1f} ms")
+        elapsed, _ = measure(pooled, [])
+        print(f"연결 풀 (재사용):            {elapsed:7.1f} ms")
+
+        for failures in (["503", "503"], ["reset"]):
+            elapsed, result = measure(legacy, failures)
+            print(f"기존 {'+'.join(failures):<9}: {elapsed:7.1f} ms, {result}")
+            elapsed, result = measure(pooled, failures)
+            print(f"풀   {'+'.join(failures):<9}: {elapsed:7.1f} ms, {result}")
+
+        # 응답 정지: 기존 방식은 무한 대기 가능, 읽기 타임아웃 후 재시도하지 않음
+        requests_before = handler.requests
+        elapsed, result = measure(pooled, ["stall"], (1, 0.5))
+        print(
+            f"풀   stall     : {elapsed:7.1f} ms, {result}, "
+            f"요청 {handler.requests - requests_before}회"
+        )
+        print(f"서버가 받은 연결 수: {handler.connections}")
+    finally:
+        server.shutdown()
+
+
+class FakeAuthDriver:
+    """
+    페이지 이동을 시간 기반으로 흉내내는 가짜 WebDriver
+    routes: (URL에 포함된 문자열, 지연 초, 이동할 URL) 목록
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.history = []
+        self.navigations = 0
+
+    def get(self, url):
+        self.navigations += 1
+        now = time.monotonic()
+        self.history = [(now, url)]
+        for _ in range(10):
+            route = next((r for r in self.routes if r[0] in url), None)
+            if route is None:
+                break
+            now += route[1]
+            url = route[2]
+            self.history.append((now, url))
+
+    @property
+    def current_url(self):
+        now = time.monotonic()
+        return [url for at, url in self.history if at <= now][-1]
+
+    def get_cookies(self):
+        return [{"name": "sid", "value": "fake"}]
+
+
+def bench_auth_flow(user_delay: float = 1.0) -> None:
+    """
+    인증 상태 머신: 가짜 브라우저 + token API 스텁으로 정상/정지/반복 시나리오 측정
+    """
+    import auth
+
+    server, base_url = start_stub_server(TokenApiStubHandler)
+    auth.TOKEN_URL = f"{base_url}/token/poe2"
+    routes = [
+        ("oauth/authorize", 0.1, auth.HOME_URL),
+        (f"{base_url}/security", 0.1, f"{auth.SECURITY_URL}?txn=1"),
+        (auth.SECURITY_URL, user_delay, f"{auth.GAME_START_URL}?txId=stub"),
+    ]
+    scenarios = [
+        ("정상 (보안 센터 경유)", routes, False, 30),
+        ("보안 센터에서 정지", routes[:2], False, 3),
+        ("NEED_SECURITYCENTER_AUTH 반복", routes, True, 30),
+    ]
+    try:
+        for name, scenario_routes, never_pass, deadline in scenarios:
+            TokenApiStubHandler.never_pass = never_pass
+            TokenApiStubHandler.token_calls = 0
+            driver = FakeAuthDriver(scenario_routes)
+            elapsed, (token, _, records) = measure(
+                auth.run_auth_flow, driver, deadline=deadline
+            )
+            print(
+                f"{name}: {elapsed:8.1f} ms, token={token}, "
+                f"페이지 이동 {driver.navigations}회, "
+                f"token API {TokenApiStubHandler.token_calls}회 "
+                f"(제한 {deadline}s)"
+            )
+            for record in records:
+                duration = record.get("duration", 0) * 1000
+                print(
+                    f"  {record['state']:<16} {duration:8.1f} ms "
+                    f"{record['outcome']} -> {record.get('next', '-')}"
+                )
+    finally:
+        server.shutdown()
+
+
+def bench_route_memo(user_delay: float = 1.0) -> None:
+    """
+    인증 경로 메모: 첫 실행(전체 경로) -> 메모 적중 -> 세션 만료로 불일치 시 페이지 이동 수와 시간
+    """
+    import auth
+    import routememo
+
+    os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp()
+    server, base_url = start_stub_server(TokenApiStubHandler)
+    auth.TOKEN_URL = f"{base_url}/token/poe2"
+    routes = [
+        ("oauth/authorize", 0.1, auth.HOME_URL),
+        (f"{base_url}/security", 0.1, f"{auth.SECURITY_URL}?txn=1"),
+        (auth.SECURITY_URL, user_delay, f"{auth.GAME_START_URL}?txId=stub"),
+    ]
+    # 로그인이 풀리면 gamestart가 카카오 로그인으로 바로 리다이렉트 된다고 가정
+    expired_routes = [(auth.GAME_START_URL, 0, auth.KAKAO_LOGIN_URL)] + routes
+    scenarios = [
+        ("첫 실행", routes, True),
+        ("메모 적중", routes, True),
+        ("메모 적중 (보안 센터)", routes, False),
+        ("세션 만료로 불일치", expired_routes, True),
+    ]
+    try:
+        for name, scenario_routes, always_pass in scenarios:
+            TokenApiStubHandler.always_pass = always_pass
+            driver = FakeAuthDriver(scenario_routes)
+            if scenario_routes is expired_routes:
+                # 폴백한 authorize 이후에는 로그인된 상태
+                driver.get = _expire_once(driver, auth.GAME_START_URL)
+            elapsed, (token, _, _) = measure(
+                auth.get_authorization_code, driver
+            )
+            memo = routememo.load_route_memo()
+            print(
+                f"{name}: {elapsed:8.1f} ms, token={token}, "
+                f"페이지 이동 {driver.navigations}회, "
+                f"경로 {memo.get('route')}, "
+                f"적중률 {routememo.get_hit_rate(memo) or 0:.2f}"
+            )
+    finally:
+        TokenApiStubHandler.always_pass = False
+        server.shutdown()
+
+
+def _expire_once(driver: "FakeAuthDriver", url: str) -> Callable:
+    """
+    url로 처음 이동할 때만 만료된 세션처럼 동작하도록 get 교체
+    """
+    original_get = driver.get
+    expired_route = driver.routes[0]
+
+    def get(target):
+        original_get(target)
+        if url in target and expired_route in driver.routes:
+            driver.routes.remove(expired_route)
+
+    return get
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "location_cache": bench_location_cache,
+    "file_search": bench_file_search,
+    "navigation": bench_navigation,
+    "intercept": bench_intercept,
+    "startup": bench_startup,
+    "steam_restart": bench_steam_restart,
+    "browser_session": bench_browser_session,
+    "persona": bench_persona,
+    "shortcuts_write": bench_shortcuts_write,
+    "shortcuts_index": bench_shortcuts_index,
+    "launch_refresh": bench_launch_refresh,
+    "pipeline_overlap": bench_pipeline_overlap,
+    "logging": bench_logging,
+    "timing": bench_timing,
+    "token_api": bench_token_api,
+    "auth_flow": bench_auth_flow,
+    "headless": bench_headless,
+    "browser_prewarm": bench_browser_prewarm,
+    "route_memo": bench_route_memo,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"알 수 없는 벤치마크: {name}")
+            print(f"사용법: python bench.py [{'|'.join(BENCHMARKS)}] ...")
+            sys.exit(1)
+        print(f"== {name}")
+        BENCHMARKS[name]()
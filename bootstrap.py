@@ -0,0 +1,97 @@
+import hashlib
+import os
+import sys
+import time
+from importlib import metadata
+from typing import List
+
+# 가상 환경에 필요한 패키지 (설치 확인은 표준 라이브러리만 사용)
+REQUIREMENTS = [
+    "vdf",
+    "blinker==1.7.0",
+    "psutil",
+    "selenium",
+    "selenium-wire",
+    "requests",
+    "cryptography",
+]
+STAMP_FILE = ".poe2deck-requirements"
+
+
+def get_stamp_path() -> str:
+    """
+    가상 환경에 기록되는 requirements fingerprint 파일 경로
+    """
+    return os.path.join(sys.prefix, STAMP_FILE)
+
+
+def get_fingerprint() -> str:
+    """
+    requirements 목록과 Python 버전으로 fingerprint 생성
+    """
+    content = "\n".join(REQUIREMENTS + [sys.version])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def find_missing_requirements() -> List[str]:
+    """
+    설치되지 않았거나 버전이 맞지 않는 패키지 목록 반환
+    """
+    missing = []
+    for requirement in REQUIREMENTS:
+        name, _, pinned = requirement.partition("==")
+        try:
+            version = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            missing.append(requirement)
+            continue
+        if pinned and version != pinned:
+            missing.append(requirement)
+    return missing
+
+
+def check() -> bool:
+    """
+    fingerprint와 설치된 패키지가 모두 일치하면 True
+    """
+    start = time.perf_counter()
+    try:
+        with open(get_stamp_path(), "r", encoding="utf-8") as file:
+            stamp = file.read().strip()
+    except OSError:
+        stamp = None
+
+    if stamp != get_fingerprint():
+        print("# 의존성 fingerprint 불일치, 패키지를 설치합니다.")
+        return False
+
+    missing = find_missing_requirements()
+    elapsed = (time.perf_counter() - start) * 1000
+    if missing:
+        print(f"# 누락된 패키지: {' '.join(missing)} ({elapsed:.0f}ms)")
+        return False
+
+    print(f"# 필요한 패키지가 모두 설치되어 있습니다. ({elapsed:.0f}ms)")
+    return True
+
+
+def stamp() -> None:
+    """
+    설치 완료 후 fingerprint 기록
+    """
+    with open(get_stamp_path(), "w", encoding="utf-8") as file:
+        file.write(get_fingerprint())
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "check"
+    if command == "check":
+        sys.exit(0 if check() else 1)
+    elif command == "stamp":
+        stamp()
+    elif command == "requirements":
+        print("\n".join(REQUIREMENTS))
+    else:
+        print(f"알 수 없는 명령: {command}")
+        print("사용법: python bootstrap.py check|stamp|requirements")
+        sys.exit(1)
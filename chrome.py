@@ -1,41 +1,192 @@
+import json
 import logging
 import os
-import subprocess
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+import psutil
 
-from util import is_command_available
+from navigation import attach_navigation_watcher, detach_navigation_watcher
+from process import launch_detached, terminate_processes, wait_until
+from timing import span, timed
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="tasks.log",
-    filemode="a",
-    encoding="utf-8",
-)
 logger = logging.getLogger(__name__)
 
+CHROME_BINARIES = (
+    "google-chrome-stable",
+    "google-chrome",
+    "chromium",
+    "chromium-browser",
+)
+REMOTE_DEBUGGING_PORT = int(os.environ.get("POE2DECK_DEBUG_PORT", "9222"))
+# POE2DECK_BROWSER_REUSE=1 이면 remote debugging 포트를 연 Chrome을 실행 후 유지
+# (로그인된 프로필의 쿠키를 로컬 프로세스 누구나 CDP로 읽을 수 있으므로 기본값은 사용 안 함)
+# 유지할 Chrome은 POE2DECK_HEADLESS와 관계없이 창으로 실행
+# (headless Chrome은 release_driver()에서 종료되어 다음 실행에서 재사용할 수 없음)
+BROWSER_REUSE = os.environ.get("POE2DECK_BROWSER_REUSE", "0") == "1"
+CHROME_LAUNCH_TIMEOUT = 15
+CHROME_KILL_TIMEOUT = 10
+# POE2DECK_BROWSER_PREWARM=0 이면 인증에 브라우저가 필요할 때 시작
+BROWSER_PREWARM = os.environ.get("POE2DECK_BROWSER_PREWARM", "1") == "1"
+# POE2DECK_HEADLESS=0 이면 처음부터 창을 띄움
+HEADLESS_FIRST = os.environ.get("POE2DECK_HEADLESS", "1") == "1"
+# 사용자 입력이 필요 없는 동안 사용하는 headless 설정
+# (프로필에 저장되지 않도록 prefs 대신 명령줄 플래그만 사용)
+HEADLESS_ARGS = (
+    "--headless=new",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-gpu",
+    "--mute-audio",
+)
+# CDP Network.getAllCookies 결과 중 Network.setCookies에 넘길 수 있는 필드
+COOKIE_PARAM_FIELDS = (
+    "name",
+    "value",
+    "domain",
+    "path",
+    "secure",
+    "httpOnly",
+    "sameSite",
+    "expires",
+    "priority",
+)
 
-def kill_chrome_processes() -> None:
+_headless_sessions: Dict[str, bool] = {}
+
+
+def get_debugger_address(port: int = REMOTE_DEBUGGING_PORT) -> Optional[str]:
     """
-    현재 실행 중인 Chrome 프로세스 종료
+    remote debugging 포트로 접속 가능한 Chrome이 있으면 주소 반환
     """
+    address = f"127.0.0.1:{port}"
     try:
-        if is_command_available("killall"):
-            subprocess.run(["killall", "chrome"], check=False)
-        else:
-            logger.error(
-                "이 운영 체제에서 Chrome 프로세스를 종료할 수 없습니다."
-            )
-            raise OSError("지원되지 않는 운영 체제입니다.")
-    except subprocess.CalledProcessError as e:
-        logger.exception(
-            "Chrome 프로세스를 종료하는 도중 오류 발생.", exc_info=e
+        with urllib.request.urlopen(
+            f"http://{address}/json/version", timeout=0.5
+        ) as response:
+            version = json.load(response)
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+    logger.debug(f"실행 중인 Chrome 발견: {version.get('Browser')}")
+    return address
+
+
+def get_profile_lock_pid(profile_base: str) -> Optional[int]:
+    """
+    프로필의 SingletonLock(hostname-PID 심볼릭 링크)을 잡고 있는 PID 반환
+    """
+    try:
+        target = os.readlink(os.path.join(profile_base, "SingletonLock"))
+    except OSError:
+        return None
+    _, _, pid = target.rpartition("-")
+    return int(pid) if pid.isdigit() else None
+
+
+def is_profile_unlocked(profile_base: str) -> bool:
+    """
+    프로필을 잠그고 있는 Chrome이 없는지 확인 (남아 있는 잠금 파일은 무시)
+    """
+    pid = get_profile_lock_pid(profile_base)
+    return pid is None or not psutil.pid_exists(pid)
+
+
+def terminate_profile_chrome(profile_base: str) -> bool:
+    """
+    프로필의 SingletonLock을 잡고 있는 Chrome과 자식 프로세스 종료
+    """
+    pid = get_profile_lock_pid(profile_base)
+    if pid is None or not psutil.pid_exists(pid):
+        logger.debug("프로필을 사용 중인 Chrome 프로세스가 없습니다.")
+        return True
+
+    try:
+        process = psutil.Process(pid)
+        processes = [process] + process.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return True
+
+    if not terminate_processes(processes, CHROME_KILL_TIMEOUT):
+        logger.error(f"Chrome 프로세스 종료 확인 실패: PID {pid}")
+        return False
+    ("Chrome 프로세스가 정상적으로 종료되었습니다.")
+    return True
+
+
+def kill_chrome_processes() -> None:
+    """
+    프로필을 잠그고 있는 Chrome 프로세스만 종료
+    (remote debugging으로 재사용 가능한 Chrome은 유지)
+    """
+    if BROWSER_REUSE and get_debugger_address():
+        logger.info("재사용 가능한 Chrome이 실행 중이므로 종료하지 않습니다.")
+        return
+    terminate_profile_chrome(get_recent_chrome_profile())
+
+
+def find_chrome_binary() -> Optional[str]:
+    """
+    Chrome 실행 파일 경로 반환
+    """
+    for binary in CHROME_BINARIES:
+        path = shutil.which(binary)
+        if path:
+            return path
+    return None
+
+
+@timed("chrome.launch_debug")
+def launch_debug_chrome(
+    profile_base: str,
+    port: int = REMOTE_DEBUGGING_PORT,
+    headless: bool = False,
+) -> Optional[str]:
+    """
+    remote debugging 포트를 연 Chrome을 백그라운드로 실행 후 주소 반환
+    """
+    binary = find_chrome_binary()
+    if binary is None:
+        logger.error("Chrome 실행 파일을 찾을 수 없습니다.")
+        return None
+
+    process = launch_detached(
+        [
+            binary,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile_base}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *(HEADLESS_ARGS if headless else ()),
+            "about:blank",
+        ]
+    )
+    if not wait_until(
+        lambda: get_debugger_address(port) is not None, CHROME_LAUNCH_TIMEOUT
+    ):
+        logger.error(
+            "Chrome remote debugging 포트 연결 실패, 실행한 Chrome 종료"
         )
-    else:
-        ("Chrome 프로세스가 정상적으로 종료되었습니다.")
+        # 남겨두면 이후 cold launch가 같은 프로필을 열지 못함
+        try:
+            chrome_process = psutil.Process(process.pid)
+            terminate_processes(
+                [chrome_process] + chrome_process.children(recursive=True),
+                CHROME_KILL_TIMEOUT,
+            )
+        except psutil.NoSuchProcess:
+            pass
+        process.poll()
+        return None
+    return get_debugger_address(port)
 
 
 def get_recent_chrome_profile() -> str:
@@ -47,15 +198,258 @@ def get_recent_chrome_profile() -> str:
     return profile_base
 
 
-def set_driver_with_recent_profile() -> webdriver.Chrome:
+def set_driver_with_recent_profile(
+    intercept_scopes: Optional[List[str]] = None,
+    headless: Optional[bool] = None,
+) -> "webdriver.Chrome":
     """
     Chrome 프로필을 사용하여 Selenium WebDriver를 초기화
+    (intercept_scopes가 있으면 selenium-wire로 해당 트래픽을 캡처)
+    (headless이면 창 없이 시작하고, 사용자 입력이 필요할 때 show_browser로 전환)
     """
-    options = Options()
-    options.add_argument("--user-data-dir=" + get_recent_chrome_profile())
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
 
+    headless = HEADLESS_FIRST if headless is None else headless
+    # selenium-wire는 실행 시 프록시 설정이 필요하므로 재사용 불가
+    reuse = BROWSER_REUSE and not intercept_scopes
+    if reuse:
+        # 재사용할 Chrome은 실행 후에도 유지하므로 창으로 실행
+        headless = False
+    start = time.perf_counter()
+    options = Options()
     service = Service("/usr/bin/chromedriver")
+    if headless:
+        # DOMContentLoaded 시점에 제어권 반환 (이미지 등 하위 리소스 대기 안 함)
+        options.page_load_strategy = "eager"
+
+    address = None
+    launch_mode = "cold"
+    if reuse:
+        address = get_debugger_address()
+        launch_mode = "attach"
+        if address is None:
+            kill_chrome_processes()
+            address = launch_debug_chrome(
+                get_recent_chrome_profile(), headless=headless
+            )
+            launch_mode = "launch" if address else "cold"
 
-    driver = webdriver.Chrome(service=service, options=options)
-    ("Selenium WebDriver 초기화 완료.")
+    if not address:
+        # 다른 Chrome(재사용 중이거나 포트 연결에 실패한 Chrome)이 프로필을
+        # 잡고 있으면 chromedriver가 실행한 Chrome이 바로 종료됨
+        profile = get_recent_chrome_profile()
+        if not is_profile_unlocked(profile):
+            terminate_profile_chrome(profile)
+        if headless:
+            for argument in HEADLESS_ARGS:
+                options.add_argument(argument)
+
+    with span("chrome.driver_start", mode=launch_mode, headless=headless):
+        if address:
+            options.debugger_address = address
+            driver = webdriver.Chrome(service=service, options=options)
+        elif intercept_scopes:
+            from seleniumwire import webdriver as wire_webdriver
+
+            options.add_argument(
+                "--user-data-dir=" + get_recent_chrome_profile()
+            )
+            driver = wire_webdriver.Chrome(
+                service=service,
+                options=options,
+                seleniumwire_options={"disable_encoding": True},
+            )
+            driver.scopes = intercept_scopes
+        else:
+            options.add_argument(
+                "--user-data-dir=" + get_recent_chrome_profile()
+            )
+            driver = webdriver.Chrome(service=service, options=options)
+    attach_navigation_watcher(driver)
+    logger.info(
+        f"Selenium WebDriver 초기화 완료 [{launch_mode}, "
+        f"{'headless' if is_headless(driver) else 'window'}] "
+        f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
     return driver
+
+
+def is_headless(driver: "webdriver.Chrome") -> bool:
+    """
+    드라이버가 제어하는 Chrome이 headless인지 확인
+    (attach한 Chrome은 실행 방식을 알 수 없으므로 User-Agent로 판단)
+    """
+    session_id = getattr(driver, "session_id", None)
+    if session_id not in _headless_sessions:
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception:
+            user_agent = ""
+        _headless_sessions[session_id] = "HeadlessChrome" in (user_agent or "")
+    return _headless_sessions[session_id]
+
+
+def _to_cookie_param(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    param = {k: cookie[k] for k in COOKIE_PARAM_FIELDS if k in cookie}
+    if cookie.get("session") or param.get("expires", 0) < 0:
+        # 세션 쿠키
+        param.pop("expires", None)
+    return param
+
+
+def release_driver(driver: "webdriver.Chrome") -> None:
+    """
+    사용이 끝난 드라이버 종료
+    (창이 있는 재사용 Chrome만 남기고, headless Chrome은 프로필을 잡지 않도록 종료)
+    """
+    headless = is_headless(driver)
+    _headless_sessions.pop(driver.session_id, None)
+    detach_navigation_watcher(driver)
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"드라이버 종료 중 오류: {e}")
+    if headless:
+        # attach한 headless Chrome은 driver.quit()으로 종료되지 않고,
+        # 남아 있으면 사용자가 연 Chrome이 창 없는 인스턴스로 전달됨
+        terminate_profile_chrome(get_recent_chrome_profile())
+
+
+def show_browser(
+    driver: "webdriver.Chrome", url: Optional[str] = None
+) -> "webdriver.Chrome":
+    """
+    headless 드라이버를 같은 프로필의 일반 창 드라이버로 전환
+    (세션 쿠키를 포함한 모든 쿠키를 옮기고, url이 있으면 이어서 이동)
+    """
+    if not is_headless(driver):
+        return driver
+
+    start = time.perf_counter()
+    with span("chrome.show_browser"):
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get(
+            "cookies", []
+        )
+        release_driver(driver)
+
+        visible = set_driver_with_recent_profile(headless=False)
+        visible.execute_cdp_cmd(
+            "Network.setCookies",
+            {"cookies": [_to_cookie_param(cookie) for cookie in cookies]},
+        )
+        if url:
+            visible.get(url)
+    logger.info(
+        f"사용자 입력이 필요하여 브라우저 창으로 전환 "
+        f"(쿠키 {len(cookies)}개, {(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
+    return visible
+
+
+class DriverPrewarm:
+    """
+    start()가 호출되고 프로필 잠금이 풀리면 백그라운드 스레드에서 WebDriver 시작
+    인증에서 브라우저가 필요하면 take()로 가져가고, 필요 없으면 discard()로 정리
+    """
+
+    def __init__(self, headless: Optional[bool] = None):
+        self.headless = headless
+        self.driver: Optional["webdriver.Chrome"] = None
+        self.taken = False
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        # take()에서 준비 완료를 기다린 시간
+        self.waited = 0.0
+        self._discarded = False
+        self._lock = threading.Lock()
+        # 프로세스 종료 시 시작 중인 브라우저까지 정리하도록 daemon으로 만들지 않음
+        self._thread = threading.Thread(
+            target=self._run, name="chrome-prewarm"
+        )
+
+    def start(self) -> None:
+        """
+        브라우저 시작 (프로필의 Cookies DB를 읽는 동안에는 호출하지 않음)
+        """
+        if self.started_at is not None or self._discarded:
+            return
+        self.started_at = time.perf_counter()
+        self._thread.start()
+
+    def _run(self) -> None:
+        profile = get_recent_chrome_profile()
+        driver = None
+        with span("chrome.prewarm") as timer:
+            if not wait_until(
+                lambda: self._discarded or is_profile_unlocked(profile),
+                CHROME_KILL_TIMEOUT,
+            ):
+                logger.warning("프로필 잠금이 풀리지 않아 브라우저 예열 취소")
+                timer.set("locked")
+            elif self._discarded:
+                timer.set("cancelled")
+            else:
+                try:
+                    driver = set_driver_with_recent_profile(
+                        headless=self.headless
+                    )
+                except Exception as e:
+                    logger.warning(f"브라우저 예열 실패: {e}")
+                    timer.set("failed")
+        self.ready_at = time.perf_counter()
+        with self._lock:
+            if not self._discarded:
+                self.driver = driver
+                return
+        # 시작하는 동안 discard()된 경우 이 스레드에서 정리
+        if driver is not None:
+            self._release(driver)
+
+    @staticmethod
+    def _release(driver: "webdriver.Chrome") -> None:
+        release_driver(driver)
+        logger.info("인증에 브라우저가 필요하지 않아 예열된 브라우저 종료")
+
+    @property
+    def saved(self) -> float:
+        """
+        예열로 인증 단계에서 줄어든 시간 (사용하지 않았으면 0)
+        """
+        if not self.taken or self.ready_at is None:
+            return 0.0
+        return max(0.0, self.ready_at - self.started_at - self.waited)
+
+    def take(self) -> Optional["webdriver.Chrome"]:
+        """
+        예열된 드라이버 반환 (아직 시작 중이면 완료까지 대기, 실패 시 None)
+        """
+        if self.started_at is None:
+            return None
+        start = time.perf_counter()
+        self._thread.join()
+        self.waited = time.perf_counter() - start
+        if self.driver is None:
+            return None
+        self.taken = True
+        logger.info(
+            f"예열된 브라우저 사용 (대기 {self.waited * 1000:.0f}ms, "
+            f"단축 {self.saved * 1000:.0f}ms)"
+        )
+        return self.driver
+
+    def discard(self) -> None:
+        """
+        사용하지 않은 드라이버를 백그라운드에서 종료하고 바로 반환
+        (시작 중이면 시작이 끝난 뒤 예열 스레드가 종료, take()로 가져간 경우 무시)
+        """
+        if self.taken:
+            return
+        with self._lock:
+            self._discarded = True
+            driver, self.driver = self.driver, None
+        if driver is not None:
+            threading.Thread(
+                target=self._release, args=(driver,), name="chrome-release"
+            ).start()
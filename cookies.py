@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import time
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+COOKIE_DB_CANDIDATES = (
+    os.path.join("Network", "Cookies"),
+    "Cookies",
+)
+SAFE_STORAGE_NAME = "Chrome Safe Storage"
+V10_PASSWORD = b"peanuts"
+SALT = b"saltysalt"
+IV = b" " * 16
+# Chrome은 1601-01-01 기준 마이크로초로 만료 시각을 저장
+CHROME_EPOCH_OFFSET = 11644473600
+
+
+def get_last_used_profile_dir(profile_base: str) -> str:
+    """
+    Local State의 profile.last_used를 읽어 최근 사용 프로필 디렉토리 반환
+    """
+    local_state = os.path.join(profile_base, "Local State")
+    try:
+        with open(local_state, "r", encoding="utf-8") as file:
+            name = json.load(file).get("profile", {}).get("last_used")
+    except (OSError, ValueError):
+        name = None
+    return os.path.join(profile_base, name or "Default")
+
+
+def get_cookie_db_path(profile_base: str) -> Optional[str]:
+    """
+    프로필의 Cookies SQLite 파일 경로 반환
+    """
+    profile_dir = get_last_used_profile_dir(profile_base)
+    for candidate in COOKIE_DB_CANDIDATES:
+        path = os.path.join(profile_dir, candidate)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _derive_key(password: bytes) -> bytes:
+    """
+    Linux Chrome 쿠키 암호화 키 생성 (PBKDF2-SHA1, 1회, 16바이트)
+    """
+    return hashlib.pbkdf2_hmac("sha1", password, SALT, 1, 16)
+
+
+def get_v11_password() -> Optional[bytes]:
+    """
+    키링(KWallet, GNOME Keyring)에서 Chrome Safe Storage 비밀번호 조회
+    """
+    commands = [
+        [
+            "kwallet-query",
+            "--read-password",
+            SAFE_STORAGE_NAME,
+            "--folder",
+            "Chrome Keys",
+            "kdewallet",
+        ],
+        ["secret-tool", "lookup", "application", "chrome"],
+    ]
+    for command in commands:
+        try:
+            result = subprocess.run(
+                command, capture_output=True, check=False, timeout=5
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        password = result.stdout.strip()
+        if result.returncode == 0 and password:
+            return password
+    return None
+
+
+def _decrypt(encrypted: bytes, key: bytes) -> Optional[bytes]:
+    """
+    AES-128-CBC 복호화 후 PKCS7 패딩 제거
+    """
+    from cryptography.hazmat.primitives.ciphers import (
+        Cipher,
+        algorithms,
+        modes,
+    )
+
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(IV)).decryptor()
+    data = decryptor.update(encrypted) + decryptor.finalize()
+    padding = data[-1] if data else 0
+    if not 1 <= padding <= 16 or data[-padding:] != bytes([padding]) * padding:
+        return None
+    return data[:-padding]
+
+
+def decrypt_cookie_value(
+    encrypted_value: bytes, host_key: str, keys: Dict[bytes, List[bytes]]
+) -> Optional[str]:
+    """
+    v10/v11 암호화된 쿠키 값 복호화
+    """
+    prefix = encrypted_value[:3]
+    for key in keys.get(prefix, []):
+        value = _decrypt(encrypted_value[3:], key)
+        if value is None:
+            continue
+        # DB 버전 24 이상은 값 앞에 host_key의 SHA256 해시(32바이트)가 붙음
+        if value[:32] == hashlib.sha256(host_key.encode("utf-8")).digest():
+            value = value[32:]
+        try:
+            return value.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def read_chrome_cookies(
+    profile_base: str, domain: str = "daum.net"
+) -> Optional[List[Dict]]:
+    """
+    브라우저 실행 없이 Chrome 프로필에서 도메인 쿠키를 읽어 복호화
+    """
+    try:
+        import cryptography  # noqa: F401
+    except ImportError:
+        logger.warning(
+            "cryptography 패키지가 없어 쿠키를 복호화할 수 없습니다."
+        )
+        return None
+
+    db_path = get_cookie_db_path(profile_base)
+    if db_path is None:
+        logger.warning(f"Cookies 파일을 찾을 수 없습니다: {profile_base}")
+        return None
+
+    try:
+        # Chrome 실행 중에도 잠금 없이 읽도록 immutable 모드 사용
+        uri = f"file:{quote(db_path)}?mode=ro&immutable=1"
+        with sqlite3.connect(uri, uri=True) as connection:
+            rows = connection.execute(
+                "SELECT host_key, name, value, encrypted_value, path, "
+                "expires_utc, is_secure FROM cookies "
+                "WHERE host_key = ? OR host_key LIKE ?",
+                (domain, f"%.{domain}"),
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.error(f"Cookies 데이터베이스 읽기 실패: {e}")
+        return None
+
+    keys = {b"v10": [_derive_key(V10_PASSWORD)], b"v11": []}
+    if any(row[3][:3] == b"v11" for row in rows):
+        password = get_v11_password()
+        if password:
+            keys[b"v11"].append(_derive_key(password))
+        keys[b"v11"].append(_derive_key(b""))
+
+    now = time.time()
+    cookies = []
+    for (
+        host_key,
+        name,
+        value,
+        encrypted_value,
+        path,
+        expires_utc,
+        secure,
+    ) in rows:
+        expires = (
+            expires_utc / 1_000_000 - CHROME_EPOCH_OFFSET
+            if expires_utc
+            else None
+        )
+        if expires is not None and expires < now:
+            continue
+        if not value and encrypted_value:
+            value = decrypt_cookie_value(encrypted_value, host_key, keys)
+            if value is None:
+                logger.warning(f"쿠키 복호화 실패: {host_key} {name}")
+                continue
+        cookies.append(
+            {
+                "name": name,
+                "value": value,
+                "domain": host_key,
+                "path": path,
+                "secure": bool(secure),
+                "expiry": int(expires) if expires is not None else None,
+            }
+        )
+
+    logger.info(f"Chrome 프로필에서 {domain} 쿠키 {len(cookies)}개 로드")
+    return cookies
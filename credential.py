@@ -0,0 +1,119 @@
+import logging
+import os
+import stat
+import time
+from typing import Any, Callable, Dict, Optional
+
+from util import get_cache_dir, load_json_file, save_json_file
+
+logger = logging.getLogger(__name__)
+
+CREDENTIAL_FILE = "credentials.json"
+DEFAULT_CREDENTIAL_TTL = 10 * 60
+
+
+def get_credential_path() -> str:
+    """
+    자격 증명 캐시 파일 경로 반환
+    """
+    return os.path.join(get_cache_dir(), CREDENTIAL_FILE)
+
+
+def get_credential_ttl() -> int:
+    """
+    자격 증명 캐시 유효 시간(초) 반환 (POE2DECK_CREDENTIAL_TTL 환경 변수로 변경 가능)
+    """
+    try:
+        return int(
+            os.environ.get("POE2DECK_CREDENTIAL_TTL", DEFAULT_CREDENTIAL_TTL)
+        )
+    except ValueError:
+        logger.warning("POE2DECK_CREDENTIAL_TTL 값이 올바르지 않습니다.")
+        return DEFAULT_CREDENTIAL_TTL
+
+
+def is_valid_credential(token: Any, mid: Any) -> bool:
+    """
+    캐시된 token, mid 형식 확인 (게임 실행 인자로 그대로 전달되므로 공백 불가)
+    """
+    return (
+        isinstance(token, str)
+        and bool(token)
+        and not any(char.isspace() for char in token)
+        and str(mid).isdigit()
+    )
+
+
+def load_credentials(
+    ttl: Optional[int] = None,
+    validator: Optional[Callable[[str, Any], bool]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    유효한 token, mid 캐시를 반환 (만료, 검증 실패 시 None)
+    validator(token, mid)가 False를 반환하면 캐시를 삭제
+    """
+    path = get_credential_path()
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        logger.info("자격 증명 캐시 미스: 캐시 없음")
+        return None
+
+    if mode & (stat.S_IRWXG | stat.S_IRWXO):
+        logger.warning("자격 증명 캐시 권한이 너무 넓어 0600으로 변경합니다.")
+        os.chmod(path, 0o600)
+
+    entry = load_json_file(path)
+    if not isinstance(entry, dict) or not entry.get("token"):
+        logger.info("자격 증명 캐시 미스: 캐시 손상")
+        return None
+
+    ttl = get_credential_ttl() if ttl is None else ttl
+    age = time.time() - entry.get("issued_at", 0)
+    if age < 0 or age > ttl:
+        logger.info(
+            f"자격 증명 캐시 미스: 만료됨 (발급 {age:.0f}초 전, TTL {ttl}초)"
+        )
+        return None
+
+    if validator is not None and not validator(
+        entry["token"], entry.get("mid")
+    ):
+        logger.warning("자격 증명 캐시 미스: 검증 실패, 캐시를 삭제합니다.")
+        clear_credentials()
+        return None
+
+    logger.info(
+        f"자격 증명 캐시 적중 (발급 {age:.0f}초 전), "
+        f"절약된 시간 약 {entry.get('auth_seconds', 0):.1f}초"
+    )
+    return entry
+
+
+def save_credentials(
+    token: str, mid: Any, auth_seconds: Optional[float] = None
+) -> None:
+    """
+    token, mid와 발급 시각을 캐시에 저장 (소유자만 읽기/쓰기 가능)
+    """
+    entry = {
+        "token": token,
+        "mid": mid,
+        "issued_at": time.time(),
+        "auth_seconds": auth_seconds or 0,
+    }
+    try:
+        save_json_file(get_credential_path(), entry, mode=0o600)
+        logger.debug("자격 증명 캐시 저장 완료.")
+    except OSError as e:
+        logger.warning(f"자격 증명 캐시 저장 실패: {e}")
+
+
+def clear_credentials() -> None:
+    """
+    자격 증명 캐시 삭제
+    """
+    try:
+        os.remove(get_credential_path())
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,73 @@
+import logging
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+from credential import is_valid_credential, load_credentials
+from log import setup_logging, shutdown_logging
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_SCRIPT = os.path.abspath(__file__)
+# 게임 실행 시에는 재인증 캐시(POE2DECK_CREDENTIAL_TTL)보다 오래된 token도 사용
+LAUNCH_CREDENTIAL_TTL = 24 * 60 * 60
+
+
+def get_wrapper_launch_options(python: Optional[str] = None) -> str:
+    """
+    래퍼를 거쳐 게임을 실행하는 Steam 시작 옵션 반환
+    """
+    return f'"{python or sys.executable}" "{LAUNCH_SCRIPT}" %command%'
+
+
+def build_game_command(command: List[str]) -> Optional[List[str]]:
+    """
+    %command%로 전달된 게임 실행 명령에 --kakao token mid 추가
+    """
+    credentials = load_credentials(
+        ttl=LAUNCH_CREDENTIAL_TTL, validator=is_valid_credential
+    )
+    if credentials is None:
+        return None
+    return command + ["--kakao", credentials["token"], str(credentials["mid"])]
+
+
+def main() -> int:
+    """
+    Steam 시작 옵션 래퍼: 게임 실행 시점에 저장된 token, mid를 붙여 실행
+    (시작 옵션: get_wrapper_launch_options())
+    """
+    setup_logging()
+    command = sys.argv[1:]
+    if not command:
+        logger.error(
+            "실행할 게임 명령이 없습니다. 시작 옵션에 %command%가 필요합니다."
+        )
+        return 1
+
+    game_command = build_game_command(command)
+    if game_command is None:
+        logger.error(
+            "사용 가능한 자격 증명이 없습니다. POE2Deck을 다시 실행해주세요."
+        )
+        subprocess.run(
+            [
+                "zenity",
+                "--error",
+                "--title=POE2Deck",
+                "--text=인증 정보가 없거나 만료되었습니다.\nPOE2Deck의 Run Tasks를 다시 실행해주세요.",
+                "--width=300",
+            ],
+            check=False,
+        )
+        return 1
+
+    logger.info(f"게임 실행: {command[0]}")
+    # exec 후에는 atexit이 실행되지 않으므로 로그를 먼저 기록
+    shutdown_logging()
+    os.execvp(game_command[0], game_command)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import shutil
+import sys
+import uuid
+from typing import Dict, Iterator, List, Optional
+
+LOG_FILE = os.environ.get(
+    "POE2DECK_LOG_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.log"),
+)
+# POE2DECK_LOG_FORMAT: text(기본), json(JSON-lines)
+LOG_FORMAT = os.environ.get("POE2DECK_LOG_FORMAT", "text")
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 5
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] [%(run_id)s] %(name)s: %(message)s"
+READ_BLOCK_SIZE = 64 * 1024
+RUN_ID_RE = re.compile(r'\[([0-9a-f]{8})\] |"run_id": "([0-9a-f]{8})"')
+
+# 실행(프로세스) 하나를 구분하는 ID (run.sh에서 POE2DECK_RUN_ID로 전달 가능)
+RUN_ID = os.environ.get("POE2DECK_RUN_ID") or uuid.uuid4().hex[:8]
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RunIdFilter(logging.Filter):
+    """
+    모든 레코드에 run_id 추가
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = RUN_ID
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    레코드를 JSON 한 줄로 변환
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "run_id": getattr(record, "run_id", RUN_ID),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def setup_logging(
+    log_file: str = LOG_FILE, log_format: str = LOG_FORMAT
+) -> None:
+    """
+    루트 로거에 QueueHandler를 연결하고 회전/압축 파일 핸들러를 리스너 스레드에서 실행
+    여러 번 호출해도 한 번만 설정
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
+    file_handler.setFormatter(
+        JsonFormatter()
+        if log_format == "json"
+        else logging.Formatter(TEXT_FORMAT)
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RunIdFilter())
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    남은 로그를 기록하고 리스너 스레드 종료 (exec 전에 호출 필요)
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _reverse_lines(path: str) -> Iterator[bytes]:
+    """
+    파일 끝에서부터 블록 단위로 읽어 줄을 역순으로 반환
+    """
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        pos = file.tell()
+        rest = b""
+        while pos > 0:
+            size = min(READ_BLOCK_SIZE, pos)
+            pos -= size
+            file.seek(pos)
+            lines = (file.read(size) + rest).split(b"\n")
+            rest = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if rest:
+            yield rest
+
+
+def _iter_log_lines_reversed(log_file: str) -> Iterator[bytes]:
+    """
+    현재 로그 -> 회전된 로그(.1.gz, .2.gz, ...) 순으로 최신 줄부터 반환
+    """
+    if os.path.exists(log_file):
+        yield from _reverse_lines(log_file)
+    for i in range(1, LOG_BACKUP_COUNT + 1):
+        path = f"{log_file}.{i}.gz"
+        if not os.path.exists(path):
+            break
+        with gzip.open(path, "rb") as file:
+            yield from reversed(file.read().splitlines())
+
+
+def read_recent_runs(count: int, log_file: str = LOG_FILE) -> List[str]:
+    """
+    최근 count회 실행의 로그 줄을 시간순으로 반환 (파일 전체를 읽지 않음)
+    run_id가 없는 줄(여러 줄 예외 등)은 바로 앞 레코드에 포함
+    """
+    run_ids: Dict[str, None] = {}
+    lines: List[str] = []
+    pending: List[str] = []
+    for raw in _iter_log_lines_reversed(log_file):
+        line = raw.decode("utf-8", "replace")
+        match = RUN_ID_RE.search(line)
+        if match is None:
+            pending.append(line)
+            continue
+        run_id = match.group(1) or match.group(2)
+        if run_id not in run_ids:
+            if len(run_ids) == count:
+                break
+            run_ids[run_id] = None
+        lines.extend(pending)
+        pending = []
+        lines.append(line)
+    lines.reverse()
+    return lines
+
+
+if __name__ == "__main__":
+    # 최근 N회 실행의 로그 출력
+    if len(sys.argv) < 2 or sys.argv[1] != "tail":
+        print("사용법: python log.py tail [N]")
+        sys.exit(1)
+    for line in read_recent_runs(int(sys.argv[2]) if len(sys.argv) > 2 else 1):
+        print(line)
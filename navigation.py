@@ -0,0 +1,204 @@
+import itertools
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = 5
+
+_watchers: Dict[str, "NavigationWatcher"] = {}
+
+
+class NavigationWatcher:
+    """
+    Chrome DevTools Protocol 이벤트로 메인 프레임 URL 변경을 추적
+    """
+
+    def __init__(self, websocket_url: str):
+        self.websocket_url = websocket_url
+        self.current_url: Optional[str] = None
+        # (url, 감지 시각) - Page.frameNavigated / navigatedWithinDocument
+        self.commits: List[Tuple[str, float]] = []
+        # (url, 감지 시각) - Network.requestWillBeSent (Document 요청)
+        self.requests: List[Tuple[str, float]] = []
+        self._main_frame_id: Optional[str] = None
+        self._ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed
+
+    def start(self) -> None:
+        """
+        DevTools 웹소켓 연결 후 Page, Network 이벤트 구독
+        """
+        import websocket
+
+        self._ws = websocket.create_connection(
+            self.websocket_url,
+            timeout=CONNECT_TIMEOUT,
+            suppress_origin=True,
+        )
+        self._ws.settimeout(None)
+        for method in ("Page.enable", "Network.enable"):
+            self._ws.send(
+                json.dumps({"id": next(self._ids), "method": method})
+            )
+        self._thread = threading.Thread(
+            target=self._read_events, name="cdp-navigation", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+
+    def _read_events(self) -> None:
+        while True:
+            try:
+                message = json.loads(self._ws.recv())
+            except Exception:
+                break
+            received_at = time.monotonic()
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Page.frameNavigated":
+                frame = params.get("frame", {})
+                if frame.get("parentId"):
+                    continue
+                self._main_frame_id = frame.get("id")
+                self._record_commit(frame.get("url", ""), received_at)
+            elif method == "Page.navigatedWithinDocument":
+                if params.get("frameId") == self._main_frame_id:
+                    self._record_commit(params.get("url", ""), received_at)
+            elif method == "Network.requestWillBeSent":
+                if params.get("type") == "Document":
+                    url = params.get("request", {}).get("url", "")
+                    with self._cond:
+                        self.requests.append((url, received_at))
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _record_commit(self, url: str, received_at: float) -> None:
+        with self._cond:
+            self.current_url = url
+            self.commits.append((url, received_at))
+            self._cond.notify_all()
+
+    def wait_for(
+        self, target_url: Union[str, Tuple[str, ...]], timeout: float
+    ) -> bool:
+        """
+        현재 URL에 target_url(튜플이면 그중 하나)이 포함될 때까지 이벤트로 대기
+        """
+        target_urls = (
+            (target_url,) if isinstance(target_url, str) else target_url
+        )
+
+        def matches() -> bool:
+            return self.current_url is not None and any(
+                url in self.current_url for url in target_urls
+            )
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed or matches(), timeout)
+            return matches()
+
+    def get_event_times(
+        self, target_url: str
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        target_url의 최근 요청 시각과 커밋 시각 반환
+        """
+        with self._cond:
+            requested = next(
+                (t for url, t in reversed(self.requests) if target_url in url),
+                None,
+            )
+            committed = next(
+                (t for url, t in reversed(self.commits) if target_url in url),
+                None,
+            )
+        return requested, committed
+
+
+def _get_page_websocket_url(driver) -> Optional[str]:
+    """
+    드라이버가 제어 중인 탭의 DevTools 웹소켓 URL 반환
+    """
+    import urllib.request
+
+    address = driver.capabilities.get("goog:chromeOptions", {}).get(
+        "debuggerAddress"
+    )
+    if not address:
+        return None
+
+    with urllib.request.urlopen(
+        f"http://{address}/json/list", timeout=CONNECT_TIMEOUT
+    ) as response:
+        targets = json.load(response)
+
+    pages = [t for t in targets if t.get("type") == "page"]
+    handle = (driver.current_window_handle or "").upper()
+    for target in pages:
+        if target.get("id", "").upper() == handle:
+            return target.get("webSocketDebuggerUrl")
+    return pages[0].get("webSocketDebuggerUrl") if pages else None
+
+
+def attach_navigation_watcher(driver) -> Optional[NavigationWatcher]:
+    """
+    드라이버에 네비게이션 이벤트 감시자 연결 (실패 시 None, 폴링으로 동작)
+    """
+    try:
+        websocket_url = _get_page_websocket_url(driver)
+        if not websocket_url:
+            logger.warning("DevTools 주소를 찾지 못해 URL 폴링을 사용합니다.")
+            return None
+        watcher = NavigationWatcher(websocket_url)
+        watcher.start()
+    except Exception as e:
+        logger.warning(
+            f"DevTools 이벤트 구독 실패, URL 폴링을 사용합니다: {e}"
+        )
+        return None
+
+    _watchers[driver.session_id] = watcher
+    logger.info(f"DevTools 네비게이션 이벤트 구독 시작: {websocket_url}")
+    return watcher
+
+
+def get_navigation_watcher(driver) -> Optional[NavigationWatcher]:
+    """
+    드라이버에 연결된 네비게이션 감시자 반환
+    """
+    watcher = _watchers.get(getattr(driver, "session_id", None))
+    if watcher is not None and not watcher.alive:
+        return None
+    return watcher
+
+
+def detach_navigation_watcher(driver) -> None:
+    """
+    드라이버의 네비게이션 감시자 종료
+    """
+    watcher = _watchers.pop(getattr(driver, "session_id", None), None)
+    if watcher is not None:
+        watcher.close()
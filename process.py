@@ -0,0 +1,131 @@
+import logging
+import os
+import select
+import subprocess
+import time
+from typing import Callable, Iterable, List, Optional, Set
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+READY_POLL_INTERVAL = 0.05
+
+
+def find_processes(process_name: str) -> List[psutil.Process]:
+    """
+    이름이 일치하는 프로세스 목록 반환 (프로세스 테이블 1회 조회)
+    """
+    return [
+        process
+        for process in psutil.process_iter(attrs=["name"])
+        if process.info["name"] == process_name
+    ]
+
+
+def _wait_pidfds(pids: Iterable[int], timeout: float) -> Optional[Set[int]]:
+    """
+    pidfd로 프로세스 종료를 이벤트 방식으로 대기 후 살아있는 PID 반환
+    (pidfd를 지원하지 않으면 None)
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+
+    fds = {}
+    try:
+        for pid in pids:
+            try:
+                fds[os.pidfd_open(pid)] = pid
+            except ProcessLookupError:
+                continue
+    except OSError:
+        for fd in fds:
+            os.close(fd)
+        return None
+
+    poller = select.poll()
+    for fd in fds:
+        poller.register(fd, select.POLLIN)
+
+    alive = dict(fds)
+    deadline = time.monotonic() + timeout
+    try:
+        while alive:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                alive.pop(fd, None)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return set(alive.values())
+
+
+def wait_for_exit(processes: List[psutil.Process], timeout: float) -> bool:
+    """
+    지정한 프로세스가 모두 종료될 때까지 대기
+    """
+    alive = _wait_pidfds([p.pid for p in processes], timeout)
+    if alive is None:
+        _, still_alive = psutil.wait_procs(processes, timeout=timeout)
+        alive = {p.pid for p in still_alive}
+    return not alive
+
+
+def terminate_processes(
+    processes: List[psutil.Process], timeout: float
+) -> bool:
+    """
+    SIGTERM 전송 후 지정한 프로세스의 종료를 대기
+    """
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as e:
+            logger.error(f"프로세스 종료 권한이 없습니다: {process.pid} {e}")
+    return wait_for_exit(processes, timeout)
+
+
+def launch_detached(command: List[str]) -> subprocess.Popen:
+    """
+    현재 세션과 분리된 백그라운드 프로세스로 실행
+    """
+    return subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def wait_until(
+    probe: Callable[[], bool],
+    timeout: float,
+    interval: float = READY_POLL_INTERVAL,
+) -> bool:
+    """
+    probe가 True를 반환할 때까지 대기
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if probe():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def read_pid_file(path: str) -> Optional[int]:
+    """
+    PID 파일에서 PID 반환
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return int(file.read().strip())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,193 @@
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+from log import RUN_ID
+from util import get_cache_dir, load_json_file, save_json_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_EVERY = 1
+DEFAULT_PROFILE_TOP = 25
+PROFILE_DIR = "profiles"
+PROFILE_MAX_FILES = 40
+PROFILE_COUNTER_FILE = "counter.json"
+# 할당 위치별 호출 스택 깊이 (깊을수록 오버헤드 증가)
+TRACEMALLOC_FRAMES = 5
+
+_active = False
+
+
+def get_env_int(name: str, default: int) -> int:
+    """
+    정수 환경 변수 값 반환 (값이 올바르지 않으면 기본값)
+    """
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"{name} 값이 올바르지 않습니다.")
+        return default
+
+
+def get_profile_every() -> int:
+    """
+    측정 주기 반환 (POE2DECK_PROFILE_EVERY=N: N번째 실행마다 한 번만 측정)
+    """
+    return max(1, get_env_int("POE2DECK_PROFILE_EVERY", DEFAULT_PROFILE_EVERY))
+
+
+def get_profile_dir() -> str:
+    """
+    프로파일 결과 디렉토리 경로 반환 (없으면 생성)
+    """
+    profile_dir = os.path.join(get_cache_dir(), PROFILE_DIR)
+    os.makedirs(profile_dir, mode=0o700, exist_ok=True)
+    return profile_dir
+
+
+def is_sampled_run(every: Optional[int] = None) -> bool:
+    """
+    이번 실행을 측정할지 확인 (실행 횟수를 저장하여 every번째마다 True)
+    """
+    every = get_profile_every() if every is None else every
+    if every <= 1:
+        return True
+    path = os.path.join(get_profile_dir(), PROFILE_COUNTER_FILE)
+    counter = load_json_file(path)
+    runs = counter.get("runs", 0) + 1 if isinstance(counter, dict) else 1
+    try:
+        save_json_file(path, {"runs": runs})
+    except OSError as e:
+        logger.warning(f"프로파일 실행 횟수 저장 실패: {e}")
+    return runs % every == 0
+
+
+def _get_path(name: str, suffix: str) -> str:
+    return os.path.join(get_profile_dir(), f"{RUN_ID}-{name}{suffix}")
+
+
+def profile_call(name: str, func: Callable[..., Any], *args) -> Any:
+    """
+    측정 중이면 func를 cProfile로 감싸 실행하고 <run_id>-<name>.pstats 저장
+    (스레드마다 따로 호출 가능, 다른 프로파일러가 동작 중이면 그대로 실행)
+    """
+    if not _active:
+        return func(*args)
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Python 3.12+: 프로세스에서 동시에 하나의 프로파일러만 사용 가능
+        logger.info(f"{name}: 다른 프로파일러가 동작 중이라 측정 생략 ({e})")
+        return func(*args)
+    try:
+        return func(*args)
+    finally:
+        profiler.disable()
+        path = _get_path(name, ".pstats")
+        try:
+            profiler.dump_stats(path)
+            logger.info(f"프로파일 저장: {path}")
+        except OSError as e:
+            logger.warning(f"프로파일 저장 실패: {e}")
+
+
+def format_allocations(
+    snapshot: tracemalloc.Snapshot, top: Optional[int] = None
+) -> List[str]:
+    """
+    할당 크기 상위 top개 위치 (파일:줄, 크기, 횟수)
+    (기본값: POE2DECK_PROFILE_TOP)
+    """
+    if top is None:
+        top = get_env_int("POE2DECK_PROFILE_TOP", DEFAULT_PROFILE_TOP)
+    # 측정 도구 자체의 할당(pstats 저장 등)은 제외
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "*/cProfile.py"),
+            tracemalloc.Filter(False, "*/profile.py"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+    )
+    stats = snapshot.statistics("lineno")
+    lines = []
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size / 1024:10.1f} KiB {stat.count:8d}회  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+    rest = sum(stat.size for stat in stats[top:])
+    lines.append(f"{rest / 1024:10.1f} KiB  (나머지 {len(stats[top:])}곳)")
+    return lines
+
+
+def _write_allocation_report(task_name: str, duration: float) -> None:
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    lines = [
+        f"task: {task_name}",
+        f"run_id: {RUN_ID}",
+        f"duration: {duration:.3f}s",
+        f"current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB",
+        "",
+        *format_allocations(snapshot),
+    ]
+    path = _get_path(task_name, "-alloc.txt")
+    try:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        logger.info(
+            f"메모리 할당 보고서 저장: {path} (최대 {peak / 1024 / 1024:.1f}MiB)"
+        )
+    except OSError as e:
+        logger.warning(f"메모리 할당 보고서 저장 실패: {e}")
+
+
+def _remove_old_profiles() -> None:
+    files = sorted(
+        (
+            entry
+            for entry in os.scandir(get_profile_dir())
+            if entry.is_file() and entry.name != PROFILE_COUNTER_FILE
+        ),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in files[:-PROFILE_MAX_FILES]:
+        os.remove(entry.path)
+
+
+def run_profiled(
+    task_name: str, func: Callable[[], Any], threaded: bool = False
+) -> Any:
+    """
+    태스크를 cProfile, tracemalloc으로 측정하며 실행 (샘플링에서 빠지면 그대로 실행)
+    결과: <캐시>/profiles/<run_id>-<이름>.pstats, <run_id>-<태스크>-alloc.txt
+    threaded: 태스크가 작업을 워커 스레드에서 실행하면 True
+    (메인 스레드 대신 각 스레드에서 profile_call()로 측정)
+    """
+    global _active
+    if not is_sampled_run():
+        logger.info(f"프로파일링 생략 ({get_profile_every()}회마다 측정)")
+        return func()
+
+    logger.info(f"프로파일링 시작: {task_name}")
+    _active = True
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    start = time.perf_counter()
+    try:
+        if threaded:
+            return func()
+        return profile_call(task_name, func)
+    finally:
+        _active = False
+        _write_allocation_report(task_name, time.perf_counter() - start)
+        tracemalloc.stop()
+        _remove_old_profiles()
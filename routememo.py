@@ -0,0 +1,140 @@
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from util import get_cache_dir, load_json_file, save_json_file
+
+logger = logging.getLogger(__name__)
+
+ROUTE_MEMO_FILE = "auth_route.json"
+# 쿠키 만료 시각을 알 수 없을 때 메모를 믿는 최대 시간
+ROUTE_MEMO_TTL = 12 * 60 * 60
+# 쿠키 만료까지 남은 시간이 이보다 짧으면 전체 경로 사용
+COOKIE_EXPIRY_MARGIN = 5 * 60
+ROUTE_HISTORY_SIZE = 20
+
+# 지난 실행에서 token을 받기까지 거친 경로
+ROUTE_PASS = "pass"
+ROUTE_KAKAO_LOGIN = "kakao_login"
+ROUTE_SECURITY_CENTER = "security_center"
+
+
+def get_route_memo_path() -> str:
+    """
+    인증 경로 메모 파일 경로 반환
+    """
+    return os.path.join(get_cache_dir(), ROUTE_MEMO_FILE)
+
+
+def load_route_memo() -> Dict[str, Any]:
+    """
+    인증 경로 메모 반환 (없거나 손상된 경우 빈 메모)
+    """
+    memo = load_json_file(get_route_memo_path())
+    return memo if isinstance(memo, dict) else {}
+
+
+def get_valid_route(memo: Dict[str, Any]) -> Optional[str]:
+    """
+    지난 실행의 세션이 아직 유효하면 그 경로 반환 (authorize 단계 생략 가능)
+    """
+    route = memo.get("route")
+    if route is None:
+        logger.info("경로 메모 미스: 이전 성공 기록 없음")
+        return None
+
+    now = time.time()
+    age = now - memo.get("updated_at", 0)
+    if age < 0 or age > ROUTE_MEMO_TTL:
+        logger.info(f"경로 메모 미스: 만료됨 ({age:.0f}초 전 기록)")
+        return None
+
+    cookie_expires = memo.get("cookie_expires")
+    if cookie_expires is not None and cookie_expires - now < (
+        COOKIE_EXPIRY_MARGIN
+    ):
+        logger.info("경로 메모 미스: 로그인 쿠키 만료 임박")
+        return None
+
+    logger.info(f"경로 메모 적중: 이전 경로 {route} ({age:.0f}초 전 기록)")
+    return route
+
+
+def get_cookie_expiry(cookies: Iterable[Dict[str, Any]]) -> Optional[float]:
+    """
+    로그인 쿠키(httpOnly, 만료 시각 있음) 중 가장 빠른 만료 시각
+    """
+    expiries = [
+        cookie["expiry"]
+        for cookie in cookies
+        if cookie.get("httpOnly") and cookie.get("expiry")
+    ]
+    return min(expiries) if expiries else None
+
+
+def get_hit_rate(memo: Dict[str, Any]) -> Optional[float]:
+    """
+    메모를 조회한 실행 중 authorize 단계를 생략하고 성공한 비율
+    """
+    stats = memo.get("stats", {})
+    lookups = stats.get("lookups", 0)
+    return stats.get("hits", 0) / lookups if lookups else None
+
+
+def save_route_result(
+    memo: Dict[str, Any],
+    route: Optional[str],
+    navigations: int,
+    cookie_expires: Optional[float] = None,
+    lookup: bool = False,
+    hit: bool = False,
+) -> None:
+    """
+    이번 실행의 경로와 통계 저장 (실패하면 route=None으로 메모 무효화)
+    lookup: 메모를 조회했는지, hit: 메모대로 authorize 단계를 생략하고 성공했는지
+    """
+    stats = memo.setdefault("stats", {"lookups": 0, "hits": 0})
+    if lookup:
+        stats["lookups"] = stats.get("lookups", 0) + 1
+        stats["hits"] = stats.get("hits", 0) + int(hit)
+    history: List[Dict[str, Any]] = memo.setdefault("history", [])
+    history.append(
+        {
+            "time": time.time(),
+            "route": route,
+            "lookup": lookup,
+            "hit": hit,
+            "navigations": navigations,
+        }
+    )
+    del history[:-ROUTE_HISTORY_SIZE]
+    memo.update(
+        route=route, cookie_expires=cookie_expires, updated_at=time.time()
+    )
+
+    try:
+        save_json_file(get_route_memo_path(), memo, mode=0o600)
+    except OSError as e:
+        logger.warning(f"경로 메모 저장 실패: {e}")
+
+    hit_rate = get_hit_rate(memo)
+    logger.info(
+        f"인증 경로: {route or '실패'}, 페이지 이동 {navigations}회, "
+        + (
+            f"메모 적중률 {hit_rate * 100:.0f}% "
+            f"({stats['hits']}/{stats['lookups']})"
+            if hit_rate is not None
+            else "메모 조회 기록 없음"
+        )
+    )
+
+
+def clear_route_memo() -> None:
+    """
+    인증 경로 메모 삭제
+    """
+    try:
+        os.remove(get_route_memo_path())
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,197 @@
+import fnmatch
+import glob
+import logging
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import vdf
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDES = (
+    "shadercache",
+    ".cache",
+    "node_modules",
+    "Trash",
+    ".Trash-*",
+)
+DEFAULT_MAX_DEPTH = 16
+# 같은 저장 장치는 스레드를 늘려도 디렉토리 읽기가 빨라지지 않는 경우가 많아
+# 기본은 루트가 있는 저장 장치(내장 저장소, SD 카드 등)마다 한 스레드
+# (bench.py file_search로 기기별 비교 후 workers 인자로 변경)
+DEFAULT_WORKERS: Optional[int] = None
+SD_CARD_MOUNT_ROOT = "/run/media"
+SD_CARD_MOUNT_GLOBS = (
+    os.path.join(SD_CARD_MOUNT_ROOT, "*"),
+    os.path.join(SD_CARD_MOUNT_ROOT, "*", "*"),
+)
+
+
+def _compile_excludes(excludes: Iterable[str]):
+    """
+    제외 패턴을 (고정 이름 집합, 와일드카드 정규식)으로 변환
+    """
+    names = set()
+    wildcards = []
+    for pattern in excludes:
+        if any(ch in pattern for ch in "*?["):
+            wildcards.append(fnmatch.translate(pattern))
+        else:
+            names.add(pattern)
+    regex = re.compile("|".join(wildcards)) if wildcards else None
+    return frozenset(names), regex
+
+
+def get_steam_library_paths(steam_root: str) -> List[str]:
+    """
+    libraryfolders.vdf에 등록된 Steam 라이브러리 경로 반환
+    """
+    paths = [steam_root]
+    library_file = os.path.join(steam_root, "steamapps", "libraryfolders.vdf")
+    try:
+        with open(library_file, "r", encoding="utf-8") as file:
+            folders = vdf.load(file).get("libraryfolders", {})
+    except (OSError, SyntaxError) as e:
+        logger.warning(f"libraryfolders.vdf 읽기 실패: {e}")
+        return paths
+
+    for folder in folders.values():
+        path = folder.get("path") if isinstance(folder, dict) else None
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def get_search_roots(home: str = "/home/deck") -> List[str]:
+    """
+    실행 파일이 있을 가능성이 높은 순서대로 검색 루트 반환
+    """
+    steam_root = os.path.join(home, ".local", "share", "Steam")
+    roots = []
+    for library in get_steam_library_paths(steam_root):
+        roots.extend(
+            sorted(
+                glob.glob(
+                    os.path.join(
+                        library,
+                        "steamapps",
+                        "compatdata",
+                        "*",
+                        "pfx",
+                        "drive_c",
+                    )
+                )
+            )
+        )
+    for pattern in SD_CARD_MOUNT_GLOBS:
+        roots.extend(p for p in sorted(glob.glob(pattern)) if os.path.isdir(p))
+    roots.append(home)
+    return roots
+
+
+def search_file(
+    file_name: str,
+    roots: Iterable[str],
+    excludes: Iterable[str] = DEFAULT_EXCLUDES,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> Optional[str]:
+    """
+    여러 루트를 스레드 풀로 동시에 검색하여 처음 찾은 파일 경로를 반환
+    (workers가 None이면 저장 장치마다 한 스레드, 각 스레드는 자기 장치를 먼저 검색)
+    """
+    excluded_names, excluded_regex = _compile_excludes(excludes)
+
+    # 저장 장치(st_dev)별 대기열 (하위 디렉토리는 상위와 같은 장치로 간주)
+    pending: Dict[int, Deque[Tuple[str, int]]] = {}
+    visited = set()
+    lock = threading.Lock()
+    cond = threading.Condition(lock)
+    state = {"active": 0, "found": None}
+
+    for root in roots:
+        root = os.path.realpath(root)
+        if root not in visited and os.path.isdir(root):
+            visited.add(root)
+            pending.setdefault(os.stat(root).st_dev, deque()).append((root, 0))
+
+    devices = list(pending)
+    if workers is None:
+        workers = len(devices)
+    workers = max(1, workers)
+    logger.info(
+        f"{file_name} 검색 시작: 루트={list(visited)}, "
+        f"저장 장치 {len(devices)}개, 스레드 {workers}개"
+    )
+
+    def take(device: Optional[int]):
+        # 자기 장치의 대기열이 비면 다른 장치의 작업을 가져옴
+        if pending.get(device):
+            return device, pending[device].popleft()
+        for other, queue in pending.items():
+            if queue:
+                return other, queue.popleft()
+        return None
+
+    def worker(index: int) -> None:
+        own_device = devices[index % len(devices)] if devices else None
+        while True:
+            with cond:
+                while (
+                    not any(pending.values())
+                    and state["active"]
+                    and not state["found"]
+                ):
+                    cond.wait()
+                task = None if state["found"] else take(own_device)
+                if task is None:
+                    cond.notify_all()
+                    return
+                device, (path, depth) = task
+                state["active"] += 1
+
+            subdirs = []
+            hit = None
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < max_depth and not (
+                                name in excluded_names
+                                or (
+                                    excluded_regex is not None
+                                    and excluded_regex.match(name)
+                                )
+                            ):
+                                subdirs.append(entry.path)
+                        elif name == file_name and entry.is_file():
+                            hit = entry.path
+                            break
+            except OSError:
+                pass
+            finally:
+                with cond:
+                    state["active"] -= 1
+                    if hit and not state["found"]:
+                        state["found"] = hit
+                    elif not state["found"]:
+                        for subdir in subdirs:
+                            if subdir not in visited:
+                                visited.add(subdir)
+                                pending[device].append((subdir, depth + 1))
+                    cond.notify_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index in range(workers):
+            executor.submit(worker, index)
+
+    if state["found"]:
+        logger.info(f"파일 찾음: {state['found']}")
+    else:
+        logger.info(f"{file_name} 파일을 찾지 못했습니다.")
+    return state["found"]
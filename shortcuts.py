@@ -0,0 +1,365 @@
+import logging
+import os
+import re
+import struct
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TYPE_MAP = 0x00
+TYPE_STRING = 0x01
+TYPE_INT32 = 0x02
+TYPE_END = 0x08
+
+# 필드 하나(또는 맵 시작/끝)를 정규식 매치 한 번으로 해석
+# 그룹: 1=문자열, 2=4바이트 값, 3=8바이트 값, 4=맵 시작, 없음=맵 끝
+FIELD_RE = re.compile(
+    rb"\x01([^\x00]*)\x00[^\x00]*\x00"
+    rb"|[\x02\x03\x04\x06]([^\x00]*)\x00.{4}"
+    rb"|[\x07\x0a]([^\x00]*)\x00.{8}"
+    rb"|\x00([^\x00]*)\x00"
+    rb"|[\x08\x0b]",
+    re.DOTALL,
+)
+
+
+class ShortcutField(NamedTuple):
+    """
+    shortcuts.vdf 항목 필드의 위치 (start ~ end: 타입, 키, 값 전체)
+    """
+
+    key: bytes
+    type: int
+    start: int
+    end: int
+
+    @property
+    def value_start(self) -> int:
+        return self.start + len(self.key) + 2
+
+
+class ShortcutRecord:
+    """
+    shortcuts.vdf 항목 하나
+    인덱스에 쓰이는 필드만 바로 디코딩하고, 나머지(tags 등)는 필요할 때 디코딩
+    """
+
+    __slots__ = (
+        "key",
+        "start",
+        "end",
+        "fields",
+        "appid",
+        "appname",
+        "exe",
+        "start_dir",
+        "_data",
+    )
+
+    def __init__(
+        self,
+        data: bytes,
+        key: str,
+        start: int,
+        end: int,
+        fields: Dict[bytes, Tuple[int, int]],
+    ):
+        self._data = data
+        self.key = key
+        self.start = start
+        self.end = end
+        self.fields = fields
+        appid = self.get("appid")
+        self.appid = appid & 0xFFFFFFFF if isinstance(appid, int) else None
+        self.appname = self.get("appname") or ""
+        self.exe = self.get("exe") or ""
+        self.start_dir = self.get("StartDir") or ""
+
+    def get(self, name: str) -> Any:
+        """
+        필드 값 디코딩 (없으면 None)
+        """
+        field = self.field(name)
+        if field is None:
+            return None
+        return _decode_value(self._data, field)
+
+    def field(self, name: str) -> Optional[ShortcutField]:
+        """
+        필드 위치 반환 (없으면 None)
+        """
+        span = self.fields.get(name.lower().encode("utf-8"))
+        if span is None:
+            return None
+        start, end = span
+        key = self._data[start + 1 : self._data.index(b"\x00", start + 1)]
+        return ShortcutField(key, self._data[start], start, end)
+
+    @property
+    def tags(self) -> Dict[str, Any]:
+        return self.get("tags") or {}
+
+    @property
+    def exe_name(self) -> str:
+        return get_exe_name(self.exe)
+
+
+def get_exe_name(exe: str) -> str:
+    """
+    따옴표로 감싼 Exe 경로에서 실행 파일명만 반환
+    """
+    return os.path.basename(exe.strip().strip('"')).lower()
+
+
+def _decode_value(data: bytes, field: ShortcutField) -> Any:
+    if field.type == TYPE_STRING:
+        return data[field.value_start : field.end - 1].decode(
+            "utf-8", "replace"
+        )
+    if field.type == TYPE_INT32:
+        return struct.unpack_from("<i", data, field.value_start)[0]
+    if field.type == TYPE_MAP:
+        return _decode_map(data, field.value_start, field.end - 1)
+    return data[field.value_start : field.end]
+
+
+def _decode_map(data: bytes, pos: int, end: int) -> Dict[str, Any]:
+    """
+    중첩 맵(tags 등)을 dict로 디코딩
+    """
+    result = {}
+    while pos < end:
+        match = FIELD_RE.match(data, pos)
+        if match is None or match.lastindex is None:
+            raise SyntaxError(f"바이너리 VDF 해석 실패 ({pos})")
+        key = match.group(match.lastindex)
+        if match.lastindex == 4:
+            child_end = _find_map_end(data, match.end())
+            field = ShortcutField(key, TYPE_MAP, pos, child_end)
+            pos = child_end
+        else:
+            field = ShortcutField(key, data[pos], pos, match.end())
+            pos = match.end()
+        result[key.decode("utf-8", "replace")] = _decode_value(data, field)
+    return result
+
+
+def _find_map_end(data: bytes, pos: int) -> int:
+    """
+    맵 본문 시작 위치에서 종료 바이트 다음 위치 반환
+    """
+    depth = 1
+    for match in FIELD_RE.finditer(data, pos):
+        if match.start() != pos:
+            break
+        pos = match.end()
+        if match.lastindex is None:
+            depth -= 1
+            if depth == 0:
+                return pos
+        elif match.lastindex == 4:
+            depth += 1
+    raise SyntaxError(f"바이너리 VDF 해석 실패 ({pos})")
+
+
+def parse_shortcuts(data: bytes) -> Tuple[List[ShortcutRecord], int]:
+    """
+    shortcuts.vdf의 각 항목 위치를 해석
+    반환값: (항목 목록, 새 항목을 삽입할 위치)
+    """
+    match = FIELD_RE.match(data)
+    if match is None or match.lastindex != 4:
+        raise SyntaxError("shortcuts.vdf 형식이 아닙니다.")
+    if match.group(4).lower() != b"shortcuts":
+        raise SyntaxError(f"예상치 못한 루트 키: {match.group(4)!r}")
+
+    entries = []
+    fields: Dict[bytes, Tuple[int, int]] = {}
+    entry_key = b""
+    entry_start = map_start = 0
+    depth = 1
+    pos = match.end()
+    for match in FIELD_RE.finditer(data, pos):
+        if match.start() != pos:
+            break
+        start, pos = match.span()
+        group = match.lastindex
+        if group is None:
+            depth -= 1
+            if depth == 2:
+                key = data[map_start + 1 : data.index(b"\x00", map_start + 1)]
+                fields[key.lower()] = (map_start, pos)
+            elif depth == 1:
+                entries.append(
+                    ShortcutRecord(
+                        data,
+                        entry_key.decode("utf-8", "replace"),
+                        entry_start,
+                        pos,
+                        fields,
+                    )
+                )
+            elif depth == 0:
+                return entries, start
+        elif group == 4:
+            depth += 1
+            if depth == 2:
+                entry_key, entry_start, fields = match.group(4), start, {}
+            elif depth == 3:
+                map_start = start
+        elif depth == 2:
+            fields[match.group(group).lower()] = (start, pos)
+    raise SyntaxError(f"바이너리 VDF 해석 실패 ({pos})")
+
+
+def encode_field(key: str, value: Any) -> bytes:
+    """
+    필드 하나를 바이너리 VDF로 인코딩 (str, int, dict 지원)
+    """
+    encoded_key = key.encode("utf-8") + b"\x00"
+    if isinstance(value, dict):
+        body = b"".join(encode_field(k, v) for k, v in value.items())
+        return bytes([TYPE_MAP]) + encoded_key + body + bytes([TYPE_END])
+    if isinstance(value, int):
+        return bytes([TYPE_INT32]) + encoded_key + struct.pack("<i", value)
+    return (
+        bytes([TYPE_STRING])
+        + encoded_key
+        + str(value).encode("utf-8")
+        + b"\x00"
+    )
+
+
+def apply_splices(
+    data: bytes, splices: Iterable[Tuple[int, int, bytes]]
+) -> bytes:
+    """
+    (시작, 끝, 새 바이트) 목록을 적용, 나머지 바이트는 그대로 유지
+    """
+    pieces = []
+    pos = 0
+    for start, end, replacement in sorted(splices, key=lambda s: s[:2]):
+        pieces.append(data[pos:start])
+        pieces.append(replacement)
+        pos = end
+    pieces.append(data[pos:])
+    return b"".join(pieces)
+
+
+def patch_entry_splices(
+    entry: ShortcutRecord, changes: Dict[str, Any]
+) -> List[Tuple[int, int, bytes]]:
+    """
+    항목의 변경된 필드만 교체(없으면 항목 끝에 추가)하는 splice 목록 생성
+    """
+    splices = []
+    for name, value in changes.items():
+        field = entry.field(name)
+        if field is not None:
+            key = field.key.decode("utf-8", "replace")
+            splices.append((field.start, field.end, encode_field(key, value)))
+        else:
+            # 항목의 종료 바이트(0x08) 앞에 추가
+            splices.append(
+                (entry.end - 1, entry.end - 1, encode_field(name, value))
+            )
+    return splices
+
+
+def append_entry_splice(
+    insert_pos: int, key: str, entry: Dict[str, Any]
+) -> Tuple[int, int, bytes]:
+    """
+    shortcuts 맵 끝에 새 항목을 추가하는 splice 생성
+    """
+    return insert_pos, insert_pos, encode_field(key, entry)
+
+
+class ShortcutIndex:
+    """
+    shortcuts.vdf 항목을 appname, 실행 파일명, appid로 조회하는 인덱스
+    """
+
+    __slots__ = (
+        "data",
+        "records",
+        "insert_pos",
+        "by_appname",
+        "by_exe",
+        "by_appid",
+        "next_key",
+        "pending",
+    )
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.records, self.insert_pos = parse_shortcuts(data)
+        self.by_appname: Dict[str, ShortcutRecord] = {}
+        self.by_exe: Dict[str, ShortcutRecord] = {}
+        self.by_appid: Dict[int, ShortcutRecord] = {}
+        self.pending: List[Tuple[int, int, bytes]] = []
+        self.next_key = 0
+        for record in self.records:
+            self._index(record)
+
+    def _index(self, record: ShortcutRecord) -> None:
+        # 같은 값이 여러 개면 파일에서 먼저 나온 항목 우선
+        self.by_appname.setdefault(record.appname, record)
+        self.by_exe.setdefault(record.exe_name, record)
+        if record.appid is not None:
+            self.by_appid.setdefault(record.appid, record)
+        if record.key.isdigit():
+            self.next_key = max(self.next_key, int(record.key) + 1)
+
+    def find(
+        self,
+        game_name: Optional[str] = None,
+        exe_name: Optional[str] = None,
+        appid: Optional[int] = None,
+    ) -> Optional[ShortcutRecord]:
+        """
+        appname -> 실행 파일명 -> appid 순으로 조회
+        """
+        if game_name is not None and game_name in self.by_appname:
+            return self.by_appname[game_name]
+        if exe_name is not None and exe_name.lower() in self.by_exe:
+            return self.by_exe[exe_name.lower()]
+        if appid is not None:
+            return self.by_appid.get(appid & 0xFFFFFFFF)
+        return None
+
+    def allocate_key(self) -> str:
+        """
+        기존 항목과 겹치지 않는 새 항목 키 (최대 숫자 키 + 1)
+        """
+        key = str(self.next_key)
+        self.next_key += 1
+        return key
+
+    def add(self, entry: Dict[str, Any]) -> ShortcutRecord:
+        """
+        새 항목 추가 예약 (apply() 시 shortcuts 맵 끝에 기록)
+        """
+        key = self.allocate_key()
+        self.pending.append(append_entry_splice(self.insert_pos, key, entry))
+        record = ShortcutRecord(b"", key, self.insert_pos, self.insert_pos, {})
+        values = {name.lower(): value for name, value in entry.items()}
+        record.appname = values.get("appname", "")
+        record.exe = values.get("exe", "")
+        record.start_dir = values.get("startdir", "")
+        appid = values.get("appid")
+        record.appid = appid & 0xFFFFFFFF if isinstance(appid, int) else None
+        self._index(record)
+        return record
+
+    def patch(self, record: ShortcutRecord, changes: Dict[str, Any]) -> None:
+        """
+        기존 항목의 필드 변경 예약
+        """
+        self.pending.extend(patch_entry_splices(record, changes))
+
+    def apply(self) -> bytes:
+        """
+        예약된 변경을 적용한 새 파일 내용
+        """
+        return apply_splices(self.data, self.pending)
@@ -1,23 +1,83 @@
 import logging
 import os
 import subprocess
+import threading
 import time
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set
 
 import psutil
-import vdf
 
-from util import is_command_available
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="tasks.log",
-    filemode="a",
-    encoding="utf-8",
+from process import (
+    find_processes,
+    launch_detached,
+    read_pid_file,
+    terminate_processes,
+    wait_until,
+)
+from shortcuts import ShortcutIndex
+from search import search_file, get_search_roots, SD_CARD_MOUNT_ROOT
+from timing import span, timed
+from vdfscan import find_text_vdf_value
+from util import (
+    get_cache_dir,
+    load_json_file,
+    save_json_file,
+    write_file_atomic,
 )
+
 logger = logging.getLogger(__name__)
 
+STEAM_PROCESS_NAME = "steam"
+STEAM_COMMAND = ["steam"]
+STEAM_PID_FILE = "~/.steam/steam.pid"
+STEAM_TIMEOUT = 30
+LOCATION_CACHE_FILE = "location_cache.json"
+LOCATION_CACHE_MAX_DIRS = 5
+PERSONA_CACHE_FILE = "persona_cache.json"
+PERSONA_KEY_PATH = ("UserLocalConfigStore", "friends", "PersonaName")
+PERSONA_WORKERS = 4
+SHORTCUTS_BACKUPS = 1
+SHORTCUTS_WORKERS = 4
+GAME_SEARCH_PATH = "/home/deck"
+
+_persona_cache_lock = threading.Lock()
+# 여러 유저를 동시에 업데이트할 때 실행 파일 검색은 한 번만 (나머지는 캐시 사용)
+_exe_search_lock = threading.Lock()
+
+
+def read_persona_name(localconfig_path: str) -> Optional[str]:
+    """
+    localconfig.vdf에서 PersonaName을 읽음 ((경로, mtime, size) 기준 캐시 사용)
+    """
+    stat = os.stat(localconfig_path)
+    cache_path = os.path.join(get_cache_dir(), PERSONA_CACHE_FILE)
+    with _persona_cache_lock:
+        cache = load_json_file(cache_path) or {}
+    entry = cache.get(localconfig_path)
+    if (
+        entry
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("size") == stat.st_size
+    ):
+        logger.debug(f"PersonaName 캐시 적중: {localconfig_path}")
+        return entry.get("persona")
+
+    with span("steam.localconfig_parse", size=stat.st_size):
+        persona_name = find_text_vdf_value(localconfig_path, PERSONA_KEY_PATH)
+    with _persona_cache_lock:
+        cache = load_json_file(cache_path) or {}
+        cache[localconfig_path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "persona": persona_name,
+        }
+        try:
+            save_json_file(cache_path, cache)
+        except OSError as e:
+            logger.warning(f"PersonaName 캐시 저장 실패: {e}")
+    return persona_name
+
 
 def get_steam_user_personas(
     steam_userdata_path: str = "~/.steam/steam/userdata",
@@ -34,8 +94,7 @@ def get_steam_user_personas(
             f"Steam userdata 파일을 찾지 못했습니다.: {steam_userdata_path}"
         )
 
-    user_personas = {}
-
+    localconfig_paths = {}
     for user_id in os.listdir(steam_userdata_path):
         user_dir = os.path.join(steam_userdata_path, user_id)
         if os.path.isdir(user_dir) and user_id.isdigit():
@@ -43,23 +102,31 @@ def get_steam_user_personas(
                 user_dir, "config", "localconfig.vdf"
             )
             if os.path.exists(localconfig_path):
-                try:
-                    with open(localconfig_path, "r", encoding="utf-8") as file:
-                        localconfig = vdf.load(file)
-                        persona_name = (
-                            localconfig.get("UserLocalConfigStore", {})
-                            .get("friends")
-                            .get("PersonaName")
-                        )
-                        if persona_name:
-                            user_personas[user_id] = persona_name
-                            logger.info(f"{user_id}: {persona_name} 발견")
-                        else:
-                            logger.warning(f"{user_id} 미발견")
-                except Exception as e:
-                    logger.error(
-                        f"{user_id}에 해당하는 localconfig.vdf를 찾지 못했습니다 : {e}"
-                    )
+                localconfig_paths[user_id] = localconfig_path
+
+    user_personas = {}
+    if not localconfig_paths:
+        return user_personas
+
+    with ThreadPoolExecutor(
+        max_workers=min(PERSONA_WORKERS, len(localconfig_paths))
+    ) as executor:
+        futures = {
+            user_id: executor.submit(read_persona_name, path)
+            for user_id, path in localconfig_paths.items()
+        }
+        for user_id, future in futures.items():
+            try:
+                persona_name = future.result()
+                if persona_name:
+                    user_personas[user_id] = persona_name
+                    logger.info(f"{user_id}: {persona_name} 발견")
+                else:
+                    logger.warning(f"{user_id} 미발견")
+            except Exception as e:
+                logger.error(
+                    f"{user_id}에 해당하는 localconfig.vdf를 찾지 못했습니다 : {e}"
+                )
 
     return user_personas
 
@@ -80,22 +147,175 @@ def find_file_path(file_name: str, search_path: str = "/") -> Optional[str]:
     """
     try:
         logger.info(f"{search_path} 하위에서 {file_name}을 찾습니다...")
-        for root, dirs, files in os.walk(search_path):
-            dirs[:] = [
-                d
-                for d in dirs
-                if not os.path.join(root, d).startswith(
-                    os.path.expanduser("~/.local/share/Trash")
-                )
-            ]
-            if file_name in files:
-                logger.info(f"파일 찾음: {os.path.join(root, file_name)}")
-                return os.path.join(root, file_name)
+        return search_file(file_name, [search_path])
     except Exception as e:
         logger.error(f"서칭하는데 에러가 발생했습니다 {file_name}: {e}")
     return None
 
 
+def get_location_cache_path() -> str:
+    """
+    파일 위치 캐시 경로 반환
+    """
+    return os.path.join(get_cache_dir(), LOCATION_CACHE_FILE)
+
+
+def _get_file_signature(path: str) -> Optional[Dict[str, int]]:
+    """
+    캐시 검증에 사용할 파일의 inode, mtime, size 반환
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+    return {
+        "ino": stat.st_ino,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def _is_under(path: str, roots: List[str]) -> bool:
+    """
+    path가 roots 중 하나의 하위 경로인지 확인
+    """
+    path = os.path.abspath(path)
+    for root in roots:
+        root = os.path.abspath(root)
+        if os.path.commonpath([path, root]) == root:
+            return True
+    return False
+
+
+def get_cached_file_path(file_name: str, roots: List[str]) -> Optional[str]:
+    """
+    캐시된 파일 위치를 검증 후 반환 (전체 검색 없이 stat만 수행)
+    """
+    cache = load_json_file(get_location_cache_path()) or {}
+    entry: Dict[str, Any] = cache.get(file_name)
+    if not entry:
+        logger.info(f"{file_name} 위치 캐시 미스")
+        return None
+
+    cached_path = entry.get("path")
+    if cached_path and _is_under(cached_path, roots):
+        signature = _get_file_signature(cached_path)
+        if signature is not None and all(
+            signature[key] == entry.get(key) for key in signature
+        ):
+            logger.info(f"{file_name} 위치 캐시 적중: {cached_path}")
+            return cached_path
+
+    # 파일이 갱신되었거나 이동한 경우, 이전에 발견된 디렉토리만 다시 확인
+    for directory in entry.get("dirs", []):
+        candidate = os.path.join(directory, file_name)
+        if _is_under(candidate, roots) and _get_file_signature(candidate):
+            logger.info(f"{file_name} 위치 캐시 갱신: {candidate}")
+            save_file_location(file_name, candidate)
+            return candidate
+
+    logger.info(f"{file_name} 위치 캐시가 유효하지 않습니다.")
+    return None
+
+
+def save_file_location(file_name: str, path: str) -> None:
+    """
+    파일 위치와 검증 정보를 캐시에 저장
+    """
+    signature = _get_file_signature(path)
+    if signature is None:
+        return
+
+    cache_path = get_location_cache_path()
+    cache = load_json_file(cache_path) or {}
+    previous = cache.get(file_name) or {}
+
+    directory = os.path.dirname(os.path.abspath(path))
+    dirs = [directory] + [
+        d for d in previous.get("dirs", []) if d != directory
+    ]
+    cache[file_name] = {
+        "path": os.path.abspath(path),
+        **signature,
+        "dirs": dirs[:LOCATION_CACHE_MAX_DIRS],
+    }
+    try:
+        save_json_file(cache_path, cache)
+    except OSError as e:
+        logger.warning(f"파일 위치 캐시 저장 실패: {e}")
+
+
+@timed("steam.exe_search")
+def find_file_path_cached(
+    file_name: str,
+    search_path: str = "/",
+    roots: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    위치 캐시를 먼저 확인하고, 유효하지 않을 때만 파일 검색
+    """
+    # 캐시 검증에는 루트 목록 계산(glob)이 필요 없도록 상위 경로만 사용
+    path = get_cached_file_path(
+        file_name, roots or [search_path, SD_CARD_MOUNT_ROOT]
+    )
+    if path:
+        return path
+
+    roots = roots or get_search_roots(search_path)
+    try:
+        path = search_file(file_name, roots)
+    except Exception as e:
+        logger.error(f"서칭하는데 에러가 발생했습니다 {file_name}: {e}")
+        return None
+    if path:
+        save_file_location(file_name, path)
+    return path
+
+
+def prefetch_game_location(
+    steam_user_ids: List[str], game_name: str = "Path of Exile 2"
+) -> Optional[str]:
+    """
+    게임이 등록되지 않은 유저가 있으면 실행 파일 위치를 미리 검색하여 캐시에 저장
+    (token이 필요 없으므로 인증과 동시에 실행 가능)
+    """
+    for steam_user_id in steam_user_ids:
+        try:
+            with open(get_shortcuts_vdf_path(steam_user_id), "rb") as file:
+                index = ShortcutIndex(file.read())
+        except (OSError, SyntaxError):
+            continue
+        if index.find(game_name, "PathOfExile_x64_KG.exe") is None:
+            logger.debug(
+                f"{steam_user_id}: 게임 미등록, 실행 파일 위치 미리 검색"
+            )
+            with _exe_search_lock:
+                return find_file_path_cached(
+                    "PathOfExile_x64_KG.exe", search_path=GAME_SEARCH_PATH
+                )
+    return None
+
+
+def get_launch_options(
+    file_path: str, game_name: str = "Path of Exile 2"
+) -> Optional[str]:
+    """
+    shortcuts.vdf에 등록된 게임의 현재 Launch Options 반환 (없으면 None)
+    """
+    try:
+        with open(file_path, "rb") as file:
+            index = ShortcutIndex(file.read())
+    except (OSError, SyntaxError) as e:
+        logger.warning(f"shortcuts.vdf 읽기 실패: {e}")
+        return None
+    entry = index.find(game_name, "PathOfExile_x64_KG.exe")
+    if entry is None:
+        return None
+    return entry.get("LaunchOptions")
+
+
 def update_shortcuts(
     file_path: str = None,
     game_name: str = "Path of Exile 2",
@@ -116,40 +336,35 @@ def update_shortcuts(
 
     try:
         with open(file_path, "rb") as file:
-            shortcuts = vdf.binary_load(file)
+            data = file.read()
+        index = ShortcutIndex(data)
         ("shortcuts.vdf 로딩 성공.")
     except Exception as e:
         logger.exception("shortcuts.vdf 로딩 중 오류 발생", exc_info=e)
         return False
 
-    updated = False
     try:
-        for key, game in shortcuts.get("shortcuts", {}).items():
-            if game.get(
-                "appname"
-            ) == game_name or "PathOfExile_x64_KG.exe" in (
-                game.get("exe", "") + game.get("StartDir", "")
-            ):
-                (f"key: {key}, game: {game}")
-                (
-                    f"{game_name} 또는 PathOfExile_x64_KG.exe를 포함한 게임 찾음. Launch Options 및 Proton 설정 업데이트."
-                )
-                game["LaunchOptions"] = launch_options or ""
-                if use_proton:
-                    game["compat_tool"] = proton_version
-                updated = True
-                break
-
-        if not updated:
+        entry = index.find(game_name, "PathOfExile_x64_KG.exe")
+        if entry is not None:
+            logger.debug(f"key: {entry.key}")
+            (
+                f"{game_name} 또는 PathOfExile_x64_KG.exe를 포함한 게임 찾음. Launch Options 및 Proton 설정 업데이트."
+            )
+            changes = {"LaunchOptions": launch_options or ""}
+            if use_proton:
+                changes["compat_tool"] = proton_version
+            index.patch(entry, changes)
+        else:
             logger.warning(
                 f"{game_name} 또는 관련 exe를 포함한 게임을 찾을 수 없음."
             )
             logger.info(
                 f"{game_name}게임을 등록하기 위해 실행 파일 검색 시작."
             )
-            exe_path = find_file_path(
-                "PathOfExile_x64_KG.exe", search_path="/home/deck"
-            )
+            with _exe_search_lock:
+                exe_path = find_file_path_cached(
+                    "PathOfExile_x64_KG.exe", search_path=GAME_SEARCH_PATH
+                )
             if not exe_path:
                 logger.error("PathOfExile_x64_KG.exe 파일을 찾을 수 없습니다.")
                 return False
@@ -178,11 +393,17 @@ def update_shortcuts(
                 "FlatpakAppID": "",
                 "tags": {},
             }
-            shortcuts["shortcuts"][str(len(shortcuts["shortcuts"]))] = new_game
+            index.add(new_game)
             logger.info("임시 게임 추가 성공.")
 
-        with open(file_path, "wb") as file:
-            vdf.binary_dump(shortcuts, file)
+        # 변경된 필드만 교체하고, 임시 파일 + fsync + rename으로 교체
+        with span("steam.shortcuts_write", entries=len(index.records)):
+            write_file_atomic(
+                file_path,
+                index.apply(),
+                mode=os.stat(file_path).st_mode & 0o777,
+                backups=SHORTCUTS_BACKUPS,
+            )
         logger.info("shortcuts.vdf 업데이트 성공.")
         return True
     except Exception as e:
@@ -190,57 +411,112 @@ def update_shortcuts(
         return False
 
 
+def update_shortcuts_batch(
+    steam_user_ids: List[str],
+    game_name: str = "Path of Exile 2",
+    launch_options: str = None,
+    use_proton: bool = True,
+    proton_version: str = "proton_experimental",
+) -> Dict[str, bool]:
+    """
+    여러 Steam 유저의 shortcuts.vdf를 동시에 업데이트하고 유저별 결과 반환
+    """
+    results = {}
+    if not steam_user_ids:
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=min(SHORTCUTS_WORKERS, len(steam_user_ids))
+    ) as executor:
+        futures = {
+            steam_user_id: executor.submit(
+                update_shortcuts,
+                file_path=get_shortcuts_vdf_path(steam_user_id),
+                game_name=game_name,
+                launch_options=launch_options,
+                use_proton=use_proton,
+                proton_version=proton_version,
+            )
+            for steam_user_id in steam_user_ids
+        }
+        for steam_user_id, future in futures.items():
+            try:
+                results[steam_user_id] = future.result()
+            except Exception as e:
+                logger.exception(
+                    f"{steam_user_id} shortcuts 업데이트 중 오류 발생",
+                    exc_info=e,
+                )
+                results[steam_user_id] = False
+
+    succeeded = sum(results.values())
+    logger.info(
+        f"shortcuts 일괄 업데이트 완료: {succeeded}/{len(results)} 성공"
+    )
+    return results
+
+
 def is_process_running(process_name: str) -> bool:
     """
     특정 프로세스가 실행 중인지 확인
     """
-    for process in psutil.process_iter(attrs=["name"]):
-        if process.info["name"] == process_name:
-            return True
-    return False
+    return bool(find_processes(process_name))
+
+
+def is_steam_ready(
+    pid_file: str, old_pids: Set[int], child: subprocess.Popen
+) -> bool:
+    """
+    Steam 준비 여부 확인
+    (새로 실행된 Steam이 PID 파일에 자신의 PID를 기록하고 살아있으면 준비됨)
+    """
+    if child.poll() not in (None, 0):
+        raise RuntimeError(f"Steam 실행 실패 (종료 코드 {child.returncode})")
+    pid = read_pid_file(pid_file)
+    return pid is not None and pid not in old_pids and psutil.pid_exists(pid)
 
 
-def kill_steam_and_restart_background() -> bool:
+def kill_steam_and_restart_background(
+    process_name: str = STEAM_PROCESS_NAME,
+    command: Optional[List[str]] = None,
+    pid_file: str = STEAM_PID_FILE,
+    timeout: float = STEAM_TIMEOUT,
+) -> bool:
     """
     현재 실행 중인 Steam 프로세스를 종료 후 재시작
     """
+    command = command or STEAM_COMMAND
+    pid_file = os.path.expanduser(pid_file)
     try:
-        if is_command_available("killall"):
-            subprocess.run(["killall", "steam"], check=False)
-        elif is_command_available("taskkill"):
-            subprocess.run(["taskkill", "/F", "/IM", "steam.exe"], check=False)
-        else:
-            logger.error(
-                "이 운영 체제에서 Steam 프로세스를 종료할 수 없습니다."
-            )
-            raise OSError("지원되지 않는 운영 체제입니다.")
-    except subprocess.CalledProcessError as e:
-        logger.exception(
-            "Steam 프로세스를 종료하는 도중 오류 발생", exc_info=e
-        )
-    else:
-        try:
-            for _ in range(30):
-                if not is_process_running("steam"):
-                    ("Steam 프로세스가 정상적으로 종료되었습니다.")
-                    break
-                time.sleep(1)
-            else:
+        processes = find_processes(process_name)
+        old_pids = {process.pid for process in processes}
+        logger.debug(f"종료할 Steam PID: {sorted(old_pids)}")
+
+        start = time.monotonic()
+        with span("steam.shutdown", processes=len(processes)) as timer:
+            if processes and not terminate_processes(processes, timeout):
+                timer.set("failed")
                 logger.error("Steam 종료 확인에 실패했습니다.")
                 return False
+        logger.info(
+            f"Steam 프로세스 종료 확인 ({(time.monotonic() - start) * 1000:.0f}ms)"
+        )
 
-            ("Steam 프로세스를 백그라운드에서 재실행합니다...")
-            subprocess.run("steam &", shell=True, check=False)
-
-            for _ in range(30):
-                if is_process_running("steam"):
-                    ("Steam이 정상적으로 재시작되었습니다.")
-                    break
-                time.sleep(1)
-            else:
+        ("Steam 프로세스를 백그라운드에서 재실행합니다...")
+        start = time.monotonic()
+        with span("steam.restart") as timer:
+            child = launch_detached(command)
+            if not wait_until(
+                lambda: is_steam_ready(pid_file, old_pids, child), timeout
+            ):
+                timer.set("failed")
                 logger.error("Steam 재시작 확인에 실패했습니다.")
                 return False
-            return True
-        except Exception as e:
-            logger.exception("Steam 재시작 도중 오류 발생", exc_info=e)
-            return False
+        logger.info(
+            f"Steam 재시작 확인 (PID {child.pid}, "
+            f"{(time.monotonic() - start) * 1000:.0f}ms)"
+        )
+        return True
+    except Exception as e:
+        logger.exception("Steam 재시작 도중 오류 발생", exc_info=e)
+        return False
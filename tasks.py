@@ -1,139 +1,798 @@
+import importlib
 import json
 import logging
+import os
+import subprocess
 import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from auth import get_authorization_code
-from chrome import kill_chrome_processes, set_driver_with_recent_profile
-from steam import (
-    get_shortcuts_vdf_path,
-    update_shortcuts,
-    get_steam_user_personas,
-    kill_steam_and_restart_background,
-)
+from log import RUN_ID
+from timing import get_spans, record_span, span, write_timeline
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="tasks.log",
-    filemode="a",
-    encoding="utf-8",
-)
+if TYPE_CHECKING:
+    from chrome import DriverPrewarm
 
 logger = logging.getLogger(__name__)
 
+# POE2DECK_LAUNCH_MODE: options(시작 옵션에 token 기록), wrapper(실행 시 저장소에서 읽음)
+LAUNCH_MODE = os.environ.get("POE2DECK_LAUNCH_MODE", "options")
+# POE2DECK_PROFILE=1 또는 --profile: cProfile, tracemalloc 결과를 캐시에 저장
+# (꺼져 있으면 profiling 모듈을 import하지 않음)
+PROFILE_ENABLED = (
+    os.environ.get("POE2DECK_PROFILE") == "1" or "--profile" in sys.argv
+)
 
-def task_kill_chrome():
+_emit_lock = threading.Lock()
+
+
+def kill_chrome() -> bool:
     """
     Chrome 프로세스 종료
     """
+    from chrome import kill_chrome_processes
+
     logger.info("Chrome 프로세스 종료 시도 중...")
     kill_chrome_processes()
     ("Chrome 프로세스 종료 완료.")
-    print("TASK_1=1")
+    return True
 
 
-def task_authorization():
+def open_auth_browser(prewarm: Optional["DriverPrewarm"] = None):
+    """
+    인증용 WebDriver 반환 (예열된 드라이버가 있으면 사용)
+    """
+    from chrome import set_driver_with_recent_profile
+
+    if prewarm is not None:
+        driver = prewarm.take()
+        if driver is not None:
+            return driver
+    return set_driver_with_recent_profile()
+
+
+def record_prewarm_span(prewarm: "DriverPrewarm") -> None:
+    """
+    브라우저 예열 구간과 단축 시간을 stage.browser_prewarm 구간으로 기록
+    """
+    if prewarm.started_at is None:
+        return
+    record_span(
+        "stage.browser_prewarm",
+        prewarm.started_at,
+        prewarm.ready_at or time.perf_counter(),
+        "used" if prewarm.taken else "unused",
+        background=True,
+        saved=round(prewarm.saved, 3),
+    )
+
+
+def authorize(
+    force_refresh: bool = False,
+    context: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[str], Optional[str]]:
     """
     access_token, user_id 파싱 및 생성
+    (파이프라인에서 호출하면 브라우저를 미리 시작하고 예열 구간 기록)
     """
+    from chrome import BROWSER_PREWARM, DriverPrewarm
+    from credential import (
+        is_valid_credential,
+        load_credentials,
+        save_credentials,
+    )
+
     logger.info("인증 절차 시작...")
-    driver = set_driver_with_recent_profile()
+    start = time.perf_counter()
+
+    if force_refresh:
+        logger.info("--force-refresh: 자격 증명 캐시를 사용하지 않습니다.")
+    else:
+        credentials = load_credentials(validator=is_valid_credential)
+        if credentials is not None:
+            logger.info(
+                f"캐시된 자격 증명 사용 ({(time.perf_counter() - start) * 1000:.1f}ms)"
+            )
+            return credentials["token"], credentials["mid"]
 
-    access_token, user_id = get_authorization_code(driver)
+    # POE2DECK_AUTH_MODE: auto(쿠키 우선), browser(항상 브라우저), http(브라우저 미사용)
+    auth_mode = os.environ.get("POE2DECK_AUTH_MODE", "auto")
+    prewarm = None
+    if (
+        context is not None
+        and BROWSER_PREWARM
+        and auth_mode == "auto"
+        and os.environ.get("POE2DECK_INTERCEPT") != "1"
+    ):
+        # 쿠키 인증(token 요청) 결과를 기다리지 않고 브라우저를 미리 시작
+        # (필요 없으면 인증을 기다리게 하지 않고 백그라운드에서 종료)
+        prewarm = DriverPrewarm()
+    try:
+        access_token, user_id = _authorize_uncached(auth_mode, prewarm)
+    finally:
+        if prewarm is not None:
+            prewarm.discard()
+            record_prewarm_span(prewarm)
 
     if access_token is None or user_id is None:
         logger.error("인증 실패: access_token 또는 user_id가 없습니다.")
-        print("TASK_2=0")
-    else:
-        (f"인증 성공: access_token: {access_token}")
-        (f"획득한 user_id: {user_id}")
+        return None, None
 
-        print("TASK_2=1")
-        print(f"ACCESS_TOKEN={access_token}")
-        print(f"USER_ID={user_id}")
+    (f"인증 성공: access_token: {access_token}")
+    (f"획득한 user_id: {user_id}")
+    save_credentials(
+        access_token, user_id, auth_seconds=time.perf_counter() - start
+    )
+    return access_token, user_id
 
 
-def task_parse_steam_persona():
+def _authorize_uncached(
+    auth_mode: str, prewarm: Optional["DriverPrewarm"] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    쿠키로 token 요청 후 실패하면 브라우저로 인증
+    """
+    from auth import get_access_token_browserless
+    from chrome import get_recent_chrome_profile
+    from tokenapi import get_token_session, prewarm_token_api
+
+    # 쿠키 복호화, 브라우저 실행과 동시에 token API 연결(DNS/TLS) 준비
+    prewarm_token_api()
+    access_token, user_id, security_url = None, None, None
+    if auth_mode != "browser":
+        # 브라우저 예열은 Cookies DB를 다 읽은 뒤 시작 (immutable 모드로 읽는 중)
+        access_token, user_id, security_url = get_access_token_browserless(
+            get_recent_chrome_profile(),
+            on_cookies_read=prewarm.start if prewarm is not None else None,
+        )
+
+    if access_token is None or user_id is None:
+        # 브라우저가 필요한 경우에만 selenium 관련 모듈 로드
+        from auth import (
+            TOKEN_URL_SCOPE,
+            get_authorization_code,
+            get_authorization_code_intercepted,
+            process_user_security_auth,
+        )
+        from chrome import release_driver, set_driver_with_recent_profile
+
+        if auth_mode == "http":
+            logger.error("브라우저 없는 인증 실패 (POE2DECK_AUTH_MODE=http)")
+        elif os.environ.get("POE2DECK_INTERCEPT") == "1":
+            # 브라우저가 보낸 token API 응답을 selenium-wire로 캡처
+            # (창 전환 시 프록시 설정이 사라지므로 처음부터 창을 띄움)
+            driver = set_driver_with_recent_profile(
+                intercept_scopes=[TOKEN_URL_SCOPE], headless=False
+            )
+            try:
+                access_token, user_id = get_authorization_code_intercepted(
+                    driver, start_url=security_url
+                )
+            finally:
+                release_driver(driver)
+        else:
+            driver = open_auth_browser(prewarm)
+            try:
+                if security_url:
+                    access_token, user_id, driver = process_user_security_auth(
+                        driver, get_token_session(), security_url
+                    )
+                else:
+                    access_token, user_id, driver = get_authorization_code(
+                        driver
+                    )
+            finally:
+                # headless Chrome이 프로필을 계속 잡고 있지 않도록 종료
+                release_driver(driver)
+    return access_token, user_id
+
+
+def parse_steam_persona() -> Optional[Dict[str, str]]:
     """
     Steam 유저 데이터 파싱
     """
+    from steam import get_steam_user_personas
+
     logger.info("Steam 유저 데이터 가져오는 중...")
     user_personas = get_steam_user_personas()
 
-    if user_personas is None or {}:
-        logger.error("Steam 유저 데이터 가져오기.")
-        print("TASK_3=0")
-    else:
-        (f"Steam 유저 데이터 가져오기 성공: {user_personas}")
-        print("TASK_3=1")
-        print("USER_PERSONAS=" + json.dumps(user_personas, ensure_ascii=False))
+    if not user_personas:
+        logger.error("Steam 유저 데이터 가져오기 실패.")
+        return None
+    (f"Steam 유저 데이터 가져오기 성공: {user_personas}")
+    return user_personas
 
 
-def task_update_shortcuts():
+def get_launch_options(access_token: str, user_id: str) -> str:
     """
-    시작 옵션에 access_token, user_id 추가
+    LAUNCH_MODE에 맞는 Steam 시작 옵션 반환
     """
-    logger.info("Steam Shortcuts 업데이트 중...")
-    if len(sys.argv) < 5:
-        logger.error("Shortcuts 업데이트에 필요한 인자가 부족합니다.")
-        print("TASK_5=0")
-        sys.exit(1)
+    if LAUNCH_MODE == "wrapper":
+        from launch import get_wrapper_launch_options
 
-    access_token = sys.argv[2]
-    (f"Shortcuts 업데이트 시 사용할 Access Token: {access_token}")
+        return get_wrapper_launch_options()
+    return f"--kakao {access_token} {user_id}"
 
-    user_id = sys.argv[3]
-    (f"Shortcuts 업데이트 시 사용할 User Id: {user_id}")
 
-    user_persona = json.loads(sys.argv[4])
-    (
-        f"Shortcuts 업데이트 시 사용할 Steam user persona: {user_persona}"
+def is_shortcut_current(steam_user_id: str, launch_options: str) -> bool:
+    """
+    shortcuts.vdf에 이미 같은 시작 옵션이 적용되어 있는지 확인
+    """
+    from steam import get_launch_options as get_current_launch_options
+    from steam import get_shortcuts_vdf_path
+
+    return (
+        get_current_launch_options(get_shortcuts_vdf_path(steam_user_id))
+        == launch_options
     )
 
+
+def apply_shortcuts(
+    access_token: str, user_id: str, steam_user_id: str
+) -> bool:
+    """
+    시작 옵션에 access_token, user_id 추가
+    """
+    from steam import get_shortcuts_vdf_path, update_shortcuts
+
+    logger.info("Steam Shortcuts 업데이트 중...")
+    (f"Shortcuts 업데이트 시 사용할 Steam user: {steam_user_id}")
+
     result = update_shortcuts(
-        file_path=get_shortcuts_vdf_path(next(iter(user_persona))),
+        file_path=get_shortcuts_vdf_path(steam_user_id),
         game_name="Path of Exile 2",
-        launch_options=f"--kakao {access_token} {user_id}",
+        launch_options=get_launch_options(access_token, user_id),
     )
 
     if result:
         ("Shortcuts 업데이트 성공.")
-        print("TASK_4=1")
     else:
         logger.error("Shortcuts 업데이트 실패.")
-        print("TASK_4=0")
+    return result
 
 
-def task_kill_steam_and_restart():
+def apply_shortcuts_batch(
+    access_token: str, user_id: str, steam_user_ids: List[str]
+) -> Dict[str, bool]:
+    """
+    여러 Steam 유저의 시작 옵션에 access_token, user_id를 동시에 추가
+    """
+    from steam import update_shortcuts_batch
+
+    logger.info(
+        f"Steam Shortcuts 일괄 업데이트 중... ({len(steam_user_ids)}명)"
+    )
+
+    results = update_shortcuts_batch(
+        steam_user_ids,
+        game_name="Path of Exile 2",
+        launch_options=get_launch_options(access_token, user_id),
+    )
+
+    for steam_user_id, ok in results.items():
+        if not ok:
+            logger.error(f"{steam_user_id} Shortcuts 업데이트 실패.")
+    return results
+
+
+def restart_steam() -> bool:
     """
     shortcuts 업데이트 후 설정 적용을 위해 steam 종료 및 재시작
     """
+    from steam import kill_steam_and_restart_background
+
     logger.info("설정 적용을 위해 Steam을 종료 후 재시작합니다...")
 
     result = kill_steam_and_restart_background()
 
     if result:
         ("Steam 종료 후 재시작 성공.")
-        print("TASK_5=1")
     else:
         logger.error("Steam 종료 후 재시작 실패.")
+    return result
+
+
+def select_steam_user(
+    user_personas: Dict[str, str], steam_user_id: Optional[str] = None
+) -> Optional[str]:
+    """
+    설정을 적용할 Steam 유저 선택 (지정값 > 단일 유저 > zenity 선택창)
+    """
+    if steam_user_id:
+        return steam_user_id if steam_user_id in user_personas else None
+    if len(user_personas) == 1:
+        return next(iter(user_personas))
+
+    options = []
+    for persona_id, nickname in user_personas.items():
+        options.extend([persona_id, nickname])
+    result = subprocess.run(
+        [
+            "zenity",
+            "--list",
+            "--title=Steam User Selection",
+            "--text=설정을 적용할 유저 선택:",
+            "--column=Persona ID",
+            "--column=Nickname",
+            *options,
+            "--width=500",
+            "--height=300",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    selected = result.stdout.strip()
+    return selected or None
+
+
+def select_steam_users(
+    user_personas: Dict[str, str], steam_user_option: Optional[str] = None
+) -> List[str]:
+    """
+    설정을 적용할 Steam 유저 목록 선택
+    (all: 모든 유저, 콤마로 구분된 ID 목록, 그 외는 select_steam_user와 동일)
+    """
+    if steam_user_option == "all":
+        return list(user_personas)
+    if steam_user_option and "," in steam_user_option:
+        steam_user_ids = [
+            steam_user_id.strip()
+            for steam_user_id in steam_user_option.split(",")
+        ]
+        for steam_user_id in steam_user_ids:
+            if steam_user_id not in user_personas:
+                logger.warning(f"알 수 없는 Steam 유저 제외: {steam_user_id}")
+        return [
+            steam_user_id
+            for steam_user_id in steam_user_ids
+            if steam_user_id in user_personas
+        ]
+    steam_user_id = select_steam_user(user_personas, steam_user_option)
+    return [steam_user_id] if steam_user_id else []
+
+
+def get_option(name: str) -> Optional[str]:
+    """
+    sys.argv에서 --name=value 형식의 옵션 값 반환
+    """
+    prefix = f"--{name}="
+    for arg in sys.argv[2:]:
+        if arg.startswith(prefix):
+            return arg[len(prefix) :]
+    return None
+
+
+def task_kill_chrome():
+    """
+    Chrome 프로세스 종료
+    """
+    kill_chrome()
+    print("TASK_1=1")
+
+
+def task_authorization():
+    """
+    access_token, user_id 파싱 및 생성
+    """
+    access_token, user_id = authorize("--force-refresh" in sys.argv)
+
+    if access_token is None or user_id is None:
+        print("TASK_2=0")
+    else:
+        print("TASK_2=1")
+        print(f"ACCESS_TOKEN={access_token}")
+        print(f"USER_ID={user_id}")
+
+
+def task_parse_steam_persona():
+    """
+    Steam 유저 데이터 파싱
+    """
+    user_personas = parse_steam_persona()
+
+    if user_personas is None:
+        print("TASK_3=0")
+    else:
+        print("TASK_3=1")
+        print("USER_PERSONAS=" + json.dumps(user_personas, ensure_ascii=False))
+
+
+def task_update_shortcuts():
+    """
+    시작 옵션에 access_token, user_id 추가
+    """
+    if len(sys.argv) < 5:
+        logger.error("Shortcuts 업데이트에 필요한 인자가 부족합니다.")
+        print("TASK_4=0")
+        sys.exit(1)
+
+    access_token = sys.argv[2]
+    user_id = sys.argv[3]
+    user_persona = json.loads(sys.argv[4])
+
+    if "--all-users" not in sys.argv:
+        if apply_shortcuts(access_token, user_id, next(iter(user_persona))):
+            print("TASK_4=1")
+        else:
+            print("TASK_4=0")
+        return
+
+    results = apply_shortcuts_batch(access_token, user_id, list(user_persona))
+    for steam_user_id, ok in results.items():
+        print(f"SHORTCUTS_{steam_user_id}={int(ok)}")
+    print(f"TASK_4={int(any(results.values()))}")
+
+
+def task_kill_steam_and_restart():
+    """
+    shortcuts 업데이트 후 설정 적용을 위해 steam 종료 및 재시작
+    """
+    if restart_steam():
+        print("TASK_5=1")
+    else:
         print("TASK_5=0")
 
 
+def task_launch_options():
+    """
+    현재 LAUNCH_MODE의 Steam 시작 옵션 출력 (wrapper 모드 수동 설정용)
+    """
+    print(f"LAUNCH_OPTIONS={get_launch_options('<token>', '<mid>')}")
+
+
+def emit_event(**event) -> None:
+    """
+    파이프라인 진행 이벤트를 JSON-lines로 출력
+    """
+    line = json.dumps(event, ensure_ascii=False)
+    with _emit_lock:
+        print(line, flush=True)
+
+
+def stage_kill_chrome(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: Chrome 프로세스 종료
+    """
+    return kill_chrome()
+
+
+def stage_authorization(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: token, mid 획득 후 context에 저장
+    """
+    access_token, user_id = authorize(context["force_refresh"], context)
+    context["access_token"], context["user_id"] = access_token, user_id
+    return access_token is not None and user_id is not None
+
+
+def stage_steam_discovery(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: token과 무관한 Steam 유저 파싱, 실행 파일 위치 검색
+    """
+    from steam import prefetch_game_location
+
+    user_personas = parse_steam_persona()
+    if user_personas is None:
+        return False
+    context["user_personas"] = user_personas
+    prefetch_game_location(list(user_personas))
+    return True
+
+
+def stage_steam_persona(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: Steam 유저 파싱(미리 하지 않은 경우) 및 적용 대상 선택
+    """
+    if "user_personas" not in context and not stage_steam_discovery(context):
+        return False
+    user_personas = context["user_personas"]
+    context["steam_user_ids"] = select_steam_users(
+        user_personas, context["steam_user_id"]
+    )
+    if not context["steam_user_ids"]:
+        logger.error("설정을 적용할 Steam 유저가 선택되지 않았습니다.")
+        return False
+    return True
+
+
+def stage_update_shortcuts(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: 선택한 유저의 shortcuts 업데이트
+    여러 유저면 동시에 업데이트하고, 한 명이라도 성공하면 Steam 재시작 진행
+    """
+    steam_user_ids = context["steam_user_ids"]
+    if LAUNCH_MODE == "wrapper":
+        # 래퍼가 이미 등록된 유저는 저장소만 갱신되면 되므로 재시작 불필요
+        launch_options = get_launch_options(
+            context["access_token"], context["user_id"]
+        )
+        steam_user_ids = [
+            steam_user_id
+            for steam_user_id in steam_user_ids
+            if not is_shortcut_current(steam_user_id, launch_options)
+        ]
+        if not steam_user_ids:
+            logger.info("래퍼 시작 옵션이 이미 적용되어 있어 업데이트 생략.")
+            context["restart_required"] = False
+            return True
+
+    if len(steam_user_ids) == 1:
+        return apply_shortcuts(
+            context["access_token"], context["user_id"], steam_user_ids[0]
+        )
+
+    results = apply_shortcuts_batch(
+        context["access_token"], context["user_id"], steam_user_ids
+    )
+    for steam_user_id, ok in results.items():
+        emit_event(
+            event="user_result",
+            steam_user_id=steam_user_id,
+            persona=context["user_personas"].get(steam_user_id),
+            status="ok" if ok else "failed",
+        )
+    return any(results.values())
+
+
+def stage_restart_steam(context: Dict[str, Any]) -> bool:
+    """
+    파이프라인: Steam 재시작 (shortcuts 변경이 없으면 생략)
+    """
+    if not context.get("restart_required", True):
+        logger.info("shortcuts 변경이 없어 Steam 재시작 생략.")
+        return True
+    return restart_steam()
+
+
+# (stage, 시작 진행률, 설명, 실행 함수)
+PIPELINE_STAGES: List[
+    Tuple[str, int, str, Callable[[Dict[str, Any]], bool]]
+] = [
+    ("kill_chrome", 40, "Chrome 프로세스 종료 중...", stage_kill_chrome),
+    (
+        "authorization",
+        50,
+        "브라우저 인증 진행 중... 브라우저가 열리면 인증 후 잠시 기다려주세요.",
+        stage_authorization,
+    ),
+    (
+        "steam_persona",
+        65,
+        "Steam 유저 데이터 가져오는 중...",
+        stage_steam_persona,
+    ),
+    (
+        "update_shortcuts",
+        80,
+        "Steam Shortcuts 업데이트 중...",
+        stage_update_shortcuts,
+    ),
+    ("restart_steam", 90, "Steam 재시작 중...", stage_restart_steam),
+]
+
+
+# 단계 이름 -> 그 단계와 동시에 백그라운드에서 실행할 (단계, 실행 함수)
+# 인증을 기다리는 동안 token이 필요 없는 Steam 파일 탐색을 미리 진행
+BACKGROUND_STAGES: Dict[
+    str, List[Tuple[str, Callable[[Dict[str, Any]], bool]]]
+] = {
+    "authorization": [("steam_discovery", stage_steam_discovery)],
+}
+
+
+def run_stage(
+    stage: str,
+    percent: int,
+    message: str,
+    func: Callable[[Dict[str, Any]], bool],
+    context: Dict[str, Any],
+    background: bool = False,
+) -> bool:
+    """
+    단계 하나를 실행하고 진행 이벤트 출력, 실행 구간은 stage.<단계> 구간으로 기록
+    """
+    emit_event(
+        event="stage_start",
+        stage=stage,
+        percent=percent,
+        message=message,
+        background=background,
+    )
+    start = time.perf_counter()
+    with span(f"stage.{stage}", always=True, background=background) as timer:
+        try:
+            if PROFILE_ENABLED:
+                from profiling import profile_call
+
+                # 단계는 워커 스레드에서 실행되므로 프로파일도 단계별로 기록
+                ok = profile_call(f"pipeline.{stage}", func, context)
+            else:
+                ok = func(context)
+        except Exception as e:
+            logger.exception(f"{stage} 단계 실행 중 오류 발생", exc_info=e)
+            ok = False
+        timer.set("ok" if ok else "failed")
+    end = time.perf_counter()
+    emit_event(
+        event="stage_end",
+        stage=stage,
+        percent=percent,
+        status="ok" if ok else "failed",
+        duration=round(end - start, 3),
+        background=background,
+    )
+    return ok
+
+
+async def run_pipeline_async(
+    context: Dict[str, Any], concurrent: bool = True
+) -> Optional[str]:
+    """
+    PIPELINE_STAGES를 순서대로 실행하되 BACKGROUND_STAGES는 워커 스레드에서 동시에 실행
+    반환값: 실패한 단계 이름 (성공 시 None)
+    """
+    import asyncio
+
+    for stage, percent, message, func in PIPELINE_STAGES:
+        background = []
+        if concurrent:
+            for name, background_func in BACKGROUND_STAGES.get(stage, []):
+                background.append(
+                    (
+                        name,
+                        asyncio.create_task(
+                            asyncio.to_thread(
+                                run_stage,
+                                name,
+                                percent,
+                                message,
+                                background_func,
+                                context,
+                                True,
+                            )
+                        ),
+                    )
+                )
+
+        ok = await asyncio.to_thread(
+            run_stage, stage, percent, message, func, context
+        )
+        # 백그라운드 단계는 함께 시작한 단계가 끝나면 합류
+        for name, task in background:
+            if not await task and ok:
+                return name
+        if not ok:
+            return stage
+    return None
+
+
+def log_timeline(stages: List[Dict[str, Any]], duration: float) -> None:
+    """
+    단계별 실행 구간(get_spans("stage.") 결과)과 동시 실행으로 줄어든 시간 기록
+    """
+    for entry in stages:
+        attrs = entry.get("attrs", {})
+        marker = " (백그라운드)" if attrs.get("background") else ""
+        end = entry["start"] + entry["duration"]
+        logger.info(
+            f"{entry['stage'][len('stage.'):]:<18} "
+            f"{entry['start']:8.3f}s ~ {end:8.3f}s {entry['outcome']}{marker}"
+        )
+    # 브라우저 예열은 구간 대신 인증 단계에서 줄어든 시간만 합산
+    serial = sum(
+        entry.get("attrs", {}).get("saved", entry["duration"])
+        for entry in stages
+    )
+    logger.info(
+        f"단계 합계 {serial:.3f}s, 실제 {duration:.3f}s, "
+        f"동시 실행으로 단축 {max(serial - duration, 0):.3f}s"
+    )
+    for entry in stages:
+        if entry["stage"] == "stage.browser_prewarm":
+            logger.info(
+                f"브라우저 예열 {entry['outcome']}: "
+                f"인증 단계에서 {entry['attrs']['saved']:.3f}s 단축"
+            )
+
+
+def task_pipeline():
+    """
+    전체 태스크를 하나의 프로세스에서 실행하고 진행 이벤트 출력
+    (--sequential: 백그라운드 단계 없이 순서대로 실행)
+    """
+    # 단독 태스크의 시작 시간을 늘리지 않도록 파이프라인에서만 import
+    import asyncio
+
+    context: Dict[str, Any] = {
+        "force_refresh": "--force-refresh" in sys.argv,
+        "steam_user_id": get_option("steam-user"),
+    }
+
+    start = time.perf_counter()
+    failed_stage = asyncio.run(
+        run_pipeline_async(context, "--sequential" not in sys.argv)
+    )
+    duration = round(time.perf_counter() - start, 3)
+    stages = get_spans("stage.")
+    log_timeline(stages, duration)
+    emit_event(event="timeline", stages=stages)
+
+    if failed_stage is not None:
+        emit_event(
+            event="pipeline_end",
+            status="failed",
+            failed_stage=failed_stage,
+            duration=duration,
+        )
+        sys.exit(1)
+
+    emit_event(
+        event="pipeline_end",
+        status="ok",
+        percent=100,
+        message="작업이 완료되었습니다!",
+        duration=duration,
+    )
+
+
+# 태스크 이름 -> (실행 함수, 태스크가 필요로 하는 모듈)
+TASKS: Dict[str, Tuple[Callable[[], None], Tuple[str, ...]]] = {
+    "kill_chrome": (task_kill_chrome, ("chrome",)),
+    "authorization": (
+        task_authorization,
+        ("auth", "chrome", "credential", "tokenapi"),
+    ),
+    "steam_persona": (task_parse_steam_persona, ("steam",)),
+    "update_shortcuts": (task_update_shortcuts, ("steam",)),
+    "launch_options": (task_launch_options, ()),
+    "restart_steam": (task_kill_steam_and_restart, ("steam",)),
+    "pipeline": (
+        task_pipeline,
+        ("auth", "chrome", "credential", "steam", "tokenapi"),
+    ),
+}
+
+
+def import_task_modules(task_name: str) -> None:
+    """
+    태스크 실행에 필요한 모듈만 import
+    """
+    for module in TASKS[task_name][1]:
+        importlib.import_module(module)
+
+
 if __name__ == "__main__":
+    from log import setup_logging
+
+    setup_logging()
     task_name = sys.argv[1]
     logger.info(f"실행할 태스크: {task_name}")
 
-    if task_name == "kill_chrome":
-        task_kill_chrome()
-    elif task_name == "authorization":
-        task_authorization()
-    elif task_name == "steam_persona":
-        task_parse_steam_persona()
-    elif task_name == "update_shortcuts":
-        task_update_shortcuts()
-    elif task_name == "restart_steam":
-        task_kill_steam_and_restart()
-    else:
+    if task_name not in TASKS:
         logger.error(f"알 수 없는 태스크: {task_name}")
         sys.exit(1)
+
+    import_task_modules(task_name)
+    # POE2DECK_TIMING=1: 태스크 종류와 관계없이 종료 시 타임라인 저장
+    outcome = "ok"
+    try:
+        if PROFILE_ENABLED:
+            from profiling import run_profiled
+
+            run_profiled(
+                task_name,
+                TASKS[task_name][0],
+                threaded=task_name == "pipeline",
+            )
+        else:
+            TASKS[task_name][0]()
+    except SystemExit as e:
+        outcome = "failed" if e.code else "ok"
+        raise
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        write_timeline(RUN_ID, outcome)
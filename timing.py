@@ -0,0 +1,222 @@
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from util import get_cache_dir, save_json_file
+
+logger = logging.getLogger(__name__)
+
+# POE2DECK_TIMING=1 일 때만 측정 (꺼져 있으면 span()은 no-op 객체 반환)
+ENABLED = os.environ.get("POE2DECK_TIMING") == "1"
+# POE2DECK_TIMING_SUMMARY=1: 타임라인 저장 시 구간별 합계를 로그에 기록
+SUMMARY_ENABLED = os.environ.get("POE2DECK_TIMING_SUMMARY") == "1"
+TIMELINE_DIR = "timings"
+TIMELINE_MAX_FILES = 20
+
+_origin = time.perf_counter()
+_started_at = time.time()
+_spans: List[Dict[str, Any]] = []
+_spans_lock = threading.Lock()
+_local = threading.local()
+
+
+class Span:
+    """
+    측정 중인 구간 하나 (with 블록을 벗어날 때 기록)
+    """
+
+    __slots__ = ("name", "attrs", "outcome", "start", "parent")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self.outcome = "ok"
+        self.start = 0.0
+        self.parent: Optional[str] = None
+
+    def set(self, outcome: Optional[str] = None, **attrs) -> None:
+        """
+        결과(ok, failed 등)와 추가 정보 기록
+        """
+        if outcome is not None:
+            self.outcome = outcome
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        stack = _get_stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        _get_stack().pop()
+        if exc_type is not None:
+            self.outcome = "error"
+        _record(
+            self.name, self.start, end, self.outcome, self.attrs, self.parent
+        )
+
+
+class _NoopSpan:
+    """
+    측정이 꺼져 있을 때 사용하는 구간 (아무것도 기록하지 않음)
+    """
+
+    __slots__ = ()
+
+    def set(self, outcome: Optional[str] = None, **attrs) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _record(
+    name: str,
+    start: float,
+    end: float,
+    outcome: str,
+    attrs: Dict[str, Any],
+    parent: Optional[str] = None,
+) -> None:
+    entry = {
+        "stage": name,
+        "start": round(start - _origin, 4),
+        "duration": round(end - start, 4),
+        "outcome": outcome,
+        "thread": threading.current_thread().name,
+    }
+    if parent:
+        entry["parent"] = parent
+    if attrs:
+        entry["attrs"] = attrs
+    with _spans_lock:
+        _spans.append(entry)
+
+
+def _get_stack() -> List[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def span(name: str, always: bool = False, **attrs):
+    """
+    with span("steam.restart") as s: ... 형태로 구간 측정
+    always: 측정이 꺼져 있어도 기록 (파이프라인 단계 구간 등)
+    """
+    if not ENABLED and not always:
+        return _NOOP_SPAN
+    return Span(name, attrs)
+
+
+def record_span(
+    name: str, start: float, end: float, outcome: str = "ok", **attrs
+) -> None:
+    """
+    with 블록으로 감쌀 수 없는 구간을 perf_counter() 시각으로 직접 기록
+    """
+    _record(name, start, end, outcome, attrs)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """
+    함수 전체를 구간으로 측정하는 데코레이터 (꺼져 있으면 원래 함수 그대로 반환)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+        span_name = name or f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_spans(prefix: str = "") -> List[Dict[str, Any]]:
+    """
+    지금까지 기록된 구간 목록 (시작 시각순, prefix로 시작하는 이름만)
+    """
+    with _spans_lock:
+        # 같은 시각에 시작하면 바깥 구간(더 긴 구간)이 먼저
+        return sorted(
+            (entry for entry in _spans if entry["stage"].startswith(prefix)),
+            key=lambda entry: (entry["start"], -entry["duration"]),
+        )
+
+
+def format_summary(spans: List[Dict[str, Any]]) -> List[str]:
+    """
+    구간 이름별 횟수, 합계, 최대 시간 (합계 내림차순)
+    """
+    totals: Dict[str, List[float]] = {}
+    for entry in spans:
+        totals.setdefault(entry["stage"], []).append(entry["duration"])
+    lines = []
+    for name, durations in sorted(
+        totals.items(), key=lambda item: sum(item[1]), reverse=True
+    ):
+        lines.append(
+            f"{name:<32} {len(durations):3d}회 합계 {sum(durations) * 1000:9.1f}ms "
+            f"최대 {max(durations) * 1000:9.1f}ms"
+        )
+    return lines
+
+
+def write_timeline(run_id: str, outcome: str = "ok") -> Optional[str]:
+    """
+    실행 타임라인을 캐시 디렉토리에 JSON으로 저장하고 경로 반환
+    """
+    if not ENABLED:
+        return None
+
+    spans = get_spans()
+    timeline_dir = os.path.join(get_cache_dir(), TIMELINE_DIR)
+    os.makedirs(timeline_dir, mode=0o700, exist_ok=True)
+    path = os.path.join(timeline_dir, f"{run_id}.json")
+    try:
+        save_json_file(
+            path,
+            {
+                "run_id": run_id,
+                "started_at": _started_at,
+                "duration": round(time.perf_counter() - _origin, 4),
+                "outcome": outcome,
+                "spans": spans,
+            },
+        )
+    except OSError as e:
+        logger.warning(f"타임라인 저장 실패: {e}")
+        return None
+
+    # 오래된 타임라인 정리
+    files = sorted(
+        (entry for entry in os.scandir(timeline_dir) if entry.is_file()),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in files[:-TIMELINE_MAX_FILES]:
+        os.remove(entry.path)
+
+    logger.info(f"타임라인 저장: {path} (구간 {len(spans)}개)")
+    if SUMMARY_ENABLED:
+        for line in format_summary(spans):
+            logger.info(line)
+    return path
@@ -0,0 +1,157 @@
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from timing import span
+
+logger = logging.getLogger(__name__)
+
+TOKEN_API_BASE = "https://poe2-gamestart-web-api.game.daum.net"
+# (연결, 응답) 타임아웃 초
+TOKEN_API_TIMEOUT = (3.05, 10)
+TOKEN_API_POOL_SIZE = 4
+TOKEN_API_MAX_RETRIES = 3
+TOKEN_API_BACKOFF = 0.25
+TOKEN_API_BACKOFF_MAX = 2.0
+# 서버가 요청을 처리하지 않았다고 볼 수 있는 응답
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_token_session() -> requests.Session:
+    """
+    token API용 공유 세션 반환 (연결 풀을 재사용하므로 DNS/TLS는 한 번만)
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=TOKEN_API_POOL_SIZE,
+                max_retries=0,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def is_retryable(error: Optional[Exception], status_code: int = 0) -> bool:
+    """
+    다시 보내도 안전한 실패인지 확인
+    (연결 실패/리셋, 게이트웨이 오류처럼 요청이 처리되지 않았을 가능성이 높은 경우만)
+    """
+    if error is not None:
+        if isinstance(error, requests.ReadTimeout):
+            # 요청은 전달되었으나 응답이 늦은 경우 (txId가 이미 사용되었을 수 있음)
+            return False
+        return isinstance(error, requests.ConnectionError)
+    return status_code in RETRY_STATUS_CODES
+
+
+def get_backoff(attempt: int) -> float:
+    """
+    지수 백오프 + full jitter
+    """
+    return random.uniform(
+        0, min(TOKEN_API_BACKOFF_MAX, TOKEN_API_BACKOFF * 2**attempt)
+    )
+
+
+def fit_timeout(timeout, deadline: Optional[float]):
+    """
+    (연결, 응답) 타임아웃을 deadline(time.monotonic() 기준)까지 남은 시간으로 제한
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.Timeout("token API 요청 제한 시간 초과")
+    if isinstance(timeout, tuple):
+        return tuple(min(value, remaining) for value in timeout)
+    return min(timeout, remaining)
+
+
+def post_json(
+    session: requests.Session,
+    url: str,
+    body: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout=TOKEN_API_TIMEOUT,
+    max_retries: int = TOKEN_API_MAX_RETRIES,
+    deadline: Optional[float] = None,
+) -> requests.Response:
+    """
+    타임아웃과 제한된 재시도를 적용한 POST (마지막 실패는 예외로 전달)
+    deadline: time.monotonic() 기준 제한 시각 (타임아웃과 재시도 대기를 남은 시간에 맞춤)
+    """
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        response = None
+        try:
+            response = session.post(
+                url,
+                headers=headers,
+                json=body,
+                timeout=fit_timeout(timeout, deadline),
+            )
+        except requests.RequestException as e:
+            error = e
+
+        status_code = response.status_code if response is not None else 0
+        delay = get_backoff(attempt)
+        if (
+            attempt >= max_retries
+            or not is_retryable(error, status_code)
+            # 재시도 대기 후 제한 시간이 남지 않으면 재시도하지 않음
+            or (deadline is not None and time.monotonic() + delay >= deadline)
+        ):
+            if error is not None:
+                raise error
+            return response
+
+        attempt += 1
+        logger.warning(
+            f"token API 요청 재시도 {attempt}/{max_retries} "
+            f"({error or status_code}, {delay * 1000:.0f}ms 후)"
+        )
+        time.sleep(delay)
+
+
+def _prewarm(url: str) -> None:
+    start = time.perf_counter()
+    with span("tokenapi.prewarm") as timer:
+        try:
+            get_token_session().head(
+                url, timeout=TOKEN_API_TIMEOUT, allow_redirects=False
+            )
+        except requests.RequestException as e:
+            timer.set("failed")
+            logger.info(f"token API 연결 예열 실패: {e}")
+            return
+    logger.info(
+        f"token API 연결 예열 완료 ({urlsplit(url).hostname}, "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
+
+
+def prewarm_token_api(url: str = TOKEN_API_BASE) -> threading.Thread:
+    """
+    백그라운드에서 DNS 조회와 TLS 연결을 미리 수행하여 연결 풀에 보관
+    (브라우저가 인증 페이지를 불러오는 동안 호출)
+    """
+    thread = threading.Thread(
+        target=_prewarm, args=(url,), name="tokenapi-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
@@ -1,13 +1,9 @@
+import json
 import logging
+import os
 import shutil
+from typing import Any, Optional
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="tasks.log",
-    filemode="a",
-    encoding="utf-8",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -22,3 +18,78 @@ def is_command_available(command):
     else:
         (f"명령어 '{command}'은(는) 사용 불가능합니다.")
     return result
+
+
+def get_cache_dir() -> str:
+    """
+    POE2Deck 캐시 디렉토리 경로를 반환 (없으면 생성)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    cache_dir = os.path.join(base, "poe2deck")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
+
+
+def load_json_file(path: str) -> Optional[Any]:
+    """
+    JSON 파일을 읽어 반환 (없거나 손상된 경우 None)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"JSON 파일을 읽지 못했습니다 {path}: {e}")
+        return None
+
+
+def write_file_atomic(
+    path: str, data: bytes, mode: int = 0o644, backups: int = 0
+) -> None:
+    """
+    임시 파일에 쓰고 fsync 후 rename으로 교체 (중간에 종료되어도 원본 유지)
+    backups > 0 이면 이전 파일을 path.bak, path.bak.1 ... 로 보관
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    if backups > 0 and os.path.exists(path):
+        names = [f"{path}.bak"] + [
+            f"{path}.bak.{i}" for i in range(1, backups)
+        ]
+        for older, newer in zip(reversed(names[1:]), reversed(names[:-1])):
+            if os.path.exists(newer):
+                os.replace(newer, older)
+        if os.path.exists(names[0]):
+            os.unlink(names[0])
+        try:
+            os.link(path, names[0])
+        except OSError:
+            shutil.copy2(path, names[0])
+
+    os.replace(tmp_path, path)
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def save_json_file(path: str, data: Any, mode: int = 0o600) -> None:
+    """
+    JSON 파일을 임시 파일에 쓴 뒤 교체하여 저장
+    """
+    write_file_atomic(
+        path, json.dumps(data, ensure_ascii=False).encode("utf-8"), mode
+    )
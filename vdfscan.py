@@ -0,0 +1,104 @@
+import logging
+import re
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# 따옴표 문자열 | 중괄호 | 주석 | 조건문([$WIN32]) | 따옴표 없는 문자열
+TOKEN_RE = re.compile(
+    r'\s*(?:"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*|\[[^\]\n]*\]|([^\s{}"]+))',
+    re.DOTALL,
+)
+# 건너뛸 블록에서 다음 중괄호 직전까지 한 번에 소비
+SKIP_RE = re.compile(r'(?:[^{}"/]+|"(?:[^"\\]|\\.)*"|//[^\n]*|/(?!/))*')
+ESCAPE_RE = re.compile(r"\\(.)")
+ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"'}
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return ESCAPE_RE.sub(lambda m: ESCAPES.get(m.group(1), m.group(0)), value)
+
+
+def find_text_vdf_value(
+    path: str, key_path: Sequence[str], chunk_size: int = CHUNK_SIZE
+) -> Optional[str]:
+    """
+    텍스트 VDF를 조각 단위로 읽으며 key_path의 값을 찾으면 즉시 반환
+    (전체를 dict로 파싱하지 않고, 대상 경로 밖의 블록은 중괄호만 세며 건너뜀)
+    """
+    *parents, target = key_path
+    stack: List[str] = []
+    key: Optional[str] = None
+    # 대상 경로를 벗어난 블록의 깊이 (0이면 대상 경로 위)
+    skip_depth = 0
+
+    buffer = ""
+    pos = 0
+    eof = False
+    with open(path, "r", encoding="utf-8", errors="replace") as file:
+        while True:
+            # 토큰이 조각 경계에 걸치지 않도록 마지막 줄바꿈까지만 해석
+            limit = len(buffer) if eof else buffer.rfind("\n", pos) + 1
+            while pos < limit:
+                if skip_depth:
+                    pos = SKIP_RE.match(buffer, pos, limit).end()
+                    if pos >= limit:
+                        break
+                    char = buffer[pos]
+                    if char == "{":
+                        skip_depth += 1
+                    elif char == "}":
+                        skip_depth -= 1
+                    else:
+                        # 여러 줄에 걸친 문자열은 다음 조각과 합쳐서 해석
+                        break
+                    pos += 1
+                    continue
+
+                match = TOKEN_RE.match(buffer, pos, limit)
+                if match is None:
+                    break
+                pos = match.end()
+                quoted, brace, bare = match.groups()
+
+                if brace == "}":
+                    if key is not None or not stack:
+                        return None
+                    stack.pop()
+                elif brace == "{":
+                    if key is None:
+                        raise SyntaxError(f"VDF 해석 실패: {path}")
+                    depth = len(stack)
+                    if depth < len(parents) and key == parents[depth]:
+                        stack.append(key)
+                    else:
+                        skip_depth = 1
+                    key = None
+                else:
+                    token = quoted if quoted is not None else bare
+                    if token is None:
+                        # 주석, 조건문
+                        continue
+                    token = _unescape(token) if quoted is not None else token
+                    if key is None:
+                        key = token
+                    else:
+                        if len(stack) == len(parents) and key == target:
+                            return token
+                        key = None
+
+            if eof:
+                if buffer[pos:].strip():
+                    raise SyntaxError(
+                        f"VDF 해석 실패: {buffer[pos : pos + 50]!r}"
+                    )
+                return None
+            buffer = buffer[pos:]
+            pos = 0
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer += chunk